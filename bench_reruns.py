@@ -0,0 +1,184 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+# --- 画面操作ごとの再実行時間のベンチマーク ---
+# Streamlit のテストハーネス (AppTest) で各ページを画面なしで操作し、操作 (= 1回の再実行) ごとに
+# 経過時間・ピークメモリ・DataFrame の生成数を記録する。結果は JSON ファイルに実行ごとに追記し、
+# 前回の同じデータ規模の結果と比べて表示する。
+#   python bench_reruns.py --bounties 10000 --sessions 100000
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CHIP_APP = os.path.join(HERE, 'chip.py')
+ROI_APP = os.path.join(HERE, 'tor_roi.py')
+DEFAULT_OUTPUT = os.path.join(HERE, 'bench_results.json')
+APP_TIMEOUT = 600
+
+class _DataFrameCounter:
+    # pd.DataFrame の生成を数える (計測中だけ __init__ を差し替える)
+    def __init__(self): self.count = 0
+
+    @contextmanager
+    def counting(self):
+        original = pd.DataFrame.__init__
+        def counted(frame, *args, **kwargs):
+            self.count += 1
+            original(frame, *args, **kwargs)
+        pd.DataFrame.__init__ = counted
+        try: yield self
+        finally: pd.DataFrame.__init__ = original
+
+def _select_page(at, title): return at.sidebar.radio[0].set_value(title).run()
+
+def _button(at, label): return next(button for button in at.button if button.label == label)
+
+def _chip_app():
+    # ページをまたいで共有するトーナメント時計は実行ごとに別のIDにする
+    at = AppTest.from_file(CHIP_APP, default_timeout=APP_TIMEOUT)
+    at.query_params['tournament'] = f'bench-{time.perf_counter_ns()}'
+    return at
+
+def _bounty_entries(count):
+    # count 本のミステリーバウンティ (高額ほど本数が少ない10種類)
+    amounts = [100, 200, 300, 500, 1000, 2000, 5000, 10000, 50000, 100000]
+    weights = np.array([2.0 ** -i for i in range(len(amounts))])
+    counts = np.maximum(1, np.floor(count * weights / weights.sum()).astype(int))
+    counts[0] += count - counts.sum()
+    return [{'amount': amount, 'count': int(n)} for amount, n in zip(amounts, counts)]
+
+def write_sessions_csv(path, count, seed=0):
+    # tor_roi.py と同じ列の記録を count 件作る
+    rng = np.random.default_rng(seed)
+    days = pd.Timestamp('2020-01-01') + pd.to_timedelta(np.sort(rng.integers(0, 2000, count)), unit='D')
+    buy_in = rng.choice([1000, 3000, 5000, 10000, 30000], count)
+    payout = np.where(rng.random(count) < 0.2, buy_in * rng.integers(1, 20, count), 0)
+    net = payout - buy_in
+    pd.DataFrame({'日付': days.strftime('%Y-%m-%d'), 'バイイン': buy_in, '賞金': payout, '純利益': net, 'ROI': net / buy_in * 100}).to_csv(path, index=False)
+
+# --- シナリオ: (ページ, 操作名, 操作) の列。操作は AppTest を受け取り、再実行まで行う ---
+
+def chip_scenario(bounties):
+    at = _chip_app()
+    def ring_chips(at): at.number_input[0].set_value(2); at.number_input[1].set_value(5); at.run()
+    def confirm_structure(at):
+        _select_page(at, 'トーナメント ブラインドストラクチャー')
+        at.selectbox(key='tournament_format_select').set_value('ミステリーバウンティ').run()
+    def confirm_bounties(at):
+        _select_page(at, 'ミステリーバウンティ')
+        at.session_state.bounty_entries = _bounty_entries(bounties)
+        at.button(key='confirm_bounty_btn').click().run()
+    def pickem_game(at):
+        _select_page(at, 'ピッケム')
+        at.selectbox(key='pickem_game_mode_select').set_value('Holdem - Normal').run()
+    def pickem_equity(at):
+        at.text_input(key='equity_hand_0').set_value('AsKs'); at.text_input(key='equity_hand_1').set_value('QdQh'); at.text_input(key='equity_board_0').set_value('2s7h9s')
+        _button(at, 'エクイティを計算').click().run()
+    def mix_settings(at):
+        _select_page(at, 'MIX設定')
+        at.button[0].click().run(); at.button[0].click().run()
+        _button(at, '設定を確定').click().run()
+    return at, [
+        ('起動', '初回表示', lambda at: at.run()),
+        ('リングゲーム チップ構成', 'ブラインド変更', ring_chips),
+        ('トーナメント ブラインドストラクチャー', 'ページ表示・形式選択', confirm_structure),
+        ('トーナメント ブラインドストラクチャー', 'ストラクチャー確定', lambda at: at.button(key='generate_structure_btn').click().run()),
+        ('ミステリーバウンティ', f'バウンティ確定 ({bounties}本)', confirm_bounties),
+        ('ミステリーバウンティ', 'バウンティを引く', lambda at: _button(at, 'バウンティを引く').click().run()),
+        ('トーナメントタイマー', 'ページ表示', lambda at: _select_page(at, 'トーナメントタイマー')),
+        ('トーナメントタイマー', 'タイマー開始', lambda at: _button(at, '▶️ タイマー開始').click().run()),
+        ('トーナメントタイマー', '1分進む', lambda at: _button(at, '▶️ 1分進む').click().run()),
+        ('トーナメントタイマー', '1レベル進む', lambda at: _button(at, '▶️ 1レベル進む').click().run()),
+        ('ピッケム', 'ゲーム選択', pickem_game),
+        ('ピッケム', 'エクイティ計算', pickem_equity),
+        ('MIX設定', 'ゲーム追加・確定', mix_settings),
+        ('MIXカウンター', 'ページ表示', lambda at: _select_page(at, 'MIXカウンター')),
+        ('MIXカウンター', '次のゲーム', lambda at: at.button(key='next_game_button').click().run()),
+    ]
+
+def roi_scenario(sessions, workdir):
+    # tor_roi.py は作業ディレクトリのデータを読むので、一時ディレクトリに count 件の記録を用意する
+    write_sessions_csv(os.path.join(workdir, 'poker_sessions.csv'), sessions)
+    at = AppTest.from_file(ROI_APP, default_timeout=APP_TIMEOUT)
+    def submit(at):
+        at.date_input[0].set_value(datetime.date(2024, 1, 1)); at.number_input[0].set_value(5000); at.number_input[1].set_value(12000)
+        at.form_submit_button[0].click().run()
+    return at, [
+        ('ROIトラッカー', f'初回表示 ({sessions}件)', lambda at: at.run()),
+        ('ROIトラッカー', 'セッション追加 (フォーム送信)', submit),
+        ('ROIトラッカー', '履歴の確定', lambda at: _button(at, '変更を確定').click().run()),
+    ]
+
+def _run_pass(scenario, track_memory, counter):
+    at, steps = scenario()
+    results = []
+    for page, interaction, action in steps:
+        if track_memory: tracemalloc.reset_peak()
+        before, start = counter.count, time.perf_counter()
+        action(at)
+        elapsed = time.perf_counter() - start
+        if at.exception: raise RuntimeError(f"{page} / {interaction}: {at.exception[0].value}")
+        results.append({'ページ': page, '操作': interaction, '時間 (ms)': elapsed * 1000, 'DataFrame生成数': counter.count - before, 'ピークメモリ (KiB)': tracemalloc.get_traced_memory()[1] / 1024 if track_memory else None})
+    return results
+
+def run_scenario(scenario, repeat):
+    # 時間は repeat 回の中央値 (tracemalloc なし)、メモリと DataFrame 数は tracemalloc ありの1回で測る
+    counter = _DataFrameCounter()
+    with counter.counting():
+        timings = [_run_pass(scenario, False, counter) for _ in range(repeat)]
+        tracemalloc.start()
+        try: memory = _run_pass(scenario, True, counter)
+        finally: tracemalloc.stop()
+    for i, row in enumerate(memory):
+        samples = [timing[i]['時間 (ms)'] for timing in timings]
+        row['時間 (ms)'] = statistics.median(samples)
+        row['最小 (ms)'] = min(samples)
+    return memory
+
+def run_benchmarks(bounties, sessions, repeat):
+    st.cache_data.clear(); st.cache_resource.clear()
+    results = run_scenario(lambda: chip_scenario(bounties), repeat)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try: results += run_scenario(lambda: roi_scenario(sessions, workdir), repeat)
+        finally: os.chdir(cwd)
+    return {'日時': datetime.datetime.now().isoformat(timespec='seconds'), 'python': platform.python_version(), 'streamlit': st.__version__, 'pandas': pd.__version__,
+            'データ規模': {'bounties': bounties, 'sessions': sessions}, '繰り返し': repeat, '結果': results}
+
+def previous_run(history, sizes):
+    return next((run for run in reversed(history) if run['データ規模'] == sizes), None)
+
+def main():
+    parser = argparse.ArgumentParser(description='chip.py / tor_roi.py の操作ごとの再実行時間を計測します。')
+    parser.add_argument('--bounties', type=int, default=1000, help='ミステリーバウンティの本数')
+    parser.add_argument('--sessions', type=int, default=10000, help='ROIトラッカーの記録件数')
+    parser.add_argument('--repeat', type=int, default=3, help='時間を測る回数 (中央値を記録)')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='結果を追記する JSON ファイル')
+    args = parser.parse_args()
+    history = []
+    if os.path.exists(args.output):
+        with open(args.output, encoding='utf-8') as f: history = json.load(f)
+    run = run_benchmarks(args.bounties, args.sessions, args.repeat)
+    df = pd.DataFrame(run['結果'])
+    previous = previous_run(history, run['データ規模'])
+    if previous is not None:
+        before = {(row['ページ'], row['操作']): row['時間 (ms)'] for row in previous['結果']}
+        df['前回比'] = [row['時間 (ms)'] / before[key] if (key := (row['ページ'], row['操作'])) in before else float('nan') for row in run['結果']]
+    with pd.option_context('display.width', 200, 'display.max_columns', None): print(df.round(2).to_string(index=False))
+    history.append(run)
+    with open(args.output, 'w', encoding='utf-8') as f: json.dump(history, f, ensure_ascii=False, indent=1)
+    print(f"結果を {args.output} に保存しました ({len(history)}回分)。")
+
+if __name__ == '__main__':
+    main()
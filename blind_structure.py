@@ -0,0 +1,74 @@
+import math
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+# --- トーナメント用ブラインドストラクチャーの生成 ---
+# 初期スタック・エントリー人数・目標所要時間から、等比数列のブラインド候補を作って
+# 使用チップで支払える額に丸め、各レベルの平均スタック (BB数) で評価して最良のものを選ぶ。
+
+LEVEL_TIMES = {'ロング': 20, 'ノーマル': 15, 'ターボ': 10, 'ハイパーターボ': 6}
+LEVEL_MINUTE_OPTIONS = (5, 6, 8, 10, 12, 15, 20, 25, 30, 40)
+TOURNAMENT_DENOMINATIONS = (1, 5, 25, 100, 500, 1000, 5000, 25000, 100000)
+NICE_MANTISSAS = (1, 1.2, 1.5, 2, 2.5, 3, 4, 5, 6, 8)
+START_DEPTHS = (50, 75, 100, 150, 200, 300, 500)  # 初期スタックのBB数の候補
+RATIOS = tuple(np.round(np.arange(1.15, 1.61, 0.05), 2))  # ブラインドの上昇率の候補
+DEFAULT_LEVEL_COUNT = 20  # 目標時間の指定がない場合のレベル数の目安
+END_TOTAL_BB = 40  # 場の総チップが何BBになったら終了とみなすか (ヘッズアップで平均20BB)
+SHALLOW_DEPTH_BB = 10  # これを下回る平均スタックは浅すぎる
+MAX_LEVELS = 40
+
+def _round_blind(bb):
+    # 切りのよい額に丸め、SB (BBの半分) が場に残っている最小チップで払えるようにする
+    exponent = 10 ** math.floor(math.log10(bb))
+    nice = min((m * exponent * scale for m in NICE_MANTISSAS for scale in (1, 10)), key=lambda v: abs(math.log(v / bb)))
+    unit = min((d for d in TOURNAMENT_DENOMINATIONS if d >= nice / 100), default=TOURNAMENT_DENOMINATIONS[-1])
+    sb = max(unit, round(nice / 2 / unit) * unit)
+    return int(sb), int(sb * 2)
+
+def _ladder(initial_stack, entries, start_depth, ratio):
+    end_bb = entries * initial_stack / END_TOTAL_BB
+    blinds, bb = [], initial_stack / start_depth
+    while len(blinds) < MAX_LEVELS:
+        blind = _round_blind(bb)
+        if not blinds or blind[1] > blinds[-1][1]: blinds.append(blind)
+        if blind[1] >= end_bb: break
+        bb *= ratio
+    return blinds
+
+def _score(blinds, initial_stack, entries, level_minutes, start_depth, target_minutes, preferred_minutes):
+    bbs = np.array([b for _, b in blinds], dtype=float)
+    levels = len(bbs)
+    duration_error = abs(levels * level_minutes - target_minutes) / target_minutes
+    roughness = np.std(np.diff(np.log(bbs))) if levels > 2 else 0.0
+    # 残り人数は終了時に2人になるよう時間に対して等比的に減ると仮定し、各レベルの平均スタックを求める
+    progress = np.arange(levels) / max(levels - 1, 1)
+    remaining = entries * (2 / entries) ** progress if entries > 2 else np.full(levels, float(entries))
+    average_depth = entries * initial_stack / (remaining * bbs)
+    shallow = np.mean(average_depth[:-2] < SHALLOW_DEPTH_BB) if levels > 2 else 0.0
+    return 4 * duration_error + 2 * roughness + 3 * shallow + 0.5 * abs(math.log(level_minutes / preferred_minutes)) + 0.3 * abs(math.log(start_depth / 100))
+
+@lru_cache(maxsize=128)
+def _best_structure(initial_stack, tournament_type, entries, target_minutes):
+    # 同じ条件での再生成 (確定ボタンの再押下や再実行) はキャッシュから返す。返り値は ((SB, BB) のタプル, レベル時間) か None
+    preferred_minutes = LEVEL_TIMES[tournament_type]
+    minute_options = (preferred_minutes,) if target_minutes is None else LEVEL_MINUTE_OPTIONS
+    target = target_minutes or preferred_minutes * DEFAULT_LEVEL_COUNT
+    best = None
+    for start_depth in START_DEPTHS:
+        if initial_stack / start_depth < 2: continue
+        for ratio in RATIOS:
+            blinds = _ladder(initial_stack, entries, start_depth, ratio)
+            for level_minutes in minute_options:
+                score = _score(blinds, initial_stack, entries, level_minutes, start_depth, target, preferred_minutes)
+                if best is None or score < best[0]: best = (score, blinds, level_minutes)
+    return None if best is None else (tuple(best[1]), best[2])
+
+def generate_tournament_structure(initial_stack, tournament_type, entries=10, target_minutes=None):
+    # キャッシュするのは探索の結果だけで、DataFrame は呼び出しごとに作る (時計や画面で共有しても互いに影響しない)
+    best = _best_structure(initial_stack, tournament_type, max(2, int(entries)), target_minutes)
+    if best is None: return pd.DataFrame()
+    blinds, level_minutes = best
+    structure = [{"レベル": level, "SB": sb_val, "BB": bb_val, "BBアンティ": bb_val if level >= 2 else 0, "レベル時間 (分)": level_minutes}
+                 for level, (sb_val, bb_val) in enumerate(blinds, start=1)]
+    return pd.DataFrame(structure)
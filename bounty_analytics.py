@@ -0,0 +1,51 @@
+import math
+import numpy as np
+
+# --- ミステリーバウンティの期待値と確率 ---
+# 残りの (金額, 本数) から計算する。確率と平均・分散は超幾何分布から厳密に、
+# 今後 k 回分の合計額の分位点は多変量超幾何分布の一括サンプリングで求める。
+
+def _log_comb(n, k):
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+def next_draw_expected_value(sampler):
+    return sampler.remaining_value / sampler.remaining if sampler.remaining else 0.0
+
+def _prob_at_least_one(total, hits, draws):
+    # total 本から draws 本引いて、hits 本のうち少なくとも1本を引く確率
+    if hits <= 0 or draws <= 0: return 0.0
+    if total - hits < draws: return 1.0
+    return 1.0 - math.exp(_log_comb(total - hits, draws) - _log_comb(total, draws))
+
+def hit_probabilities(sampler, draws):
+    # 金額ごとに、次の draws 回で「その金額」「その金額以上」を少なくとも1回引く確率
+    draws = min(draws, sampler.remaining)
+    rows, at_least = [], 0
+    for amount, count in sampler.breakdown():
+        at_least += count
+        rows.append({'金額 (ドル)': amount, '残り本数': count,
+                     'この金額を引く確率': _prob_at_least_one(sampler.remaining, count, draws),
+                     'この金額以上を引く確率': _prob_at_least_one(sampler.remaining, at_least, draws)})
+    return rows
+
+def payout_moments(sampler, draws):
+    # 次の draws 回の合計額の平均と標準偏差 (非復元抽出の有限母集団修正込み)
+    n, draws = sampler.remaining, min(draws, sampler.remaining)
+    if n == 0 or draws == 0: return 0.0, 0.0
+    amounts, counts = np.array(sampler.amounts, dtype=float), np.array(sampler.counts, dtype=float)
+    mean = sampler.remaining_value / n
+    variance = float((counts * (amounts - mean) ** 2).sum() / n)
+    correction = (n - draws) / (n - 1) if n > 1 else 0.0
+    return draws * mean, math.sqrt(max(0.0, draws * variance * correction))
+
+def payout_quantiles(sampler, draws, quantiles=(0.1, 0.5, 0.9), simulations=10000, seed=None):
+    # seed を省略すると抽選シードと引いた本数から決める (同じ状態なら再実行しても同じ値を表示する)
+    if seed is None: seed = (sampler.seed, len(sampler.history))
+    draws = min(draws, sampler.remaining)
+    if draws == 0: return {q: 0.0 for q in quantiles}
+    if draws == sampler.remaining: return {q: float(sampler.remaining_value) for q in quantiles}
+    counts = np.array(sampler.counts, dtype=np.int64)
+    nonzero = counts > 0
+    samples = np.random.default_rng(seed).multivariate_hypergeometric(counts[nonzero], draws, size=simulations, method='count')
+    totals = samples @ np.array(sampler.amounts, dtype=np.int64)[nonzero]
+    return dict(zip(quantiles, np.quantile(totals, quantiles).tolist()))
@@ -0,0 +1,69 @@
+import random
+import secrets
+
+# --- ミステリーバウンティの抽選 ---
+# 封筒を1枚ずつリストに展開せず、(金額, 残り本数) の組とフェニック木で管理する。
+# 重み付きの非復元抽出は1回 O(log k)、残り本数・残り総額の参照は O(1) (k は金額の種類数)。
+# シードを記録しておけば、同じシードと設定から抽選結果を再現できる。
+
+class BountySampler:
+    def __init__(self, entries, seed=None):
+        # entries: [{'amount': 金額, 'count': 本数}, ...] (同じ金額の行はまとめる)
+        totals = {}
+        for entry in entries: totals[int(entry['amount'])] = totals.get(int(entry['amount']), 0) + int(entry['count'])
+        self.amounts = sorted((amount for amount, count in totals.items() if count > 0), reverse=True)
+        self.counts = [totals[amount] for amount in self.amounts]
+        self.initial_counts = list(self.counts)
+        self._index = {amount: i for i, amount in enumerate(self.amounts)}
+        self._tree = [0] * (len(self.counts) + 1)
+        for i, count in enumerate(self.counts): self._add(i, count)
+        self.total = self.remaining = sum(self.counts)
+        self.remaining_value = sum(amount * count for amount, count in zip(self.amounts, self.counts))
+        self.seed = secrets.randbits(64) if seed is None else int(seed)
+        self._rng = random.Random(self.seed)
+        self.history = []
+
+    def _add(self, i, delta):
+        i += 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _find(self, target):
+        # 累積本数が target を超える最初の位置 (0始まり)
+        pos, step = 0, 1 << len(self._tree).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(self._tree) and self._tree[nxt] <= target:
+                pos = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return pos
+
+    def __len__(self): return self.remaining
+
+    def draw(self):
+        if self.remaining == 0: return None
+        i = self._find(self._rng.randrange(self.remaining))
+        amount = self.amounts[i]
+        self.counts[i] -= 1
+        self._add(i, -1)
+        self.remaining -= 1
+        self.remaining_value -= amount
+        self.history.append(amount)
+        return amount
+
+    def remaining_count(self, amount):
+        i = self._index.get(amount)
+        return 0 if i is None else self.counts[i]
+
+    def breakdown(self):
+        # 金額の高い順の (金額, 残り本数)
+        return [(amount, count) for amount, count in zip(self.amounts, self.counts) if count > 0]
+
+    @classmethod
+    def replay(cls, entries, seed, draws):
+        # 同じ設定とシードで draws 回引いた結果を再現する (抽選の検証用)
+        sampler = cls(entries, seed)
+        for _ in range(draws): sampler.draw()
+        return sampler
@@ -0,0 +1,24 @@
+import importlib
+import profiling
+
+# --- ページの一覧 ---
+# 表示名 → (モジュール, 描画関数)。ページのモジュール (と、その計算に使うライブラリ) は
+# 初めて選ばれたときに読み込み、以後の再実行ではプロセス内に読み込み済みのものを使う。
+PAGES = {
+    "リングゲーム チップ構成": ('ring_chips', 'render'),
+    "リングゲーム 複数卓プラン": ('ring_tables', 'render'),
+    "トーナメント ブラインドストラクチャー": ('tournament_structure', 'render'),
+    "ミステリーバウンティ": ('mystery_bounty', 'render'),
+    "ノックアウトバウンティ": ('knockout_bounty', 'render'),
+    "トーナメントタイマー": ('tournament_timer', 'render'),
+    "テーブルバランス": ('table_balance', 'render'),
+    "ピッケム": ('pickem', 'render'),
+    "MIX設定": ('mix', 'render_settings'),
+    "MIXカウンター": ('mix', 'render_counter'),
+}
+# 計測を有効にしたときだけ表示する診断ページ
+if profiling.ENABLED: PAGES["診断"] = ('diagnostics', 'render')
+
+def load_page(title):
+    module, function = PAGES[title]
+    return getattr(importlib.import_module(f'{__name__}.{module}'), function)
@@ -0,0 +1,7 @@
+import streamlit as st
+import profiling
+
+def render():
+    st.title('診断')
+    st.write('区間ごとの処理時間と再実行回数です (サーバープロセスが起動してからの合計)。')
+    profiling.render_diagnostics('chip')
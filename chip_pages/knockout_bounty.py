@@ -0,0 +1,56 @@
+import streamlit as st
+import pandas as pd
+from chip_pages.shared import get_clock_service, init_session, seat_moves_dataframe
+
+SESSION_DEFAULTS = {'knockout_message': '', 'last_seat_moves': []}
+
+def knockout_action():
+    eliminated, winners = st.session_state.ko_eliminated_select, st.session_state.ko_winners_select
+    try: record, st.session_state.last_seat_moves = get_clock_service().record_knockout(st.session_state.tournament_id, eliminated, winners)
+    except ValueError as e: st.session_state.knockout_message = str(e); return
+    st.session_state.knockout_message = ' / '.join(f"{winner}: 現金 {cash:,}" + (f"、頭 +{head:,}" if head else '') for winner, cash, head in zip(record.winners, record.cash, record.head)) + f" ({eliminated} のバウンティ {record.bounty:,})"
+    st.session_state.ko_winners_select = []
+def finish_bounties_action():
+    champion = st.session_state.ko_champion
+    st.session_state.knockout_message = f"優勝: {champion} が自分のバウンティ {get_clock_service().finish_bounties(st.session_state.tournament_id, champion):,} を獲得しました。"
+
+def render():
+    init_session(SESSION_DEFAULTS)
+    st.title('ノックアウトバウンティ (KO / PKO)')
+    st.write('ノックアウトを記録し、バウンティの支払い額と各プレイヤーの頭の上のバウンティを管理します。PKO では獲得したバウンティの半分を現金で受け取り、残りが自分の頭に乗ります。')
+    if st.session_state.tournament_format_set not in ('ノックアウト (KO)', 'プログレッシブノックアウト (PKO)'): st.warning('このページを利用するには、まず「トーナメント ブラインドストラクチャー」ページで「ノックアウト (KO)」か「プログレッシブノックアウト (PKO)」を選択し、ストラクチャーを確定してください。'); st.stop()
+    tournament = get_clock_service().snapshot(st.session_state.tournament_id)
+    if not tournament.bounties_active:
+        ko_initial_bounty = st.number_input('1人あたりのバウンティ', min_value=1, value=1000, step=100)
+        if tournament.seating_active: st.write('「テーブルバランス」ページで着席しているプレイヤーを登録します (以降の登録も自動で追加されます)。')
+        else: ko_player_count = st.number_input('プレイヤー数 (名前は自動)', min_value=2, value=max(2, tournament.entries), step=1)
+        if st.button('バウンティ台帳を作成'):
+            get_clock_service().start_bounties(st.session_state.tournament_id, ko_initial_bounty, st.session_state.tournament_format_set == 'プログレッシブノックアウト (PKO)', [] if tournament.seating_active else [f'プレイヤー{i + 1}' for i in range(ko_player_count)])
+            st.rerun()
+        st.stop()
+    summary = get_clock_service().bounty_summary(st.session_state.tournament_id)
+    col_ko1, col_ko2, col_ko3 = st.columns(3)
+    col_ko1.metric("支払い済み", f"{summary['total_paid']:,}")
+    col_ko2.metric("頭の上のバウンティ合計", f"{summary['total_on_heads']:,}")
+    col_ko3.metric("ノックアウト数", summary['knockouts'])
+    if len(summary['remaining']) > 1:
+        st.subheader('ノックアウトの記録')
+        col_ko_in1, col_ko_in2 = st.columns(2)
+        with col_ko_in1: st.selectbox('敗退したプレイヤー', summary['remaining'], key='ko_eliminated_select')
+        with col_ko_in2: st.multiselect('ノックアウトしたプレイヤー (複数ならスプリット)', [player for player in summary['remaining'] if player != st.session_state.get('ko_eliminated_select')], key='ko_winners_select')
+        st.button('ノックアウトを記録', on_click=knockout_action)
+        if tournament.seating_active: st.caption('座席表に着席しているプレイヤーは、記録と同時に敗退として座席表にも反映されます。')
+    elif summary['remaining']:
+        st.session_state.ko_champion = summary['remaining'][0]
+        st.button(f"優勝者 {summary['remaining'][0]} に自分のバウンティを支払う", on_click=finish_bounties_action)
+    if st.session_state.knockout_message: st.info(st.session_state.knockout_message)
+    if st.session_state.last_seat_moves and tournament.seating_active:
+        st.warning('以下の移動をお願いします。')
+        st.dataframe(seat_moves_dataframe(st.session_state.last_seat_moves), hide_index=True, use_container_width=True)
+    col_rank1, col_rank2 = st.columns(2)
+    with col_rank1:
+        st.subheader('頭の上のバウンティ (上位10人)')
+        st.dataframe(pd.DataFrame(summary['biggest_heads'], columns=['プレイヤー', 'バウンティ']), hide_index=True, use_container_width=True)
+    with col_rank2:
+        st.subheader('獲得額 (上位10人)')
+        st.dataframe(pd.DataFrame(summary['top_earners'], columns=['プレイヤー', '獲得額', 'KO数']), hide_index=True, use_container_width=True)
@@ -0,0 +1,103 @@
+import streamlit as st
+import streamlit.components.v1 as components
+from game_rules import GAME_RULES, MIX_GAMES
+from chip_pages.shared import init_session
+
+SESSION_DEFAULTS = {'available_mix_games': list(MIX_GAMES), 'mix_game_modes': [], 'mix_game_count': 1, 'current_mix_game_index': 0, 'remaining_hands_count': 0, 'mix_settings_confirmed': False}
+
+# B キーで次のゲームへ進める
+KEY_PRESS_SCRIPT = """
+    <script>
+    const doc = window.parent.document;
+    doc.addEventListener('keydown', function(e) {
+        if (e.key === 'b') {
+            const button = doc.getElementById('next-game-button');
+            if (button) {
+                button.click();
+            }
+        }
+    });
+    </script>
+    """
+
+def add_game_to_mix(game):
+    st.session_state.mix_game_modes.append(game)
+    st.session_state.available_mix_games.remove(game)
+def remove_game_from_mix(index):
+    game_to_remove = st.session_state.mix_game_modes.pop(index)
+    st.session_state.available_mix_games.append(game_to_remove)
+    st.session_state.available_mix_games.sort()
+def confirm_mix_settings():
+    if len(st.session_state.mix_game_modes) < 2:
+        st.error("MIXゲームには最低2つのゲームモードを選択してください。")
+        return
+    st.session_state.mix_settings_confirmed = True
+    st.session_state.current_mix_game_index = 0
+    st.session_state.remaining_hands_count = st.session_state.mix_game_count
+    st.success("MIXゲームの設定が完了しました。「MIXカウンター」ページで開始できます。")
+
+def next_game_action():
+    st.session_state.current_mix_game_index = (st.session_state.current_mix_game_index + 1) % len(st.session_state.mix_game_modes)
+    st.session_state.remaining_hands_count = st.session_state.mix_game_count
+def prev_game_action():
+    st.session_state.current_mix_game_index = (st.session_state.current_mix_game_index - 1 + len(st.session_state.mix_game_modes)) % len(st.session_state.mix_game_modes)
+    st.session_state.remaining_hands_count = st.session_state.mix_game_count
+def decrement_hand_count():
+    if st.session_state.remaining_hands_count > 0: st.session_state.remaining_hands_count -= 1
+    if st.session_state.remaining_hands_count == 0 and st.session_state.mix_game_count > 0: next_game_action()
+def increment_hand_count():
+    st.session_state.remaining_hands_count += 1
+
+def render_settings():
+    init_session(SESSION_DEFAULTS)
+    st.title('MIX設定')
+    st.write('MIXゲームでプレイするゲームモードと、ゲームチェンジまでのゲーム数を設定します。')
+    st.header("MIXに含めるゲーム")
+    col_sel, col_list = st.columns([0.4, 0.6])
+    with col_sel:
+        st.write("ゲームを選択して追加")
+        for mode in st.session_state.available_mix_games: st.button(f"追加: {mode}", on_click=add_game_to_mix, args=(mode,))
+    with col_list:
+        st.write("現在のMIXリスト")
+        if st.session_state.mix_game_modes:
+            for i, mode in enumerate(st.session_state.mix_game_modes):
+                col1, col2 = st.columns([0.8, 0.2])
+                with col1: st.write(f"{i+1}. {mode}")
+                with col2: st.button("削除", key=f'remove_mix_{i}', on_click=remove_game_from_mix, args=(i,))
+        else: st.write("ゲームが選択されていません。")
+    st.markdown("---")
+    st.header("ゲームチェンジ設定")
+    st.session_state.mix_game_count = st.number_input('何ゲームでチェンジしますか？ (0にすると手動で進めます)', min_value=0, value=st.session_state.mix_game_count)
+    if st.button('設定を確定', on_click=confirm_mix_settings): st.rerun()
+
+def render_counter():
+    init_session(SESSION_DEFAULTS)
+    st.title('MIXカウンター')
+    st.write('設定したゲームモードを順番に表示し、ゲーム数をカウントします。')
+    components.html(KEY_PRESS_SCRIPT, height=0)
+    if not st.session_state.mix_settings_confirmed: st.warning('まず「MIX設定」ページでゲームモードとゲーム数を設定してください。'); st.stop()
+    mix_modes = st.session_state.mix_game_modes
+    num_games_per_change = st.session_state.mix_game_count
+    current_index = st.session_state.current_mix_game_index
+    if not mix_modes: st.warning("MIXゲームモードが設定されていません。"); st.stop()
+    current_game = mix_modes[current_index]
+    next_index = (current_index + 1) % len(mix_modes)
+    next_game = mix_modes[next_index]
+
+    if st.session_state.remaining_hands_count == 0 and num_games_per_change > 0:
+        next_game_action()
+        st.rerun()
+
+    st.markdown("---")
+    col_games_info = st.columns(2)
+    with col_games_info[0]: st.subheader(f'現在のゲーム: {current_game}')
+    with col_games_info[1]: st.markdown(f'<p style="font-size:20px; text-align:right; color:grey;">次のゲーム: {next_game}</p>', unsafe_allow_html=True)
+    st.markdown(f"**ルール:**")
+    st.markdown(GAME_RULES.get(current_game, "ルールが見つかりません。"))
+    st.markdown("---")
+    st.subheader("ゲーム数カウンター")
+    if num_games_per_change > 0: st.metric("残りゲーム数", st.session_state.remaining_hands_count)
+    else: st.write("ゲーム数は設定されていません（手動で進めてください）")
+    col_nav = st.columns(3)
+    with col_nav[0]: st.button('◀️', on_click=prev_game_action, key='prev_game_button', disabled=len(mix_modes) < 2)
+    with col_nav[1]: st.button('▶️', on_click=next_game_action, key='next_game_button', disabled=len(mix_modes) < 2)
@@ -0,0 +1,85 @@
+import streamlit as st
+import pandas as pd
+from bounty_sampler import BountySampler
+from bounty_analytics import next_draw_expected_value, hit_probabilities, payout_moments, payout_quantiles
+import profiling
+from chip_pages.shared import init_session
+
+SESSION_DEFAULTS = {'bounty_entries': [{'amount': 1000, 'count': 1}], 'bounty_confirmed': False, 'last_drawn_bounty': None, 'bounty_to_draw': BountySampler([])}
+
+def draw_bounty_action():
+    if not st.session_state.bounty_to_draw: st.error("残りのバウンティがありません。"); st.session_state.last_drawn_bounty = None; return
+    st.session_state.last_drawn_bounty = st.session_state.bounty_to_draw.draw()
+def confirm_bounty_action():
+    seed_text = st.session_state.get('bounty_seed_input', '').strip()
+    if seed_text and not seed_text.isdigit(): st.error("抽選シードは数字で入力してください。"); return
+    with profiling.section('calc:bounty_sampler'): st.session_state.bounty_to_draw = BountySampler([dict(entry) for entry in st.session_state.bounty_entries], int(seed_text) if seed_text else None)
+    st.session_state.bounty_confirmed = True
+    st.session_state.last_drawn_bounty = None
+    st.success("バウンティの設定が確定されました！")
+def add_bounty_entry(): st.session_state.bounty_entries.append({'amount': 1000, 'count': 1}); st.session_state.bounty_confirmed = False
+def remove_bounty_entry(index):
+    if len(st.session_state.bounty_entries) > 1: st.session_state.bounty_entries.pop(index); st.session_state.bounty_confirmed = False
+
+def render():
+    init_session(SESSION_DEFAULTS)
+    st.title('ミステリーバウンティ 設定')
+    st.write('「トーナメント ブラインドストラクチャー」ページでミステリーバウンティが選択されている場合、ここにバウンティの設定内容を入力します。')
+    if st.session_state.tournament_format_set != 'ミステリーバウンティ': st.warning('このページを利用するには、まず「トーナメント ブラインドストラクチャー」ページで「ミステリーバウンティ」を選択し、ストラクチャーを確定してください。'); st.stop()
+    st.header('バウンティ内容の入力')
+    if not st.session_state.bounty_confirmed:
+        col_buttons = st.columns([0.2, 0.8])
+        with col_buttons[0]: st.button("新しいバウンティを追加", on_click=add_bounty_entry)
+        for i, entry in enumerate(st.session_state.bounty_entries):
+            col1, col2, col3 = st.columns([0.4, 0.4, 0.2])
+            with col1: st.session_state.bounty_entries[i]['amount'] = st.number_input(f'バウンティ金額 #{i+1}', min_value=1, step=100, value=st.session_state.bounty_entries[i]['amount'], key=f'bounty_amount_{i}')
+            with col2: st.session_state.bounty_entries[i]['count'] = st.number_input(f'本数 #{i+1}', min_value=1, step=1, value=st.session_state.bounty_entries[i]['count'], key=f'bounty_count_{i}')
+            with col3:
+                if len(st.session_state.bounty_entries) > 1: st.button("削除", key=f'remove_bounty_{i}', on_click=remove_bounty_entry, args=(i,))
+        st.markdown("---")
+        st.text_input('抽選シード (任意・空欄なら自動で決定)', key='bounty_seed_input')
+        st.button('バウンティ確定', key='confirm_bounty_btn', on_click=confirm_bounty_action)
+    if st.session_state.bounty_confirmed:
+        st.subheader("現在のバウンティ状況")
+        col_status1, col_status2 = st.columns(2)
+        with col_status1:
+            st.metric("合計本数", st.session_state.bounty_to_draw.total)
+        with col_status2: st.metric("残り本数", len(st.session_state.bounty_to_draw))
+        st.markdown("---")
+        st.subheader("残りバウンティの内訳")
+        if st.session_state.bounty_to_draw:
+            df_remaining = pd.DataFrame(st.session_state.bounty_to_draw.breakdown(), columns=['金額 (ドル)', '本数'])
+            st.dataframe(df_remaining, hide_index=True, use_container_width=True)
+        else: st.info("残りのバウンティはありません。")
+        if st.session_state.bounty_to_draw:
+            st.subheader("残りバウンティの期待値と確率")
+            sampler = st.session_state.bounty_to_draw
+            col_ev1, col_ev2 = st.columns(2)
+            col_ev1.metric("次の1本の期待値", f"{next_draw_expected_value(sampler):,.0f} ドル")
+            col_ev2.metric("残りの総額", f"{sampler.remaining_value:,} ドル")
+            knockouts = st.number_input('今後のノックアウト数', min_value=1, max_value=len(sampler), value=min(9, len(sampler)), step=1, key='bounty_knockouts_input')
+            with profiling.section('calc:bounty_analytics'):
+                payout_mean, payout_std = payout_moments(sampler, knockouts)
+                payout_q = payout_quantiles(sampler, knockouts)
+            col_q1, col_q2, col_q3, col_q4 = st.columns(4)
+            col_q1.metric(f"{knockouts}本の合計 (平均)", f"{payout_mean:,.0f}")
+            col_q2.metric("下位10%", f"{payout_q[0.1]:,.0f}")
+            col_q3.metric("中央値", f"{payout_q[0.5]:,.0f}")
+            col_q4.metric("上位10%", f"{payout_q[0.9]:,.0f}")
+            st.caption(f"標準偏差: {payout_std:,.0f} ドル。確率と平均は残り本数から厳密に、分位点は1万回のシミュレーションで計算しています。")
+            df_hits = pd.DataFrame(hit_probabilities(sampler, knockouts)[:10])
+            st.dataframe(df_hits.style.format({'この金額を引く確率': '{:.1%}', 'この金額以上を引く確率': '{:.1%}'}), hide_index=True, use_container_width=True)
+        st.markdown("---")
+        st.subheader("バウンティ抽選")
+        if st.session_state.bounty_to_draw: st.button('バウンティを引く', on_click=draw_bounty_action)
+        else: st.info("残りのバウンティがありません。")
+        if st.session_state.last_drawn_bounty is not None: st.markdown(f"<h3 style='text-align: center; font-size: 36px; color: #E91E63;'>引いたバウンティ: {st.session_state.last_drawn_bounty} ドル</h3>", unsafe_allow_html=True)
+        with st.expander("抽選記録 (再現用)"):
+            sampler = st.session_state.bounty_to_draw
+            st.write(f"抽選シード: `{sampler.seed}`")
+            st.write("同じバウンティ内容と抽選シードから、同じ順番の抽選結果を再現できます。")
+            if sampler.history: st.dataframe(pd.DataFrame({'回': range(1, len(sampler.history) + 1), '金額 (ドル)': sampler.history}), hide_index=True, use_container_width=True)
+            if st.button('記録から再現して確認', key='replay_bounty_btn'):
+                replayed = BountySampler.replay([{'amount': amount, 'count': count} for amount, count in zip(sampler.amounts, sampler.initial_counts)], sampler.seed, len(sampler.history))
+                if replayed.history == sampler.history: st.success(f"{len(sampler.history)}回分の抽選結果が再現と一致しました。")
+                else: st.error("再現した抽選結果が記録と一致しません。")
@@ -0,0 +1,81 @@
+import streamlit as st
+import pandas as pd
+from game_rules import GAME_RULES, PICKEM_GAMES
+from hand_eval import parse_cards
+from equity import GAME_LAYOUTS, calculate_equity, part_names
+from draw_solver import DRAW_GAMES, MAX_DRAWS, solve_discards
+from showdown import resolve_showdown
+import profiling
+from chip_pages.shared import init_session
+
+SESSION_DEFAULTS = {'pickem_game_mode': 'Holdem - Normal'}
+
+def render():
+    init_session(SESSION_DEFAULTS)
+    st.title('ピッケム')
+    st.write('プレイしたいゲームモードを選択してください。')
+    st.session_state.pickem_game_mode = st.selectbox('ゲームモードを選択', PICKEM_GAMES, index=PICKEM_GAMES.index(st.session_state.pickem_game_mode) if st.session_state.pickem_game_mode in PICKEM_GAMES else 0, key="pickem_game_mode_select")
+    st.markdown("---")
+    st.subheader("現在選択中のゲーム")
+    st.markdown(f"<h1 style='text-align: center; font-size: 48px; color: #4CAF50;'>{st.session_state.pickem_game_mode}</h1>", unsafe_allow_html=True)
+    st.markdown("---")
+    st.subheader("ゲームのルール")
+    selected_game = st.session_state.pickem_game_mode
+    rules = GAME_RULES.get(selected_game, "このゲームのルールはまだ登録されていません。")
+    st.markdown(rules)
+    st.markdown("---")
+    st.subheader("エクイティ計算")
+    st.write('手札とボードを入力してください (例: AsKd Th)。空欄や足りない分は未知のカードとして山札から配ります。')
+    hole_options, board_count = GAME_LAYOUTS[selected_game]
+    hole_count = st.selectbox('手札の枚数', hole_options) if len(hole_options) > 1 else hole_options[0]
+    player_count = st.number_input('プレイヤー数', min_value=2, max_value=9, value=2, step=1)
+    hand_inputs = [st.text_input(f'プレイヤー{i + 1}の手札 ({hole_count}枚まで)', key=f'equity_hand_{i}') for i in range(player_count)]
+    board_inputs = [st.text_input(f'ボード{b + 1}' if board_count > 1 else 'ボード', key=f'equity_board_{b}') for b in range(board_count)]
+    dead_input = st.text_input('デッドカード (任意)', key='equity_dead')
+    if st.button('エクイティを計算'):
+        try:
+            with st.spinner('計算中...'):
+                with profiling.section('calc:equity'): equity_result = calculate_equity(selected_game, [parse_cards(text) for text in hand_inputs], [parse_cards(text) for text in board_inputs], parse_cards(dead_input), hole_count)
+        except ValueError as e: st.error(str(e))
+        else:
+            df_equity = pd.DataFrame({'プレイヤー': [f'プレイヤー{i + 1}' for i in range(player_count)], '手札': [text or '(未知)' for text in hand_inputs], 'エクイティ': equity_result['equity']})
+            names = part_names(selected_game)
+            if len(names) > 1:
+                for j, name in enumerate(names): df_equity[name] = equity_result['parts'][:, j]
+            st.dataframe(df_equity.style.format({column: '{:.1%}' for column in ('エクイティ',) + (names if len(names) > 1 else ())}), hide_index=True, use_container_width=True)
+            if equity_result['method'] == '全列挙': st.caption(f"全列挙: {equity_result['trials']:,}通り")
+            else: st.caption(f"モンテカルロ: {equity_result['trials']:,}回 (標準誤差 ±{equity_result['std_error']:.2%})")
+            if len(names) > 1: st.caption('列ごとの値は、その取り分を獲得する割合です (成立しなかった分は他の取り分に回ります)。')
+    with st.expander('ショーダウンのポット分配'):
+        st.write('上で入力した手札とボード (全て公開済み) から、端数チップも含めたポットの分け方を判定します。端数はボタンの左に近いプレイヤー (プレイヤー1から順) に配ります。')
+        col_pot1, col_pot2 = st.columns(2)
+        with col_pot1: showdown_pot = st.number_input('ポット', min_value=1, value=100, step=1, key='showdown_pot')
+        with col_pot2: showdown_unit = st.number_input('最小チップ単位', min_value=1, value=1, step=1, key='showdown_unit')
+        if st.button('ポットを分配'):
+            try:
+                with profiling.section('calc:showdown'): showdown = resolve_showdown(selected_game, showdown_pot, [parse_cards(text) for text in hand_inputs], [parse_cards(text) for text in board_inputs], showdown_unit)
+            except ValueError as e: st.error(str(e))
+            else:
+                df_showdown = pd.DataFrame({'プレイヤー': [f'プレイヤー{i + 1}' for i in range(player_count)], '手札': hand_inputs, '獲得額': showdown['chips']})
+                if len(showdown['parts']) > 1:
+                    for name, chips in showdown['parts'].items(): df_showdown[name] = chips
+                st.dataframe(df_showdown, hide_index=True, use_container_width=True)
+                unqualified = [name for name, ok in showdown['qualified'].items() if not ok]
+                if showdown['chopped']: st.info('役が成立したプレイヤーがいないため、ショーダウンした全員でチョップします。')
+                elif unqualified: st.info(f"{'、'.join(unqualified)} は成立しなかったため、その分は他の取り分に回ります。")
+    if selected_game in DRAW_GAMES:
+        st.markdown("---")
+        st.subheader("ドローの捨て方")
+        st.write('手札と見えているカードから、全ての捨て方について最後に残る手の強さ (全ハンドの中で何割に勝つか) の期待値を計算します。')
+        draw_hand_size = DRAW_GAMES[selected_game][0]
+        draw_hand_input = st.text_input(f'手札 ({draw_hand_size}枚)', key='draw_hand')
+        draw_dead_input = st.text_input('見えているカード・捨てられたカード (任意)', key='draw_dead')
+        draws_left = 1 if selected_game.startswith('Drawmaha') else st.number_input('残りのドロー回数', min_value=1, max_value=MAX_DRAWS, value=MAX_DRAWS if selected_game != 'Draw - Hi' else 1, step=1)
+        if st.button('捨て方を計算'):
+            try:
+                with st.spinner('計算中... (初回はゲームごとの表を作るため数秒かかります)'):
+                    with profiling.section('calc:discards'): discard_rows = solve_discards(selected_game, parse_cards(draw_hand_input), parse_cards(draw_dead_input), draws_left)
+            except ValueError as e: st.error(str(e))
+            else:
+                st.success(f"おすすめ: {discard_rows[0]['捨てるカード']} を捨てる (期待値 {discard_rows[0]['期待値']:.1%})")
+                st.dataframe(pd.DataFrame(discard_rows).style.format({'期待値': '{:.1%}'}), hide_index=True, use_container_width=True)
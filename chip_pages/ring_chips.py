@@ -0,0 +1,61 @@
+import streamlit as st
+import pandas as pd
+from chip_solver import select_chip_denominations, calculate_ring_game_chip_counts, solve_ring_game
+import profiling
+
+def render():
+    st.title('ポーカーリングゲーム チップ構成計算ツール')
+    st.write('ブラインドとスタックサイズを入力すると、SBが支払える最小額から始まる4種類のチップ構成を計算します。')
+    st.header('設定')
+    col1, col2, col3 = st.columns(3)
+    with col1: sb = st.number_input('スモールブラインド (SB)', min_value=1, value=1, step=1)
+    with col2:
+        bb = st.number_input('ビッグブラインド (BB)', min_value=1, value=2, step=1)
+        if bb <= sb: st.error('ビッグブラインドはスモールブラインドより大きくしてください。'); st.stop()
+    with col3: stack_bb = st.number_input('初期スタックサイズ (BB)', min_value=50, value=200, step=10)
+    calc_mode = st.radio('計算方法', ('最適化 (端数なし・枚数最小)', '目安枚数 (従来)'), horizontal=True)
+    chip_inventory = None
+    if calc_mode.startswith('最適化'):
+        with st.expander('チップケースの在庫 (任意)'):
+            if st.checkbox('在庫を考慮する', key='use_chip_inventory'):
+                inventory_seats = st.number_input('配布人数', min_value=1, value=9, step=1)
+                inventory_cols = st.columns(4)
+                case_counts = {}
+                for col, chip in zip(inventory_cols, select_chip_denominations(sb)):
+                    with col: case_counts[chip] = st.number_input(f'{chip}ドル 在庫枚数', min_value=0, value=100, step=10, key=f'chip_inventory_{chip}')
+                chip_inventory = {chip: count // inventory_seats for chip, count in case_counts.items()}
+    st.header('計算結果')
+    with profiling.section('calc:ring_chips'):
+        if calc_mode.startswith('最適化'):
+            try: player_chip_counts, exact = solve_ring_game(sb, bb, stack_bb, chip_inventory)
+            except ValueError as e: st.error(str(e)); st.stop()
+        else: player_chip_counts, exact = calculate_ring_game_chip_counts(sb, bb, stack_bb), True
+    if not exact: st.warning('SB・BBの支払い方が多すぎるため、一部の組み合わせだけから計算しました。合計枚数が最小とは限りません。')
+    player_stack_value = stack_bb * bb
+    st.subheader(f'各プレイヤーへの配布チップ（合計 {player_stack_value} ドル / {stack_bb} BB）')
+    player_df_data = [{"額面 (ドル)": chip, "枚数": count} for chip, count in player_chip_counts.items() if count > 0]
+    if player_df_data: st.dataframe(pd.DataFrame(player_df_data), hide_index=True, use_container_width=True)
+    else: st.write("選択された設定ではチップを割り当てることができませんでした。スタックサイズやブラインドを見直してください。")
+    st.subheader('人数ごとの必要チップ枚数')
+    num_players = list(range(2, 10))
+    data = []
+    used_denominations = sorted(player_chip_counts.keys())
+    for num in num_players:
+        row = {"参加人数": f"{num}人"}
+        total_row_chips = 0
+        for chip_value in used_denominations:
+            count = player_chip_counts.get(chip_value, 0)
+            total_count = count * num
+            row[f'{chip_value}ドル'] = total_count
+            total_row_chips += total_count
+        row["総チップ枚数"] = total_row_chips
+        data.append(row)
+    temp_df = pd.DataFrame(data)
+    cols_to_keep = ['参加人数'] + [f'{chip}ドル' for chip in used_denominations] + ['総チップ枚数']
+    total_chips_df = temp_df[cols_to_keep]
+    st.dataframe(total_chips_df, hide_index=True, use_container_width=True)
+    st.write("---")
+    st.write("**補足事項 (リングゲーム):**")
+    st.write("1. **チップ構成:** この計算では、スモールブラインドが支払える最小額のチップから始まる4種類のチップを使用するようにしています。これにより、ゲームの規模に応じた適切なチップ構成を提案します。")
+    st.write("2. **端数処理:** 「目安枚数」では、計算の都合上、枚数に端数が出た場合は最も小さい額面チップで調整しています。「最適化」では、スタック額ちょうどで、SBとBBをそれぞれ支払えるチップを含み、合計枚数が最小になる構成を計算します。")
+    st.write("3. **在庫:** 在庫を考慮する場合は、各額面の在庫枚数を配布人数で割った枚数を1人あたりの上限として計算します。")
@@ -0,0 +1,42 @@
+import streamlit as st
+import pandas as pd
+from chip_solver import ALL_DENOMINATIONS
+from chip_planner import plan_chip_sets, max_tables_grid
+import profiling
+from chip_pages.shared import init_session
+
+SESSION_DEFAULTS = {'ring_table_plan': pd.DataFrame([{'SB': 1, 'BB': 2, 'スタック (BB)': 200, '1卓の人数': 9, '卓数': 4}, {'SB': 2, 'BB': 5, 'スタック (BB)': 100, '1卓の人数': 9, '卓数': 2}])}
+
+def render():
+    init_session(SESSION_DEFAULTS)
+    st.title('リングゲーム 複数卓チップ計画')
+    st.write('同時に開く卓の一覧と手持ちのチップ在庫を入力すると、全ての卓に配るチップをまとめて計算し、在庫で足りるかどうかと開ける最大卓数を表示します。')
+    st.header('卓の設定')
+    table_plan_df = st.data_editor(st.session_state.ring_table_plan, num_rows="dynamic", use_container_width=True, key='ring_table_plan_editor').dropna()
+    st.header('チップ在庫')
+    inventory_cols = st.columns(4)
+    chip_inventory = {}
+    default_inventory = {1: 500, 5: 500, 10: 500, 25: 1000, 100: 500, 500: 100, 1000: 100}
+    for i, chip in enumerate(ALL_DENOMINATIONS):
+        with inventory_cols[i % 4]: chip_inventory[chip] = st.number_input(f'{chip}ドル', min_value=0, value=default_inventory[chip], step=50, key=f'plan_inventory_{chip}')
+    tables = [{'sb': row['SB'], 'bb': row['BB'], 'stack_bb': row['スタック (BB)'], 'seats': row['1卓の人数'], 'tables': row['卓数']} for _, row in table_plan_df.iterrows() if row['BB'] > row['SB'] > 0 and row['1卓の人数'] > 0 and row['卓数'] > 0]
+    if not tables: st.write("卓の設定を入力してください。"); st.stop()
+    with profiling.section('calc:plan_chip_sets'):
+        try: plan = plan_chip_sets(tables, chip_inventory)
+        except ValueError as e: st.error(str(e)); st.stop()
+    if plan is None: st.error('チップを割り当てられない卓の設定があります。ブラインドやスタックサイズを見直してください。'); st.stop()
+    st.header('計算結果')
+    if plan['feasible']: st.success('この在庫で全ての卓を開けます。')
+    else: st.error('在庫が不足しています。不足している額面を確認してください。')
+    st.subheader('1人あたりの配布チップ')
+    st.dataframe(pd.DataFrame([{'SB': sb, 'BB': bb, 'スタック (BB)': stack_bb, '合計人数': plan['seats'][(sb, bb, stack_bb)], **{f'{chip}ドル': allocation.get(chip, 0) for chip in ALL_DENOMINATIONS}, '追加で座れる人数': plan['extra_seats'][(sb, bb, stack_bb)]} for (sb, bb, stack_bb), allocation in plan['allocations'].items()]), hide_index=True, use_container_width=True)
+    st.subheader('在庫の使用状況')
+    st.dataframe(pd.DataFrame([{'額面 (ドル)': chip, '在庫': chip_inventory[chip], '使用': plan['usage'].get(chip, 0), '残り': chip_inventory[chip] - plan['usage'].get(chip, 0)} for chip in ALL_DENOMINATIONS]), hide_index=True, use_container_width=True)
+    st.subheader('設定ごとの最大卓数 (その設定だけを開く場合)')
+    with profiling.section('calc:max_tables_grid'): grid_df = max_tables_grid(list(plan['allocations']), range(2, 10), chip_inventory)
+    grid_df['設定'] = grid_df['SB'].astype(str) + '/' + grid_df['BB'].astype(str) + ' ' + grid_df['スタック (BB)'].astype(str) + 'BB'
+    st.dataframe(grid_df.pivot(index='設定', columns='1卓の人数', values='最大卓数').rename(columns=lambda n: f'{n}人卓'), use_container_width=True)
+    st.write("---")
+    st.write("**補足事項 (複数卓):**")
+    st.write("1. **配布:** 同じ設定の卓には同じチップ構成を配ります。各設定の配布候補（枚数最小の構成と、一部の額面を減らした構成）の中から、在庫の使用率が最も低くなる組み合わせを選びます。")
+    st.write("2. **追加で座れる人数:** 計画どおりに配った後の残りの在庫で、その設定の卓にあと何人分配れるかを示します。")
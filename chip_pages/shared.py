@@ -0,0 +1,18 @@
+import copy
+import pandas as pd
+import streamlit as st
+from clock_service import ClockService
+
+# --- ページ間で共有するリソースとセッション状態 ---
+
+# 全ての画面で共有するトーナメント時計 (ブラウザごとではなくサーバープロセスに1つ)
+@st.cache_resource
+def get_clock_service(): return ClockService()
+
+def init_session(defaults):
+    # まだ無いキーだけを初期化する (既定値はセッションごとに複製するので、リストなどを共有しない)
+    for key, value in defaults.items():
+        if key not in st.session_state: st.session_state[key] = copy.deepcopy(value)
+
+def seat_moves_dataframe(moves):
+    return pd.DataFrame([{'プレイヤー': move.player, '移動元': f'テーブル{move.from_table} シート{move.from_seat + 1}', '移動先': f'テーブル{move.to_table} シート{move.to_seat + 1}', '理由': move.reason} for move in moves])
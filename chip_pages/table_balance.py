@@ -0,0 +1,66 @@
+import math
+import streamlit as st
+import pandas as pd
+from chip_pages.shared import get_clock_service, init_session, seat_moves_dataframe
+
+SESSION_DEFAULTS = {'seating_message': '', 'last_seat_moves': []}
+
+def register_player_action():
+    name = st.session_state.register_name_input.strip()
+    if not name: st.session_state.seating_message = 'プレイヤー名を入力してください。'; return
+    try: table, seat = get_clock_service().seating_action(st.session_state.tournament_id, 'register', name)
+    except ValueError as e: st.session_state.seating_message = str(e); return
+    st.session_state.seating_message = f"{name} → テーブル{table} シート{seat + 1}"
+    st.session_state.register_name_input = ''
+def register_bulk_action():
+    service = get_clock_service()
+    start = service.registrations(st.session_state.tournament_id)  # 敗退したプレイヤーの名前とも重ならないように続きの番号から
+    registered = 0
+    for i in range(st.session_state.bulk_register_input):
+        # 同じ名前が登録済み・満席などで止まったら、そこまでの人数を知らせる
+        try: service.seating_action(st.session_state.tournament_id, 'register', f'プレイヤー{start + i + 1}')
+        except ValueError as e: st.session_state.seating_message = f"{registered}人を登録しました。{e}"; return
+        registered += 1
+    st.session_state.seating_message = f"{registered}人を登録しました。"
+def bust_player_action():
+    player = st.session_state.bust_player_select
+    if not player: return
+    try: st.session_state.last_seat_moves = get_clock_service().seating_action(st.session_state.tournament_id, 'bust', player)
+    except ValueError as e: st.session_state.seating_message = str(e); return
+    st.session_state.seating_message = f"{player} が敗退しました。" + (" 移動の指示があります。" if st.session_state.last_seat_moves else "")
+
+def render():
+    init_session(SESSION_DEFAULTS)
+    st.title('テーブルバランス・座席抽選')
+    st.write('登録時に座席を抽選し、敗退のたびにテーブルバランスとテーブルブレイクの移動を指示します。エントリー人数と残り人数はここからタイマーに反映されます。')
+    tournament = get_clock_service().snapshot(st.session_state.tournament_id)
+    if not tournament.seating_active:
+        col_seat1, col_seat2 = st.columns(2)
+        with col_seat1: seating_table_count = st.number_input('テーブル数', min_value=1, value=max(1, math.ceil(st.session_state.expected_entries_set / 9)), step=1)
+        with col_seat2: seating_seats = st.number_input('1卓の席数', min_value=2, max_value=10, value=9, step=1)
+        if st.button('座席表を作成'):
+            get_clock_service().start_seating(st.session_state.tournament_id, seating_table_count, seating_seats)
+            st.rerun()
+        st.stop()
+    st.session_state.seated_names = get_clock_service().seated_players(st.session_state.tournament_id)
+    col_count1, col_count2, col_count3 = st.columns(3)
+    col_count1.metric("エントリー人数", tournament.entries)
+    col_count2.metric("残り人数", tournament.remaining_players)
+    if 'initial_stack_for_tournament_set' in tournament.settings: col_count3.metric("平均スタック", f"{int(tournament.entries * tournament.settings['initial_stack_for_tournament_set'] / tournament.remaining_players)}")
+    st.subheader('登録 (座席の抽選)')
+    col_reg1, col_reg2 = st.columns([0.7, 0.3])
+    with col_reg1: st.text_input('プレイヤー名', key='register_name_input')
+    with col_reg2: st.button('登録', on_click=register_player_action)
+    col_bulk1, col_bulk2 = st.columns([0.7, 0.3])
+    with col_bulk1: st.number_input('まとめて登録する人数 (名前は自動)', min_value=1, value=9, step=1, key='bulk_register_input')
+    with col_bulk2: st.button('まとめて登録', on_click=register_bulk_action)
+    st.subheader('敗退')
+    col_bust1, col_bust2 = st.columns([0.7, 0.3])
+    with col_bust1: st.selectbox('敗退したプレイヤー', st.session_state.seated_names, key='bust_player_select')
+    with col_bust2: st.button('敗退を記録', on_click=bust_player_action, disabled=not st.session_state.seated_names)
+    if st.session_state.seating_message: st.info(st.session_state.seating_message)
+    if st.session_state.last_seat_moves:
+        st.warning('以下の移動をお願いします。')
+        st.dataframe(seat_moves_dataframe(st.session_state.last_seat_moves), hide_index=True, use_container_width=True)
+    st.subheader('座席表')
+    st.dataframe(pd.DataFrame(get_clock_service().seating_rows(st.session_state.tournament_id)), hide_index=True, use_container_width=True)
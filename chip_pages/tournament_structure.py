@@ -0,0 +1,92 @@
+import streamlit as st
+from blind_structure import generate_tournament_structure
+from tournament_sim import simulate_tournament, summarize_simulation
+import profiling
+from chip_pages.shared import get_clock_service
+
+@st.cache_data(max_entries=16)
+def cached_simulation(structure_df, entries, initial_stack): return simulate_tournament(structure_df, entries, initial_stack, runs=10000, seed=0)
+
+def render():
+    st.title('ポーカー トーナメント ブラインドストラクチャー作成ツール')
+    st.write('初期スタックサイズ、ブラインドスピード、トーナメント形式、ゲームモード、エントリー予定人数、目標所要時間を選択すると、推奨されるブラインドストラクチャーを生成します。')
+    st.header('設定')
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        initial_stack_for_tournament_input = st.number_input('初期スタックサイズ (チップ点数)', min_value=100, value=st.session_state.initial_stack_for_tournament_set, step=100, key="initial_stack_input")
+    with col2:
+        tournament_type_input = st.selectbox('ブラインドスピード', ('ロング', 'ノーマル', 'ターボ', 'ハイパーターボ'), index=('ロング', 'ノーマル', 'ターボ', 'ハイパーターボ').index(st.session_state.tournament_type_set), key="tournament_type_select")
+    with col3:
+        tournament_format_input = st.selectbox('トーナメント形式', ('通常', 'ノックアウト (KO)', 'プログレッシブノックアウト (PKO)', 'ミステリーバウンティ'), index=('通常', 'ノックアウト (KO)', 'プログレッシブノックアウト (PKO)', 'ミステリーバウンティ').index(st.session_state.tournament_format_set), key="tournament_format_select")
+    game_mode_input = st.selectbox('ゲームモード', ('ノーリミットホールデム', 'オマハ', 'スプリットホールデム'), index=('ノーリミットホールデム', 'オマハ', 'スプリットホールデム').index(st.session_state.game_mode_set), key="game_mode_select")
+    col4, col5 = st.columns(2)
+    with col4: expected_entries_input = st.number_input('エントリー予定人数', min_value=2, value=st.session_state.expected_entries_set, step=1, key="expected_entries_input")
+    with col5: target_hours_input = st.number_input('目標所要時間 (時間・0で指定なし)', min_value=0.0, value=st.session_state.target_hours_set, step=0.5, key="target_hours_input")
+    if st.button('ストラクチャー確定', key='generate_structure_btn'):
+        st.session_state.initial_stack_for_tournament_set = initial_stack_for_tournament_input
+        st.session_state.tournament_type_set = tournament_type_input
+        st.session_state.tournament_format_set = tournament_format_input
+        st.session_state.game_mode_set = game_mode_input
+        st.session_state.expected_entries_set = expected_entries_input
+        st.session_state.target_hours_set = target_hours_input
+        tournament_settings = {key: st.session_state[key] for key in ('initial_stack_for_tournament_set', 'tournament_type_set', 'tournament_format_set', 'game_mode_set', 'expected_entries_set', 'target_hours_set')}
+        target_minutes = int(st.session_state.target_hours_set * 60) or None
+        with profiling.section('calc:generate_structure'): structure_df = generate_tournament_structure(st.session_state.initial_stack_for_tournament_set, st.session_state.tournament_type_set, st.session_state.expected_entries_set, target_minutes)
+        get_clock_service().publish_structure(st.session_state.tournament_id, structure_df, tournament_settings)
+        get_clock_service().set_players(st.session_state.tournament_id, entries=st.session_state.expected_entries_set, remaining_players=st.session_state.expected_entries_set)
+        st.session_state.bounty_confirmed = False
+        st.session_state.pop('bounty_to_draw', None)  # ミステリーバウンティのページを開いたときに空の状態から作り直す
+        st.success('ブラインドストラクチャーが確定されました！「トーナメントタイマー」ページへ移動してスタートできます。')
+        st.rerun()
+    st.header('ブラインドストラクチャー')
+    tournament = get_clock_service().snapshot(st.session_state.tournament_id)
+    tournament_structure_df = tournament.structure_df
+    if not tournament_structure_df.empty:
+        st.caption('表を直接編集すると、下のシミュレーションに即座に反映されます。「編集を反映」でタイマーにも反映します（タイマーはレベル1から再開になります）。')
+        edited_structure_df = st.data_editor(tournament_structure_df, hide_index=True, use_container_width=True, disabled=['レベル'], key=f'structure_editor_{tournament.structure_version}')
+        # 空欄 (NaN) や 0 以下の BB・レベル時間があるとタイマーもシミュレーションも動かないので、反映も計算もしない
+        structure_error = None
+        if edited_structure_df[['SB', 'BB', 'BBアンティ', 'レベル時間 (分)']].isna().any(axis=None): structure_error = '空欄のセルがあります。SB・BB・BBアンティ・レベル時間を全て入力してください。'
+        elif (edited_structure_df['BB'] <= 0).any() or (edited_structure_df['レベル時間 (分)'] <= 0).any(): structure_error = 'BBとレベル時間は0より大きい値にしてください。'
+        if st.button('編集を反映', key='apply_structure_edit_btn', disabled=structure_error is not None):
+            get_clock_service().publish_structure(st.session_state.tournament_id, edited_structure_df.reset_index(drop=True), tournament.settings)
+            st.rerun()
+        st.subheader('所要時間シミュレーション')
+        col_sim1, col_sim2 = st.columns(2)
+        with col_sim1: sim_entries = st.number_input('エントリー人数 (想定)', min_value=2, value=int(tournament.settings.get('expected_entries_set', tournament.entries)), step=1, key='sim_entries_input')
+        with col_sim2: available_hours = st.number_input('会場の利用可能時間 (時間)', min_value=0.5, value=float(tournament.settings.get('target_hours_set') or 6.0), step=0.5, key='sim_available_hours_input')
+        if structure_error is not None: st.error(structure_error)
+        else:
+            with profiling.section('calc:simulate_tournament'):
+                sim_result = cached_simulation(edited_structure_df, sim_entries, tournament.settings['initial_stack_for_tournament_set'])
+                sim_summary = summarize_simulation(sim_result, available_hours * 60)
+            col_res1, col_res2, col_res3, col_res4 = st.columns(4)
+            col_res1.metric("終了時間 (中央値)", f"{sim_summary['中央値 (分)'] / 60:.1f}時間")
+            col_res2.metric("終了時間 (90%)", f"{sim_summary['90% (分)'] / 60:.1f}時間")
+            col_res3.metric("時間内に終わる確率", f"{sim_summary['時間内に終わる確率'] * 100:.0f}%")
+            col_res4.metric("FT到達レベル (中央値)", sim_summary.get('ファイナルテーブル到達レベル (中央値)', '-'))
+            if sim_summary['未終了の割合'] > 0: st.warning(f"{sim_summary['未終了の割合'] * 100:.0f}% のシミュレーションはストラクチャーの3倍の時間内に終わりませんでした。")
+            st.line_chart(sim_result['per_level'].set_index('レベル')['平均スタック (BB)'])
+            st.dataframe(sim_result['per_level'].round(1), hide_index=True, use_container_width=True)
+    else: st.write("上記の設定を行い、「ストラクチャー確定」ボタンを押してください。")
+    st.write("---")
+    st.write("**補足事項 (トーナメント):**")
+    st.write("1. **BBアンティ:** このストラクチャーでは、**レベル2からBBアンティ（ビッグブラインドと同額のアンティ）が導入**されます。BBアンティは、ビッグブラインドを支払うプレイヤーが、自分自身のビッグブラインドに加えてアンティもまとめて支払う形式です。これにより、ゲームの進行がスムーズになります。")
+    st.write("2. **ブラインドスピードの目安:**")
+    st.write("   - **ロング:** 各レベル20分以上。じっくりと戦略を練りたい場合に適しています。")
+    st.write("   - **ノーマル:** 各レベル15分程度。最も一般的なトーナメントの進行速度です。")
+    st.write("   - **ターボ:** 各レベル10分程度。比較的短い時間で決着がつくため、カジュアルなプレイに適しています。")
+    st.write("   - **ハイパーターボ:** 各レベル5-6分程度。非常にスピーディーな展開で、運の要素も大きくなります。")
+    st.write("3. **トーナメント形式:**")
+    st.write("   - **通常:** 標準的なトーナメント形式。")
+    st.write("   - **ノックアウト (KO):** プレイヤーを飛ばすと、そのプレイヤーに設定されたバウンティ（賞金）の一部または全部を獲得できます。")
+    st.write("   - **プログレッシブノックアウト (PKO):** ノックアウトと同様にバウンティを獲得できますが、獲得したバウンティの一部が自分自身のバウンティに加算され、頭上に乗るバウンティが増えていきます。")
+    st.write("   - **ミステリーバウンティ:** ノックアウトしたプレイヤーが獲得できるバウンティの金額が、ランダムに決定される形式です。")
+    st.write("4. **ゲームモード:**")
+    st.write("   - **ノーリミットホールデム:** 最も一般的なポーカー形式で、ベットに上限がありません。")
+    st.write("   - **オマハ:** プレイヤーに4枚のホールカードが配られ、ボードの3枚と手札の2枚を組み合わせて役を作ります。")
+    st.write("   - **スプリットホールデム:** 通常のホールデムに加え、ポットを最も低い役と最も高い役で分割する形式です。")
+    st.write("5. **スタックの深さ:** ブラインドは初期スタックとエントリー予定人数から、一定の割合で上がる候補を複数作り、使用するチップで支払える切りのよい額に丸めています。各レベルの平均スタック（BB数）が極端に浅くならず、場の総チップが約40BBになる（ヘッズアップで平均20BB）までに目標所要時間に収まる候補を選んでいます。")
+    st.write("   - 目標所要時間を指定しない場合は、ブラインドスピードのレベル時間で約20レベル分を目安にします。指定した場合は、レベル時間も調整されます。")
+    st.write("6. **シミュレーション:** 1万回分のトーナメントを同時に進め、1分ごとに各卓で平均スタックの深さ（BB数）に応じた確率で脱落者を出すモデルで終了時間を見積もっています。1卓9人・1時間30ハンドを想定した目安です。")
+    st.write("7. **ブレイク:** 通常、トーナメントでは数レベルごとに休憩（ブレイク）が入ります。この表には含まれていませんが、実際の運用では適宜ブレイクを設けることをお勧めします。")
@@ -0,0 +1,111 @@
+import streamlit as st
+import pandas as pd
+from tournament_clock import format_remaining
+from icm import DEFAULT_PAID_FRACTION, EXACT_LIMIT, generate_payouts, deal_table
+import profiling
+from chip_pages.shared import get_clock_service
+
+def move_level_back_action(): get_clock_service().control(st.session_state.tournament_id, 'prev_level')
+def move_level_forward_action(): get_clock_service().control(st.session_state.tournament_id, 'next_level')
+def move_minute_back_action(): get_clock_service().control(st.session_state.tournament_id, 'add_seconds', 60)
+def move_minute_forward_action(): get_clock_service().control(st.session_state.tournament_id, 'add_seconds', -60)
+def toggle_timer_action(): get_clock_service().control(st.session_state.tournament_id, 'toggle')
+def update_entries_action(): get_clock_service().set_players(st.session_state.tournament_id, entries=st.session_state.entries_input)
+def update_remaining_players_action(): get_clock_service().set_players(st.session_state.tournament_id, remaining_players=st.session_state.remaining_players_input)
+
+# 賞金表と ICM は入力が変わらない限り再計算しない (タイマーの操作ごとの再実行で計算し直さない)
+@st.cache_data(max_entries=64)
+def cached_payouts(entries, prize_pool, paid_fraction): return generate_payouts(entries, prize_pool, paid_fraction)
+@st.cache_data(max_entries=64)
+def cached_deal_table(stacks, payouts): return deal_table(list(stacks), list(payouts), seed=0)
+
+def render():
+    tournament = get_clock_service().snapshot(st.session_state.tournament_id)
+    if tournament.structure_df.empty: st.warning('まず「トーナメント ブラインドストラクチャー」ページでストラクチャーを確定してください。'); st.stop()
+    df = tournament.structure_df
+    clock_position = tournament.position
+    tournament_settings = tournament.settings
+    current_level_idx = clock_position.level_idx
+    total_levels = len(df)
+    current_level_data = df.iloc[current_level_idx]
+    if clock_position.finished: st.info("全てのレベルが終了しました！お疲れ様でした！")
+
+    # タイマー表示部分 (この部分だけを再描画し、残り時間は共有時計から計算する)
+    # 他の画面での操作 (停止・レベル変更など) は version の変化で検知してページ全体を描き直す
+    def render_time_display():
+        latest = get_clock_service().snapshot(st.session_state.tournament_id)
+        position = latest.position
+        if latest.version != tournament.version or position.level_idx != current_level_idx or position.finished != clock_position.finished: st.rerun()
+        st.markdown(f"<h1 style='text-align: center; font-size: 72px;'>残り時間: {format_remaining(position.remaining_seconds)}</h1>", unsafe_allow_html=True)
+        profiling.export()  # 時計だけの再描画はページの再実行を通らないので、ここでも書き出す
+    st.fragment(profiling.timed('timer:fragment')(render_time_display), run_every=0.5)()
+    
+    # レベル情報
+    st.header(f'現在のレベル: {current_level_data["レベル"]}')
+    st.subheader(f'SB: {current_level_data["SB"]} / BB: {current_level_data["BB"]} / BBアンティ: {current_level_data["BBアンティ"]}')
+    st.markdown("---")
+    if current_level_idx + 1 < total_levels:
+        next_level_data = df.iloc[current_level_idx + 1]
+        st.markdown(f"""
+        <div style="text-align: center; font-size: 24px; color: gray;">
+            次のレベル: {next_level_data["レベル"]} (SB: {next_level_data["SB"]} / BB: {next_level_data["BB"]} / BBアンティ: {next_level_data["BBアンティ"]})
+        </div>
+        """, unsafe_allow_html=True)
+    else: st.markdown(f"""
+        <div style="text-align: center; font-size: 24px; color: gray;">
+            次のレベルはありません (最終レベル)
+        </div>
+        """, unsafe_allow_html=True)
+    st.markdown("---")
+    
+    # 参加状況
+    st.subheader("現在の参加状況")
+    col_info1, col_info2, col_info3 = st.columns(3)
+    st.session_state.entries_input, st.session_state.remaining_players_input = tournament.entries, tournament.remaining_players
+    with col_info1: st.number_input('エントリー人数', min_value=1, step=1, key='entries_input', on_change=update_entries_action, disabled=tournament.seating_active)
+    with col_info2: st.number_input('残り人数', min_value=1, max_value=tournament.entries, step=1, key='remaining_players_input', on_change=update_remaining_players_action, disabled=tournament.seating_active)
+    with col_info3:
+        initial_stack_val = tournament_settings['initial_stack_for_tournament_set']
+        avg_stack = 0
+        if tournament.remaining_players > 0: avg_stack = (tournament.entries * initial_stack_val) / tournament.remaining_players
+        st.metric("平均スタック", f"{int(avg_stack)}")
+    with st.expander('賞金とディール (ICM)'):
+        col_payout1, col_payout2 = st.columns(2)
+        with col_payout1: buy_in = st.number_input('参加費 (賞金プールへの1エントリーあたりの額)', min_value=1, value=10000, step=1000, key='payout_buy_in')
+        with col_payout2: paid_percent = st.number_input('入賞割合 (%)', min_value=1, max_value=100, value=int(DEFAULT_PAID_FRACTION * 100), step=1, key='payout_paid_percent')
+        with profiling.section('calc:payouts'): payouts = cached_payouts(tournament.entries, tournament.entries * buy_in, paid_percent / 100)
+        st.write(f"賞金プール: {tournament.entries * buy_in:,} / 入賞: {len(payouts)}人")
+        st.dataframe(pd.DataFrame({'順位': range(1, len(payouts) + 1), '賞金': payouts}), hide_index=True, use_container_width=True, height=min(35 * len(payouts) + 38, 300))
+        st.caption(f'残り{tournament.remaining_players}人のスタックを入力すると、ICM による賞金期待値とチップチョップを比較します ({EXACT_LIMIT}人以下は厳密計算、それより多い場合は抽選による近似)。')
+        default_stacks = pd.DataFrame({'プレイヤー': [f'プレイヤー{i + 1}' for i in range(tournament.remaining_players)], 'スタック': [int(avg_stack)] * tournament.remaining_players})
+        icm_stacks_df = st.data_editor(default_stacks, hide_index=True, use_container_width=True, disabled=['プレイヤー'], key=f'icm_stacks_{tournament.remaining_players}_{int(avg_stack)}')
+        try:
+            with profiling.section('calc:icm'): df_deal = cached_deal_table(tuple(icm_stacks_df['スタック'].tolist()), tuple(payouts))
+        except ValueError as e: st.error(str(e))
+        else:
+            df_deal.insert(0, 'プレイヤー', icm_stacks_df['プレイヤー'].to_numpy())
+            st.dataframe(df_deal.style.format({'スタック比': '{:.1%}', 'ICM': '{:,.0f}', 'チップチョップ': '{:,.0f}'}), hide_index=True, use_container_width=True)
+    st.markdown("---")
+    # ゲーム概要
+    st.subheader("トーナメント概要")
+    col_summary1, col_summary2, col_summary3, col_summary4 = st.columns(4)
+    with col_summary1: st.markdown(f"**ゲームモード:** {tournament_settings['game_mode_set']}")
+    with col_summary2: st.markdown(f"**初期スタック:** {tournament_settings['initial_stack_for_tournament_set']}点")
+    with col_summary3: st.markdown(f"**ブラインドスピード:** {tournament_settings['tournament_type_set']}")
+    with col_summary4:
+        if tournament_settings['tournament_format_set'] != '通常': st.markdown(f"**バウンティオプション:** {tournament_settings['tournament_format_set']}")
+        else: st.markdown(f"**バウンティオプション:** なし")
+    st.markdown("---")
+    col_controls1, col_controls2, col_controls3 = st.columns(3)
+    with col_controls1: st.button('◀️ 1分戻す', on_click=move_minute_back_action)
+    with col_controls2: st.button('▶️ 1分進む', on_click=move_minute_forward_action)
+    with col_controls3:
+        if clock_position.running: st.button('⏸️ タイマー停止', on_click=toggle_timer_action)
+        else: st.button('▶️ タイマー開始', on_click=toggle_timer_action, disabled=clock_position.finished)
+    col_level_nav1, col_level_nav2 = st.columns(2)
+    with col_level_nav1: st.button('◀️ 1レベル戻す', on_click=move_level_back_action, disabled=current_level_idx == 0)
+    with col_level_nav2: st.button('▶️ 1レベル進む', on_click=move_level_forward_action, disabled=current_level_idx == total_levels - 1)
+    st.markdown("---")
+    st.subheader("今後のブラインドレベル")
+    if not clock_position.finished: st.dataframe(df.iloc[current_level_idx:].reset_index(drop=True), hide_index=True, use_container_width=True)
+    else: st.write("全てのブラインドレベルが表示されました。")
@@ -0,0 +1,108 @@
+from functools import lru_cache
+from itertools import combinations, product
+import numpy as np
+import pandas as pd
+from chip_solver import ALL_DENOMINATIONS, select_chip_denominations, calculate_ring_game_chip_counts, solve_ring_game_chip_counts
+
+# --- 複数卓のチップ計画 ---
+# 1つのチップ在庫から複数のキャッシュ卓を開く場合の配布をまとめて計算する。
+# 同じ設定 (SB/BB/スタック) の卓には同じ1人分の配布を使い、設定ごとの候補から
+# 在庫に収まる組み合わせを全体で1つのパッキング問題として選ぶ。
+
+CAP_FRACTIONS = (0.75, 0.5, 0.25, 0.0)  # 候補生成で枚数最小の配布から減らす割合
+MAX_CANDIDATES = 12  # 設定ごとに残す候補数
+MAX_COMBINATIONS = 200_000  # これ以下なら全組み合わせを一括評価する
+
+def _to_vector(chip_counts):
+    return np.array([chip_counts.get(chip, 0) for chip in ALL_DENOMINATIONS], dtype=np.int64)
+
+def _to_dict(vector):
+    return {chip: int(count) for chip, count in zip(ALL_DENOMINATIONS, vector) if count > 0}
+
+@lru_cache(maxsize=128)
+def allocation_candidates(sb, bb, stack_bb):
+    # 従来の計算結果 (額が一致する場合)、枚数最小の厳密解、そこから1〜2種類の額面の枚数を
+    # 減らした厳密解を候補にする (減らした分は他の額面で埋まる)
+    stack_value = stack_bb * bb
+    candidates = set()
+    greedy = calculate_ring_game_chip_counts(sb, bb, stack_bb)
+    if sum(chip * count for chip, count in greedy.items()) == stack_value: candidates.add(tuple(_to_vector(greedy)))
+    base = solve_ring_game_chip_counts(sb, bb, stack_bb)
+    if base: candidates.add(tuple(_to_vector(base)))
+    used = [chip for chip in select_chip_denominations(sb) if base.get(chip, 0) > 0]
+    for chips in list(combinations(used, 1)) + list(combinations(used, 2)):
+        for fractions in product(CAP_FRACTIONS, repeat=len(chips)):
+            inventory = {chip: stack_value // chip for chip in select_chip_denominations(sb)}
+            for chip, fraction in zip(chips, fractions): inventory[chip] = int(base[chip] * fraction)
+            allocation = solve_ring_game_chip_counts(sb, bb, stack_bb, inventory)
+            if allocation: candidates.add(tuple(_to_vector(allocation)))
+    # 全ての額面で他の候補以上の枚数を使う候補は除く
+    vectors = sorted(candidates, key=sum)
+    efficient = [v for v in vectors if not any(o != v and all(x <= y for x, y in zip(o, v)) for o in vectors)]
+    return np.array(efficient[:MAX_CANDIDATES], dtype=np.int64).reshape(-1, len(ALL_DENOMINATIONS))
+
+def _utilization(usage, inventory):
+    # 在庫に対する最大使用率 (在庫0の額面を使う場合は無限大)
+    ratio = np.divide(usage, inventory, out=np.where(usage > 0, np.inf, 0.0), where=inventory > 0)
+    return ratio.max(axis=-1)
+
+def plan_chip_sets(tables, inventory):
+    # tables: [{'sb', 'bb', 'stack_bb', 'seats', 'tables' (任意・既定1)}]、inventory: {額面: 在庫枚数}
+    seats_by_config = {}
+    for table in tables:
+        key = (int(table['sb']), int(table['bb']), int(table['stack_bb']))
+        seats_by_config[key] = seats_by_config.get(key, 0) + int(table['seats']) * int(table.get('tables', 1))
+    configs = list(seats_by_config)
+    inventory_vector = _to_vector(inventory)
+    candidates = [allocation_candidates(*config) for config in configs]
+    if not configs or any(len(c) == 0 for c in candidates): return None
+    usages = [c * seats_by_config[config] for c, config in zip(candidates, configs)]
+    shape = tuple(len(c) for c in candidates)
+    if np.prod(shape) <= MAX_COMBINATIONS:
+        # 全組み合わせの使用枚数をまとめて計算し、最大使用率が最小 (同率なら総枚数が最小) のものを選ぶ
+        choice_grid = np.indices(shape).reshape(len(shape), -1)
+        total_usage = sum(usage[idx] for usage, idx in zip(usages, choice_grid))
+        best = np.lexsort((total_usage.sum(axis=1), _utilization(total_usage, inventory_vector)))[0]
+        choice = choice_grid[:, best]
+    else:
+        # 組み合わせが多すぎる場合は設定ごとに順番に選び直す
+        choice = np.zeros(len(shape), dtype=np.int64)
+        for _ in range(10):
+            changed = False
+            for i, usage in enumerate(usages):
+                others = sum(u[c] for j, (u, c) in enumerate(zip(usages, choice)) if j != i)
+                total_usage = others + usage
+                best = int(np.lexsort((total_usage.sum(axis=1), _utilization(total_usage, inventory_vector)))[0])
+                if best != choice[i]: choice[i], changed = best, True
+            if not changed: break
+    allocations = {config: candidates[i][c] for i, (config, c) in enumerate(zip(configs, choice))}
+    usage = sum(seats_by_config[config] * vector for config, vector in allocations.items())
+    remaining = inventory_vector - usage
+    extra_seats = {}
+    for config, vector in allocations.items():
+        used = vector > 0
+        extra_seats[config] = int(np.min(np.maximum(remaining[used], 0) // vector[used]))
+    return {
+        'allocations': {config: _to_dict(vector) for config, vector in allocations.items()},
+        'seats': seats_by_config,
+        'usage': _to_dict(usage),
+        'remaining': {chip: int(count) for chip, count in zip(ALL_DENOMINATIONS, remaining) if inventory.get(chip, 0) or count},
+        'feasible': bool(np.all(remaining >= 0)),
+        'extra_seats': extra_seats,
+    }
+
+def max_tables_grid(configs, seat_options, inventory):
+    # 設定 × 1卓の人数 の全組み合わせについて、その設定だけで在庫から開ける最大卓数を一括計算する
+    inventory_vector = _to_vector(inventory)
+    candidates = [allocation_candidates(*config) for config in configs]
+    width = max([len(c) for c in candidates] + [1])
+    padded = np.zeros((len(configs), width, len(ALL_DENOMINATIONS)), dtype=np.int64)
+    valid = np.zeros((len(configs), width), dtype=bool)
+    for i, c in enumerate(candidates): padded[i, :len(c)], valid[i, :len(c)] = c, True
+    seats = np.asarray(seat_options, dtype=np.int64)
+    per_table = padded[:, :, None, :] * seats[None, None, :, None]  # (設定, 候補, 人数, 額面)
+    tables = np.where(per_table > 0, inventory_vector // np.maximum(per_table, 1), np.iinfo(np.int64).max).min(axis=-1)
+    tables = np.where(valid[:, :, None], tables, 0).max(axis=1)  # 候補の中で最も多く開けるもの
+    rows = [{'SB': sb, 'BB': bb, 'スタック (BB)': stack_bb, '1卓の人数': int(n), '最大卓数': int(tables[i, j]), '最大人数': int(tables[i, j] * n)}
+            for i, (sb, bb, stack_bb) in enumerate(configs) for j, n in enumerate(seats)]
+    return pd.DataFrame(rows)
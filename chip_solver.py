@@ -0,0 +1,156 @@
+import math
+from functools import lru_cache, reduce
+import numpy as np
+
+# --- リングゲーム用チップ構成の計算 ---
+# 目安枚数による従来の計算と、スタック額ちょうど・SB/BBを支払える・チップ枚数最小 の厳密解 (動的計画法)。
+
+ALL_DENOMINATIONS = (1, 5, 10, 25, 100, 500, 1000)
+# SB/BB の支払い方の列挙の上限 (ブラインドが小さい額面に比べて大きいと組み合わせが爆発するため)。
+# 上限で打ち切った場合も、列挙できた支払い方の中で最小の構成を返す (枚数最小とは限らない)
+MAX_KITS = 256
+MAX_KIT_SEARCH_NODES = 200_000
+# 両替表の大きさ (スタック額 ÷ 額面の最大公約数) の上限。これを超える設定は計算しない (1表あたり約16MB)
+MAX_TABLE_UNITS = 2_000_000
+
+def select_chip_denominations(sb):
+    # SBが支払える最小額のチップから始まる4種類
+    min_chip_value = 1
+    if sb >= 25: min_chip_value = 25
+    elif sb >= 5: min_chip_value = 5
+    start_index = ALL_DENOMINATIONS.index(min_chip_value)
+    if start_index + 4 > len(ALL_DENOMINATIONS): return list(ALL_DENOMINATIONS[-4:])
+    return list(ALL_DENOMINATIONS[start_index:start_index + 4])
+
+def calculate_ring_game_chip_counts(sb, bb, stack_bb):
+    stack_value = stack_bb * bb
+    selected_denominations = select_chip_denominations(sb)
+    chip_counts = {chip: 0 for chip in selected_denominations}
+    remaining_value = stack_value
+    target_counts = {1: 25, 5: 15, 10: 15, 25: 6, 100: 4}
+    remaining_value = stack_value
+    for chip in sorted(selected_denominations):
+        target = target_counts.get(chip, 0)
+        if target > 0:
+            count = min(target, remaining_value // chip)
+            chip_counts[chip] = count
+            remaining_value -= count * chip
+    for chip in sorted(selected_denominations, reverse=True):
+        count = remaining_value // chip
+        chip_counts[chip] += count
+        remaining_value %= chip
+    if remaining_value > 0 and min(selected_denominations) in chip_counts:
+        chip_counts[min(selected_denominations)] += remaining_value
+    final_chip_counts = {}
+    for chip in sorted(selected_denominations):
+        if chip_counts[chip] > 20:
+            excess_value = (chip_counts[chip] - 20) * chip
+            chip_counts[chip] = 20
+            next_chips = [c for c in sorted(selected_denominations) if c > chip]
+            if next_chips:
+                next_chip = next_chips[0]
+                count_to_add_next = excess_value // next_chip
+                chip_counts[next_chip] += count_to_add_next
+                remaining_after_consolidation = excess_value % next_chip
+                if remaining_after_consolidation > 0: chip_counts[chip] += remaining_after_consolidation // chip
+        final_chip_counts[chip] = chip_counts[chip]
+    return {chip: count for chip, count in final_chip_counts.items() if count > 0}
+
+def _payment_kits(amount, denominations, limits):
+    # amount をちょうど支払えるチップの組み合わせ (額面ごとの枚数のタプル) を、大きい額面を多く使う順に列挙する。
+    # 組み合わせは MAX_KITS 個まで、探索は MAX_KIT_SEARCH_NODES 回までで打ち切る。返り値は (組み合わせ, 全て列挙できたか)
+    kits, nodes = [], 0
+    counts = [0] * len(denominations)
+    def search(i, remaining):
+        nonlocal nodes
+        nodes += 1
+        if len(kits) >= MAX_KITS or nodes > MAX_KIT_SEARCH_NODES: return
+        chip = denominations[i]
+        if i == 0:
+            # 一番小さい額面は枚数が1通りに決まる
+            if remaining % chip == 0 and remaining // chip <= limits[0]:
+                counts[0] = remaining // chip
+                kits.append(tuple(counts))
+            return
+        for count in range(min(limits[i], remaining // chip), -1, -1):
+            counts[i] = count
+            search(i - 1, remaining - count * chip)
+            if len(kits) >= MAX_KITS or nodes > MAX_KIT_SEARCH_NODES: return
+        counts[i] = 0
+    search(len(denominations) - 1, amount)
+    return kits, len(kits) < MAX_KITS and nodes <= MAX_KIT_SEARCH_NODES
+
+def _minimal_requirements(sb, bb, denominations, limits):
+    # SB用とBB用の組み合わせを両方含む最小の必要枚数 (他を包含するものは除く)。返り値は (必要枚数の一覧, 全て列挙できたか)
+    sb_kits, sb_complete = _payment_kits(sb, denominations, limits)
+    bb_kits, bb_complete = _payment_kits(bb, denominations, limits)
+    if not sb_kits or not bb_kits: return [], sb_complete and bb_complete
+    candidates = np.unique(np.maximum(np.array(sb_kits)[:, None, :], np.array(bb_kits)[None, :, :]).reshape(-1, len(denominations)), axis=0)
+    candidates = candidates[np.argsort(candidates.sum(axis=1), kind='stable')]
+    minimal = np.empty((0, len(denominations)), dtype=candidates.dtype)
+    for r in candidates:
+        if not (minimal <= r).all(axis=1).any(): minimal = np.vstack([minimal, r])
+    return [tuple(int(c) for c in r) for r in minimal], sb_complete and bb_complete
+
+def _min_chip_table(size, steps, limits):
+    # 上限付きの最小枚数両替表 (二進分割した品目ごとに numpy でまとめて更新)。0..size の全ての額について求める
+    inf = np.iinfo(np.int64).max // 4
+    best = np.full(size + 1, inf, dtype=np.int64)
+    best[0] = 0
+    items = []
+    for i, step in enumerate(steps):
+        limit, k = min(limits[i], size // step), 1
+        while limit > 0:
+            take = min(k, limit)
+            shifted = np.full(size + 1, inf, dtype=np.int64)
+            shifted[take * step:] = best[:size + 1 - take * step] + take
+            mask = shifted < best
+            best = np.where(mask, shifted, best)
+            items.append((i, take, take * step, mask))
+            limit -= take; k *= 2
+    return best, items, inf
+
+def _reconstruct(items, value, n):
+    counts = [0] * n
+    for i, take, weight, mask in reversed(items):
+        if mask[value]: counts[i] += take; value -= weight
+    return counts
+
+@lru_cache(maxsize=256)
+def _solve(sb, bb, stack_value, inventory):
+    denominations = select_chip_denominations(sb)
+    unit = reduce(math.gcd, denominations)
+    if stack_value % unit: return (), True
+    if stack_value // unit > MAX_TABLE_UNITS: raise ValueError(f"1人分のスタック ({stack_value:,} ドル) が大きすぎます。{unit}ドルチップ {MAX_TABLE_UNITS:,} 枚分以下にしてください。")
+    steps = [chip // unit for chip in denominations]
+    limits = [stack_value // chip if inventory is None else dict(inventory).get(chip, 0) for chip in denominations]
+    # 全体の上限で作った表は、必要枚数を差し引いた残りの最小枚数の下限になる
+    bound_table, bound_items, inf = _min_chip_table(stack_value // unit, steps, limits)
+    options = []
+    requirements, complete = _minimal_requirements(sb, bb, denominations, limits)
+    for requirement in requirements:
+        rest_units = (stack_value - sum(c * chip for c, chip in zip(requirement, denominations))) // unit
+        if rest_units >= 0 and bound_table[rest_units] < inf: options.append((sum(requirement) + int(bound_table[rest_units]), requirement, rest_units))
+    best = None
+    for lower_bound, requirement, rest_units in sorted(options):
+        if best is not None and lower_bound >= sum(best): break
+        rest_limits = [limit - c for limit, c in zip(limits, requirement)]
+        rest = _reconstruct(bound_items, rest_units, len(denominations))
+        if any(r > limit for r, limit in zip(rest, rest_limits)):
+            table, items, _ = _min_chip_table(rest_units, steps, rest_limits)
+            if table[rest_units] >= inf: continue
+            rest = _reconstruct(items, rest_units, len(denominations))
+        counts = [a + b for a, b in zip(requirement, rest)]
+        if best is None or sum(counts) < sum(best): best = counts
+    if best is None: return (), complete
+    return tuple((chip, count) for chip, count in zip(denominations, best) if count > 0), complete
+
+def solve_ring_game(sb, bb, stack_bb, inventory=None):
+    # (配布, 枚数最小が保証されているか)。支払い方の列挙を打ち切った場合は後者が False。スタックが大きすぎれば ValueError
+    inventory_key = None if inventory is None else tuple(sorted((int(chip), int(count)) for chip, count in inventory.items()))
+    allocation, complete = _solve(int(sb), int(bb), int(stack_bb * bb), inventory_key)
+    return dict(allocation), complete
+
+def solve_ring_game_chip_counts(sb, bb, stack_bb, inventory=None):
+    # inventory: 1人分の配布に使える額面ごとの最大枚数 (None は無制限)。割り当て不能なら空の辞書
+    return solve_ring_game(sb, bb, stack_bb, inventory)[0]
@@ -0,0 +1,174 @@
+import threading
+from dataclasses import dataclass
+import pandas as pd
+from tournament_clock import TournamentClock, ClockPosition
+from seating import SeatingChart
+from ko_ledger import BountyLedger
+
+# --- 複数画面で共有するトーナメント時計 ---
+# 1つのトーナメントにつき1つの時計をプロセス内で保持し、全ての画面が同じ状態を参照する。
+# 状態が変わるたびに version を進め、購読者 (subscribe) に新しいスナップショットを通知する。
+
+@dataclass(frozen=True)
+class TournamentSnapshot:
+    tournament_id: str
+    version: int
+    structure_df: pd.DataFrame
+    position: ClockPosition
+    settings: dict
+    entries: int
+    remaining_players: int
+    seating_active: bool = False
+    bounties_active: bool = False
+    structure_version: int = 0  # ストラクチャーを公開するたびに進む (編集画面のキー用)
+
+class _Tournament:
+    def __init__(self):
+        self.structure_df = pd.DataFrame()
+        self.clock = TournamentClock([])
+        self.settings = {}
+        self.entries = 10
+        self.remaining_players = 10
+        self.seating = None
+        self.bounties = None
+        self.version = 0
+        self.structure_version = 0
+        self.listeners = []
+
+class ClockService:
+    CLOCK_ACTIONS = ('start', 'pause', 'toggle', 'add_seconds', 'set_level', 'next_level', 'prev_level')
+    SEATING_ACTIONS = ('register', 'bust')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tournaments = {}
+
+    def _get(self, tournament_id):
+        if tournament_id not in self._tournaments: self._tournaments[tournament_id] = _Tournament()
+        return self._tournaments[tournament_id]
+
+    def _snapshot(self, tournament_id, tournament, now=None):
+        return TournamentSnapshot(tournament_id, tournament.version, tournament.structure_df, tournament.clock.position(now), dict(tournament.settings), tournament.entries, tournament.remaining_players, tournament.seating is not None, tournament.bounties is not None, tournament.structure_version)
+
+    def _update(self, tournament_id, apply):
+        # 変更はロック内で行い、通知はロックの外で行う (購読者から再度呼ばれてもデッドロックしない)
+        with self._lock:
+            tournament = self._get(tournament_id)
+            apply(tournament)
+            tournament.version += 1
+            snapshot = self._snapshot(tournament_id, tournament)
+            listeners = list(tournament.listeners)
+        for listener in listeners: listener(snapshot)
+        return snapshot
+
+    def snapshot(self, tournament_id, now=None):
+        with self._lock: return self._snapshot(tournament_id, self._get(tournament_id), now)
+
+    def tournament_ids(self):
+        with self._lock: return sorted(self._tournaments)
+
+    def publish_structure(self, tournament_id, structure_df, settings):
+        def apply(tournament):
+            tournament.structure_df = structure_df
+            tournament.clock = TournamentClock((structure_df['レベル時間 (分)'] * 60).tolist() if not structure_df.empty else [])
+            tournament.settings = dict(settings)
+            tournament.structure_version += 1
+        return self._update(tournament_id, apply)
+
+    def control(self, tournament_id, action, *args):
+        if action not in self.CLOCK_ACTIONS: raise ValueError(f"unknown clock action: {action}")
+        return self._update(tournament_id, lambda tournament: getattr(tournament.clock, action)(*args))
+
+    def set_players(self, tournament_id, entries=None, remaining_players=None):
+        def apply(tournament):
+            if entries is not None: tournament.entries = max(1, int(entries))
+            if remaining_players is not None: tournament.remaining_players = int(remaining_players)
+            tournament.remaining_players = min(max(1, tournament.remaining_players), tournament.entries)
+        return self._update(tournament_id, apply)
+
+    def start_seating(self, tournament_id, table_count, seats_per_table=9, seed=None):
+        def apply(tournament):
+            tournament.seating = SeatingChart(table_count, seats_per_table, seed)
+            self._sync_players(tournament)
+        return self._update(tournament_id, apply)
+
+    def seating_action(self, tournament_id, action, *args):
+        # 座席表の登録・敗退を行い、エントリー人数と残り人数を座席表から更新する。返り値は操作の結果 (座席・移動の指示)
+        if action not in self.SEATING_ACTIONS: raise ValueError(f"unknown seating action: {action}")
+        result = []
+        def apply(tournament):
+            if tournament.seating is None: raise ValueError("座席表がまだ作成されていません。")
+            # 台帳に登録できない名前 (敗退したプレイヤーなど) は、座席表を変える前に断る
+            if action == 'register' and tournament.bounties is not None and args[0] in tournament.bounties.cash_won: raise ValueError(f"{args[0]} はすでに登録されています。")
+            result.append(getattr(tournament.seating, action)(*args))
+            if action == 'register' and tournament.bounties is not None: tournament.bounties.add_player(args[0])
+            # 敗退したプレイヤーはバウンティ台帳からも外す (ノックアウトの相手に選べず、頭の上の合計にも含めない)
+            if action == 'bust' and tournament.bounties is not None and args[0] in tournament.bounties.heads: tournament.bounties.eliminate(args[0])
+            self._sync_players(tournament)
+        self._update(tournament_id, apply)
+        return result[0]
+
+    def seating_rows(self, tournament_id):
+        with self._lock:
+            seating = self._get(tournament_id).seating
+            return [] if seating is None else seating.table_rows()
+
+    def seated_players(self, tournament_id):
+        with self._lock:
+            seating = self._get(tournament_id).seating
+            return [] if seating is None else sorted(seating.player_seats, key=lambda player: seating.player_seats[player])
+
+    def registrations(self, tournament_id):
+        # 座席表に登録した人数 (敗退したプレイヤーも含む)
+        with self._lock:
+            seating = self._get(tournament_id).seating
+            return 0 if seating is None else seating.entries
+
+    def start_bounties(self, tournament_id, initial_bounty, progressive=True, players=()):
+        # KO/PKO のバウンティ台帳。座席表があれば着席中のプレイヤーを、なければ players を登録する
+        def apply(tournament):
+            ledger = BountyLedger(initial_bounty, progressive)
+            for player in (tournament.seating.player_seats if tournament.seating is not None else players): ledger.add_player(player)
+            tournament.bounties = ledger
+        return self._update(tournament_id, apply)
+
+    def record_knockout(self, tournament_id, eliminated, winners):
+        # ノックアウトを台帳に記録し、座席表があれば同時に敗退させる。返り値は (ノックアウトの記録, 座席の移動の指示)
+        result = []
+        def apply(tournament):
+            if tournament.bounties is None: raise ValueError("バウンティ台帳がまだ作成されていません。")
+            record = tournament.bounties.knockout(eliminated, winners)
+            moves = tournament.seating.bust(eliminated) if tournament.seating is not None and eliminated in tournament.seating.player_seats else []
+            if tournament.seating is not None: self._sync_players(tournament)
+            result.append((record, moves))
+        self._update(tournament_id, apply)
+        return result[0]
+
+    def finish_bounties(self, tournament_id, champion):
+        result = []
+        def apply(tournament):
+            if tournament.bounties is None: raise ValueError("バウンティ台帳がまだ作成されていません。")
+            result.append(tournament.bounties.finish(champion))
+        self._update(tournament_id, apply)
+        return result[0]
+
+    def bounty_summary(self, tournament_id, limit=10):
+        # 表示用: 合計額とランキング (台帳が差分で持っている値をそのまま返す)
+        with self._lock:
+            ledger = self._get(tournament_id).bounties
+            if ledger is None: return None
+            return {'progressive': ledger.progressive, 'initial_bounty': ledger.initial_bounty, 'remaining': sorted(ledger.heads), 'total_paid': ledger.total_paid, 'total_on_heads': ledger.total_on_heads, 'knockouts': len(ledger.history),
+                    'biggest_heads': ledger.biggest_heads(limit), 'top_earners': [(player, cash, ledger.knockout_counts[player]) for player, cash in ledger.top_earners(limit)]}
+
+    @staticmethod
+    def _sync_players(tournament):
+        tournament.entries = max(1, tournament.seating.entries)
+        tournament.remaining_players = min(max(1, tournament.seating.remaining), tournament.entries)
+
+    def subscribe(self, tournament_id, listener):
+        with self._lock: self._get(tournament_id).listeners.append(listener)
+        def unsubscribe():
+            with self._lock:
+                listeners = self._get(tournament_id).listeners
+                if listener in listeners: listeners.remove(listener)
+        return unsubscribe
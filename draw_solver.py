@@ -0,0 +1,124 @@
+from functools import lru_cache, partial
+from itertools import combinations, permutations
+from math import comb
+import numpy as np
+from hand_eval import evaluate_high, format_cards, sort_rows
+from low_eval import evaluate_27_low, evaluate_a5_low, evaluate_badugi, evaluate_hidugi, evaluate_pips_high, evaluate_pips_low, evaluate_archie_high, evaluate_archie_low
+
+# --- ドローゲームの最適なカードの捨て方 ---
+# 手の良さは「そのゲームの全ハンドの中で何割に勝つか」(0〜1、役が成立しなければ 0。
+# ハイ/ローのゲームは取り分ごとの平均) で測る。残りドロー数 r の手の価値 V_r は、
+# 全ハンド (C(52, 5) 通り) について「残すカードの組ごとに、補充後の V_{r-1} の平均の最大」を
+# 順に求めた表として一度だけ作る。実際の助言では、次のドローだけはデッドカードを除いた
+# 本当の山札で全通り数え、その先は表を引く。
+
+# ゲーム → (手札の枚数, 取り分ごとの判定関数)。ドローマハはドロー側の手だけを見る
+DRAW_GAMES = {
+    'Draw - Hi': (5, (evaluate_high,)),
+    'Draw - 27 lowball': (5, (evaluate_27_low,)),
+    'Draw - A5 lowball': (5, (evaluate_a5_low,)),
+    'Draw - Badugi': (4, (evaluate_badugi,)),
+    'Draw - Hi-dugi': (4, (evaluate_hidugi,)),
+    'Draw - Badacey': (5, (evaluate_high, evaluate_badugi)),
+    'Draw - Badeucey': (5, (evaluate_high, partial(evaluate_badugi, ace_low=False))),
+    'Draw - Archie': (5, (evaluate_archie_high, evaluate_archie_low)),
+    'Drawmaha - Hi': (5, (evaluate_high,)),
+    'Drawmaha - 27 lowball': (5, (evaluate_27_low,)),
+    'Drawmaha - A5 lowball': (5, (evaluate_a5_low,)),
+    'Drawmaha - Badugi': (5, (evaluate_badugi,)),
+    'Drawmaha - Hi-dugi': (5, (evaluate_hidugi,)),
+    'Drawmaha - 0': (5, (evaluate_pips_low,)),
+    'Drawmaha - 49': (5, (evaluate_pips_high,)),
+}
+MAX_DRAWS = 3
+
+# OFFSETS[i, c] = C(c, i + 1)。昇順のカード列の colex 番号は sum(OFFSETS[i, c_i])
+OFFSETS = np.array([[comb(c, i + 1) for c in range(52)] for i in range(5)], dtype=np.int32)
+
+@lru_cache(maxsize=None)
+def colex_hands(n):
+    # n 枚の全組み合わせを colex 順 (i 行目の番号が i) に並べた配列
+    if n == 0: return np.zeros((1, 0), dtype=np.int8)
+    hands = np.arange(52, dtype=np.int8)[:, None]
+    for k in range(2, n + 1):
+        hands = np.concatenate([np.column_stack([hands[:comb(top, k - 1)], np.full(comb(top, k - 1), top, dtype=np.int8)]) for top in range(k - 1, 52)])
+    return hands
+
+def colex_index(columns, length):
+    # 昇順に並んだカードの列 (列ごとの配列、長さ length) の colex 番号
+    index = np.zeros(length, dtype=np.int32)
+    for i, column in enumerate(columns): index += OFFSETS[i][column]
+    return index
+
+@lru_cache(maxsize=None)
+def strength_table(game):
+    # 全ハンドの強さ (同じ値のハンドは半分勝ちとして数えたパーセンタイル)
+    n, evaluators = DRAW_GAMES[game]
+    hands = colex_hands(n)
+    strength = np.zeros(len(hands))
+    for evaluator in evaluators:
+        values = evaluator(hands)
+        ordered = np.sort(values)
+        below, upto = np.searchsorted(ordered, values, 'left'), np.searchsorted(ordered, values, 'right')
+        strength += np.where(values > 0, (below + upto) / 2 / len(values), 0.0)
+    return (strength / len(evaluators)).astype(np.float32)
+
+def _kept_masks(n):
+    return [mask for size in range(n + 1) for mask in combinations(range(n), size)]
+
+@lru_cache(maxsize=None)
+def value_table(game, draws):
+    # 残り draws 回ドローできるときの全ハンドの価値 (最適に捨て続けた場合の強さの期待値)
+    if draws == 0: return strength_table(game)
+    n, _ = DRAW_GAMES[game]
+    hands, previous = colex_hands(n), value_table(game, draws - 1)
+    best = np.zeros(len(hands), dtype=np.float32)
+    for kept in _kept_masks(n):
+        # 残す組ごとに、それを含む全ハンドの V_{draws-1} の平均 (捨てたカードが戻る可能性は無視した近似)
+        index = colex_index([hands[:, i] for i in kept], len(hands))
+        sums = np.bincount(index, weights=previous, minlength=comb(52, len(kept)))
+        expected = (sums / comb(52 - len(kept), n - len(kept))).astype(np.float32)
+        best = np.maximum(best, expected[index])
+    return best
+
+def _canonical(hand, dead):
+    # スートを入れ替えた同じ状況をまとめるための表記と、その入れ替え (元のカード → 正規化後)
+    best = None
+    for perm in permutations(range(4)):
+        mapping = [(card & ~3) | perm[card & 3] for card in range(52)]
+        key = (tuple(sorted(mapping[c] for c in hand)), tuple(sorted(mapping[c] for c in dead)))
+        if best is None or key < best[0]: best = (key, mapping)
+    return best
+
+@lru_cache(maxsize=4096)
+def _solve_canonical(game, hand, dead, draws):
+    n, _ = DRAW_GAMES[game]
+    table = value_table(game, draws - 1)
+    deck = np.array([c for c in range(52) if c not in hand and c not in dead], dtype=np.int8)
+    results = []
+    for kept in _kept_masks(n):
+        kept_cards = [hand[i] for i in kept]
+        need = n - len(kept)
+        if need > len(deck): continue
+        # colex 順の先頭 C(len(deck), need) 行は、0〜len(deck)-1 から need 枚を選ぶ全通り
+        drawn = deck[colex_hands(need)[:comb(len(deck), need)]]
+        cards = np.concatenate([np.broadcast_to(np.array(kept_cards, dtype=np.int8), (len(drawn), len(kept))), drawn], axis=1)
+        values = table[colex_index(sort_rows(np.ascontiguousarray(cards.T)), len(cards))]
+        results.append((tuple(kept_cards), float(values.mean())))
+    return tuple(results)
+
+def solve_discards(game, hand, dead=(), draws=1):
+    # 全ての捨て方について、残りのドローを最適に行った場合の強さの期待値を返す (良い順)
+    n, _ = DRAW_GAMES[game]
+    if len(hand) != n: raise ValueError(f"{game} の手札は {n} 枚です。")
+    if not 1 <= draws <= MAX_DRAWS: raise ValueError(f"ドロー回数は 1〜{MAX_DRAWS} 回です。")
+    if len(set(hand) | set(dead)) != len(hand) + len(dead): raise ValueError("同じカードが重複しています。")
+    (canonical_hand, canonical_dead), mapping = _canonical(hand, dead)
+    inverse = {mapped: card for card, mapped in enumerate(mapping)}
+    rows = []
+    for kept, expected in _solve_canonical(game, canonical_hand, canonical_dead, draws):
+        kept_cards = [inverse[c] for c in kept]
+        discarded = [c for c in hand if c not in kept_cards]
+        kept_cards = [c for c in hand if c in kept_cards]
+        rows.append({'捨てる枚数': len(discarded), '捨てるカード': format_cards(discarded) or '(なし)', '残すカード': format_cards(kept_cards) or '(なし)', '期待値': expected})
+    return sorted(rows, key=lambda row: -row['期待値'])
@@ -0,0 +1,213 @@
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+from itertools import combinations, permutations
+import multiprocessing
+import numpy as np
+from low_eval import score_game
+
+# --- ピッケム用のエクイティ計算 ---
+# 残りの山札の配り方が少なければ全通りを数え、多ければプロセスプールでモンテカルロを回し、
+# エクイティの標準誤差が指定の精度を下回った時点で打ち切る。スートを入れ替えただけの
+# 同じ状況は同じ結果になるので、スートを正規化した入力をキーにして結果をキャッシュする。
+# 目安: 4人のダブルボード・オマハ (プリフロップ、約4万回で収束) は1ワーカーで1〜2秒 (Best/Best のほうが遅い)。
+# ワーカー数は既定で CPU のコア数なので、コアが多ければそのぶん短くなる。
+
+# ゲームごとの手札の枚数 (選択肢) とボードの数
+GAME_LAYOUTS = {
+    'Holdem - Normal': ((2,), 1), 'Holdem - Super': ((3,), 1),
+    'Drawmaha - Hi': ((5,), 1), 'Drawmaha - 27 lowball': ((5,), 1), 'Drawmaha - A5 lowball': ((5,), 1), 'Drawmaha - Badugi': ((5,), 1),
+    'Drawmaha - Hi-dugi': ((5,), 1), 'Drawmaha - 0': ((5,), 1), 'Drawmaha - 49': ((5,), 1),
+    'Draw - Hi': ((5,), 0), 'Draw - 27 lowball': ((5,), 0), 'Draw - A5 lowball': ((5,), 0), 'Draw - Badugi': ((4,), 0), 'Draw - Hi-dugi': ((4,), 0),
+    'Draw - Badacey': ((5,), 0), 'Draw - Badeucey': ((5,), 0), 'Draw - Archie': ((5,), 0),
+    'Omaha - Double Board Hi/Hi (4 or 5枚)': ((4, 5), 2), 'Omaha - Double Board Best/Best (4 or 5枚)': ((4, 5), 2),
+    'Stud - Stud': ((7,), 0), 'Stud - Stud H/L8': ((7,), 0), 'Stud - Super Stud': ((7,), 0), 'Stud - Super Stud H/L8': ((7,), 0),
+    'Stud - Razz': ((7,), 0), 'Stud - Super Razz': ((7,), 0),
+}
+BOARD_SIZE = 5
+
+# 判定の列 (ポットの取り分) の名前。書いていないゲームは1列で、ポット全体を争う
+PART_NAMES = {
+    'Drawmaha - Hi': ('ドロー', 'オマハ'), 'Drawmaha - 27 lowball': ('ドロー', 'オマハ'), 'Drawmaha - A5 lowball': ('ドロー', 'オマハ'),
+    'Drawmaha - Badugi': ('ドロー', 'オマハ'), 'Drawmaha - Hi-dugi': ('ドロー', 'オマハ'), 'Drawmaha - 0': ('ドロー', 'オマハ'), 'Drawmaha - 49': ('ドロー', 'オマハ'),
+    'Draw - Badacey': ('ハイ', 'バドゥギ'), 'Draw - Badeucey': ('ハイ', 'バドゥギ'), 'Draw - Archie': ('ハイ', 'ロー'),
+    'Omaha - Double Board Hi/Hi (4 or 5枚)': ('ボード1', 'ボード2'),
+    'Omaha - Double Board Best/Best (4 or 5枚)': ('ボード1 ハイ', 'ボード1 ロー', 'ボード2 ハイ', 'ボード2 ロー'),
+    'Stud - Stud H/L8': ('ハイ', 'ロー'), 'Stud - Super Stud H/L8': ('ハイ', 'ロー'),
+}
+
+# ポットをまず等分する単位 (列番号のまとまり)。同じまとまりの中で成立しなかった列の分は
+# 成立した列に回り、どの列も成立しなければショーダウンした全員でチョップする
+PART_GROUPS = {
+    'Omaha - Double Board Hi/Hi (4 or 5枚)': ((0,), (1,)),
+    'Omaha - Double Board Best/Best (4 or 5枚)': ((0, 1), (2, 3)),
+}
+
+EXACT_LIMIT = 100_000  # 配り方がこれ以下なら全列挙する
+BATCH_TRIALS = 20_000  # モンテカルロの1タスクあたりの試行回数
+DEFAULT_PRECISION = 0.002  # エクイティの標準誤差の目標
+DEFAULT_MAX_TRIALS = 2_000_000
+
+def part_names(game):
+    return PART_NAMES.get(game, ('ポット',))
+
+def part_groups(game):
+    return PART_GROUPS.get(game, (tuple(range(len(part_names(game)))),))
+
+def pot_shares(values, groups):
+    # values: (試行, プレイヤー, 列)。返り値は各プレイヤーのポットの取り分 (試行, プレイヤー) と、
+    # 各列を何割取ったか (試行, プレイヤー, 列 ― 成立しなかった列は誰も取らない)
+    best = values.max(axis=1, keepdims=True)
+    qualified = best > 0
+    winners = (values == best) & qualified
+    part_wins = winners / np.maximum(winners.sum(axis=1, keepdims=True), 1)
+    players = values.shape[1]
+    shares = np.zeros(values.shape[:2])
+    for group in groups:
+        group = list(group)
+        qualified_parts = qualified[:, :, group].sum(axis=2)
+        won = part_wins[:, :, group].sum(axis=2) / np.maximum(qualified_parts, 1)
+        shares += np.where(qualified_parts > 0, won, 1 / players) / len(groups)
+    return shares, part_wins
+
+def _showdown(game, hands, boards):
+    # hands: (試行, プレイヤー, 手札)、boards: (試行, ボード枚数) または None
+    values = np.stack([score_game(game, hands[:, k], boards) for k in range(hands.shape[1])], axis=1)
+    return pot_shares(values, part_groups(game))
+
+def _slots(hands, boards, hole_count, board_count):
+    # 既知のカードを並べた配列と、未知の位置 (-1) の数
+    rows = [list(hand) + [-1] * (hole_count - len(hand)) for hand in hands]
+    board = [card for b in range(board_count) for card in (list(boards[b]) if b < len(boards) else []) + [-1] * (BOARD_SIZE - (len(boards[b]) if b < len(boards) else 0))]
+    return np.array(rows, dtype=np.int16), np.array(board, dtype=np.int16)
+
+def _fill(hand_slots, board_slots, dealt):
+    # 未知の位置に dealt (試行, 未知の枚数) の列を順に入れる
+    trials = len(dealt)
+    hands = np.broadcast_to(hand_slots, (trials,) + hand_slots.shape).copy()
+    board = np.broadcast_to(board_slots, (trials,) + board_slots.shape).copy()
+    hand_unknown, board_unknown = np.argwhere(hand_slots < 0), np.flatnonzero(board_slots < 0)
+    for column, (k, i) in enumerate(hand_unknown): hands[:, k, i] = dealt[:, column]
+    board[:, board_unknown] = dealt[:, len(hand_unknown):]
+    return hands, board if board_slots.size else None
+
+def _remaining_deck(hand_slots, board_slots, dead):
+    known = set(hand_slots[hand_slots >= 0].tolist()) | set(board_slots[board_slots >= 0].tolist()) | set(dead)
+    return np.array([card for card in range(52) if card not in known], dtype=np.int16)
+
+def _group_sizes(hand_slots, board_slots):
+    # 順番に意味のない未知のカードのまとまり (プレイヤーごとの手札、ボードごと)
+    sizes = [int((row < 0).sum()) for row in hand_slots]
+    sizes += [int((board_slots[b:b + BOARD_SIZE] < 0).sum()) for b in range(0, board_slots.size, BOARD_SIZE)]
+    return sizes
+
+def count_deals(deck_size, sizes):
+    total, remaining = 1, deck_size
+    for size in sizes:
+        total *= math.comb(remaining, size)
+        remaining -= size
+    return total
+
+def _enumerate_deals(deck, sizes):
+    # 各まとまりに山札から組み合わせを割り当てる全通り (重なるものは除く)
+    deals = np.zeros((1, 0), dtype=np.int16)
+    for size in sizes:
+        if size == 0: continue
+        options = np.array(list(combinations(deck.tolist(), size)), dtype=np.int16)
+        left = np.repeat(deals, len(options), axis=0)
+        right = np.tile(options, (len(deals), 1))
+        merged = np.concatenate([left, right], axis=1)
+        overlap = (left[:, :, None] == right[:, None, :]).any(axis=(1, 2))
+        deals = merged[~overlap]
+    return deals
+
+def _monte_carlo_batch(game, hand_slots, board_slots, dead, trials, seed):
+    # 1タスク分: 取り分の合計・二乗和・列ごとの合計を返す (プロセスプールから呼ばれる)
+    deck = _remaining_deck(hand_slots, board_slots, dead)
+    unknown = int((hand_slots < 0).sum() + (board_slots < 0).sum())
+    rng = np.random.default_rng(seed)
+    dealt = deck[rng.random((trials, len(deck))).argsort(axis=1)[:, :unknown]]
+    shares, part_wins = _showdown(game, *_fill(hand_slots, board_slots, dealt))
+    return shares.sum(axis=0), (shares ** 2).sum(axis=0), part_wins.sum(axis=0)
+
+@lru_cache(maxsize=None)
+def _pool(workers):
+    # Streamlit のサーバープロセスを fork しないよう spawn で起動し、使い回す
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+def _run_monte_carlo(game, hand_slots, board_slots, dead, precision, max_trials, workers, seed):
+    seeds = np.random.SeedSequence(seed)
+    players, parts = hand_slots.shape[0], len(part_names(game))
+    total, total_sq, part_total, trials = np.zeros(players), np.zeros(players), np.zeros((players, parts)), 0
+
+    def converged():
+        if trials < 2 * BATCH_TRIALS: return False
+        mean = total / trials
+        return float(np.sqrt(np.max(total_sq / trials - mean ** 2) / trials)) <= precision
+
+    def add(result):
+        nonlocal total, total_sq, part_total, trials
+        total, total_sq, part_total, trials = total + result[0], total_sq + result[1], part_total + result[2], trials + BATCH_TRIALS
+
+    if workers <= 1:
+        while trials < max_trials and not converged():
+            add(_monte_carlo_batch(game, hand_slots, board_slots, dead, BATCH_TRIALS, seeds.spawn(1)[0]))
+    else:
+        pool, pending, submitted = _pool(workers), set(), 0
+        def submit():
+            nonlocal submitted
+            pending.add(pool.submit(_monte_carlo_batch, game, hand_slots, board_slots, dead, BATCH_TRIALS, seeds.spawn(1)[0]))
+            submitted += BATCH_TRIALS
+        for _ in range(workers * 2):
+            if submitted < max_trials: submit()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done: add(future.result())
+            if converged():
+                for future in pending: future.cancel()
+                break
+            while len(pending) < workers * 2 and submitted < max_trials: submit()
+    mean = total / trials
+    return mean, part_total / trials, trials, float(np.sqrt(np.max(total_sq / trials - mean ** 2) / trials))
+
+def canonical_key(hands, boards, dead):
+    # スートの入れ替え (24通り) のうち、辞書順で最小になる表記。手札・ボードの中の順番は無視する
+    best = None
+    for perm in permutations(range(4)):
+        mapping = [(card & ~3) | perm[card & 3] for card in range(52)]
+        key = (tuple(tuple(sorted(mapping[c] for c in hand)) for hand in hands),
+               tuple(tuple(sorted(mapping[c] for c in board)) for board in boards),
+               tuple(sorted(mapping[c] for c in dead)))
+        if best is None or key < best: best = key
+    return best
+
+@lru_cache(maxsize=256)
+def _cached_equity(game, hole_count, key, precision, max_trials, workers):
+    hands, boards, dead = key
+    _, board_count = GAME_LAYOUTS[game]
+    hand_slots, board_slots = _slots(hands, boards, hole_count, board_count)
+    deck = _remaining_deck(hand_slots, board_slots, dead)
+    sizes = _group_sizes(hand_slots, board_slots)
+    if sum(sizes) > len(deck): raise ValueError("残りの山札が足りません。")
+    deals = count_deals(len(deck), sizes)
+    if deals <= EXACT_LIMIT:
+        dealt = _enumerate_deals(deck, sizes)
+        shares, part_wins = _showdown(game, *_fill(hand_slots, board_slots, dealt))
+        return {'method': '全列挙', 'trials': len(dealt), 'equity': shares.mean(axis=0), 'parts': part_wins.mean(axis=0), 'std_error': 0.0}
+    equity, parts, trials, std_error = _run_monte_carlo(game, hand_slots, board_slots, dead, precision, max_trials, workers, None)
+    return {'method': 'モンテカルロ', 'trials': trials, 'equity': equity, 'parts': parts, 'std_error': std_error}
+
+def calculate_equity(game, hands, boards=(), dead=(), hole_count=None, precision=DEFAULT_PRECISION, max_trials=DEFAULT_MAX_TRIALS, workers=None):
+    # hands: プレイヤーごとの既知のカードのリスト (足りない分は山札から配る)。boards: ボードごとの既知のカード
+    hole_options, board_count = GAME_LAYOUTS[game]
+    hole_count = hole_count or hole_options[0]
+    if hole_count not in hole_options: raise ValueError(f"{game} の手札は {hole_options} 枚です。")
+    if len(hands) < 2: raise ValueError("プレイヤーは2人以上必要です。")
+    if any(len(hand) > hole_count for hand in hands): raise ValueError(f"手札は {hole_count} 枚までです。")
+    if len(boards) > board_count or any(len(board) > BOARD_SIZE for board in boards): raise ValueError("ボードのカードが多すぎます。")
+    cards = [c for hand in hands for c in hand] + [c for board in boards for c in board] + list(dead)
+    if len(set(cards)) != len(cards): raise ValueError("同じカードが重複しています。")
+    boards = list(boards) + [[]] * (board_count - len(boards))
+    workers = workers or os.cpu_count() or 1
+    return _cached_equity(game, hole_count, canonical_key(hands, boards, dead), precision, max_trials, workers)
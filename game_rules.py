@@ -0,0 +1,174 @@
+# --- ゲームルール辞書 ---
+GAME_RULES = {
+    'Holdem - Normal': """
+    **Holdem - Normalのルール:**
+    * 各プレイヤーに2枚のホールカードが配られます。
+    * コミュニティカードとして5枚のカードがボードに公開されます。
+    * プレイヤーは、手札2枚とボードの5枚の中から任意の5枚を組み合わせて最も強い役を作ります。
+    * ベットラウンドは、プリフロップ、フロップ、ターン、リバーの計4回あります。
+    """,
+    'Holdem - Super': """
+    **Holdem - Superのルール:**
+    * 各プレイヤーに3枚のホールカードが配られます。
+    * コミュニティカードとして5枚のカードがボードに公開されます。
+    * プレイヤーは、手札3枚の中から**必ず2枚**と、ボードの5枚の中から任意の3枚を組み合わせて最も強い役を作ります。
+    * ベットラウンドは、プリフロップ、フロップ、ターン、リバーの計4回あります。
+    """,
+    'Drawmaha - Hi': """
+    **Drawmaha - Hiのルール:**
+    * オマハとファイブカードドローを組み合わせたゲームで、ハイハンドのみで勝敗を競います。
+    * プレイヤーは、4枚の手札と5枚のコミュニティカードを使います。
+    * コミュニティカードが公開される前に、手札の一部を交換（ドロー）することができます。
+    """,
+    'Drawmaha - 27 lowball': """
+    **Drawmaha - 27 lowballのルール:**
+    * オマハとドローポーカーを組み合わせたゲームで、2-7ローボールのルールで勝敗を競います。
+    * 7-2ローボールでは、ストレートやフラッシュはローハンドの妨げになり、エースはハイカードとして扱われます。
+    * ポットは最も低い役のプレイヤーが獲得します。
+    """,
+    'Drawmaha - A5 lowball': """
+    **Drawmaha - A5 lowballのルール:**
+    * オマハとドローポーカーを組み合わせたゲームで、A-5ローボールのルールで勝敗を競います。
+    * A-5ローボールでは、ストレートやフラッシュはローハンドの妨げにならず、エースは最も弱いカード（ローカード）として扱われます。
+    * ポットは最も低い役のプレイヤーが獲得します。
+    """,
+    'Drawmaha - Badugi': """
+    **Drawmaha - Badugiのルール:**
+    * オマハとファイブカードドローを組み合わせたゲームで、バドゥギハンドのみで勝敗を競います。
+    * バドゥギとは、スートもランクも重複しない4枚のカードで構成される役です。最も強いバドゥギが勝ちとなります。
+    """,
+    'Drawmaha - Hi-dugi': """
+    **Drawmaha - Hi-dugiのルール:**
+    * 4枚の手札で役の強さを競う、バドゥーギの亜種です。
+    * **ルール:** スートの重複は禁止されますが、**数字の重複は許されます**。
+    * **役の強さ（ハイハンド）:** ハイカード < ワンペア < ツーペア < スリーカード < フォーカード の順に強くなります。
+    * 5枚役（ストレート、フラッシュ）はありません。AはKよりも強いカードです。
+    * 最強の役は、スートが全て異なるA4枚のフォーカード（AAAA）です。
+    * 最弱の役は、スートが全て異なる2, 3, 4, 5のハイカードです。
+    """,
+    'Drawmaha - 0': """
+    **Drawmaha - 0のルール:**
+    * オマハホールデムとファイブカードドローを組み合わせたゲームで、手札の数値が低い人が勝利となります。
+    * ナッツ（最強の役）はオールピクチャー（K, Q, J, T）で構成される役となります。
+    """,
+    'Drawmaha - 49': """
+    **Drawmaha - 49のルール:**
+    * オマハホールデムとファイブカードドローを組み合わせたゲームで、手札の数値が高いプレイヤーが勝利となります。
+    * ピクチャーカードは0扱いとなります。
+    * ナッツ（最強の役）はTTTT9となります。
+    """,
+    'Draw - Hi': """
+    **Draw - Hiのルール:**
+    * 手札の交換（ドロー）によって、通常のポーカーの最も強い役（ハイハンド）を目指すゲームです。
+    * 各プレイヤーに5枚の手札が配られ、ドローラウンドで手札を交換することができます。コミュニティカードは使用しません。
+    """,
+    'Draw - 27 lowball': """
+    **Draw - 27 lowballのルール:**
+    * 5枚の手札が配られ、ドローラウンドで手札を交換できるドローポーカーです。
+    * 2-7ローボールのルールで勝敗を競います。ストレートやフラッシュはローハンドの妨げになり、エースはハイカードとして扱われます。
+    * ポットは最も低い役のプレイヤーが獲得します。
+    """,
+    'Draw - A5 lowball': """
+    **Draw - A5 lowballのルール:**
+    * 5枚の手札が配られ、ドローラウンドで手札を交換できるドローポーカーです。
+    * A-5ローボールのルールで勝敗を競います。ストレートやフラッシュはローハンドの妨げにならず、エースは最も弱いカードとして扱われます。
+    * ポットは最も低い役のプレイヤーが獲得します。
+    """,
+    'Draw - Badugi': """
+    **Draw - Badugiのルール:**
+    * バドゥギハンド（スートとランクが重複しない4枚のカード）のみで勝敗を競うドローポーカーです。
+    * 各プレイヤーに4枚の手札が配られ、ドローラウンドで手札を交換できます。
+    """,
+    'Draw - Hi-dugi': """
+    **Draw - Hi-dugiのルール:**
+    * 4枚の手札で役の強さを競う、バドゥーギの亜種です。
+    * **ルール:** スートの重複は禁止されますが、**数字の重複は許されます**。
+    * **役の強さ（ハイハンド）:** ハイカード < ワンペア < ツーペア < スリーカード < フォーカード の順に強くなります。
+    * 5枚役（ストレート、フラッシュ）はありません。AはKよりも強いカードです。
+    * 最強の役は、スートが全て異なるA4枚のフォーカード（AAAA）です。
+    * 最弱の役は、スートが全て異なる2, 3, 4, 5のハイカードです。
+    """,
+    'Draw - Badacey': """
+    **Draw - Badaceyのルール:**
+    * 5枚の手札でプレイする、ドローポーカーのハイ/ローゲームです。
+    * **ローハンド:** バドゥギハンドのルール（スートとランクが重複しない4枚）で最も低い役を目指します。エースは最も弱いカード（ローカード）として扱われます。
+    * **ハイハンド:** 通常のポーカーの役で最も強い役を目指します。
+    * ポットはローハンドとハイハンドの勝者で分け合われます。
+    """,
+    'Draw - Badeucey': """
+    **Draw - Badeuceyのルール:**
+    * 5枚の手札でプレイする、ドローポーカーのハイ/ローゲームです。
+    * **ローハンド:** バドゥギハンドのルール（スートとランクが重複しない4枚）で最も低い役を目指します。2が最も弱いカード（ローカード）として扱われます。
+    * **ハイハンド:** 通常のポーカーの役で最も強い役を目指します。
+    * ポットはローハンドとハイハンドの勝者で分け合われます。
+    """,
+    'Draw - Archie': """
+    **Draw - Archieのルール:**
+    * 5枚の手札でプレイする、ハイハンドとローハンドでポットを分け合う「フィックスドリミット・トリプルドロー」形式のゲームです。
+    * **ゲームの流れ:**
+        * 最初に5枚の手札が配られ、3回のベットラウンドと、間に3回の手札交換（ドロー）の機会があります。
+    * **勝敗の決定:**
+        * ショーダウン時には、ハイハンドとローハンドの2つの役でポットを分け合います。
+    * **ハイハンドの成立条件:**
+        * 役が「9ペア」以上の場合のみ、ハイハンドでポットを獲得できます。
+        * 9ペア未満の役（例：ハイカード、8ペアなど）は、ハイハンドではポットを獲得できません。
+    * **ローハンドの成立条件:**
+        * 5枚の異なるカードがすべて8以下（エースを含む）で構成されている場合のみ、ローハンドでポットを獲得できます。
+        * ローハンドはA-5（エースが最も弱い）ルールで競われます。
+    * **ポットの行方:**
+        * 誰もハイハンド・ローハンドともに成立しなかった場合、ショーダウンしたプレイヤー全員でポットを均等に分け合います（チョップ）。
+    """,
+    'Omaha - Double Board Hi/Hi (4 or 5枚)': """
+    **Omaha - Double Board Hi/Hi (4 or 5枚)のルール:**
+    * 2つの異なるボード（コミュニティカード）が用意されるオマハです。
+    * プレイヤーは、それぞれのボードで最も強いハイハンドを作ります。
+    * 2つのボードそれぞれの勝者がポットを分け合います。
+    """,
+    'Omaha - Double Board Best/Best (4 or 5枚)': """
+    **Omaha - Double Board Best/Best (4 or 5枚)のルール:**
+    * 2つの異なるボードが用意されるオマハで、ハイハンドとローハンドでポットを分け合います。
+    * 各ボードで最も強い役（ハイハンド）と最も低い役（ローハンド）を作り、それぞれでポットを分け合います。
+    """,
+    'Stud - Stud': """
+    **Stud - Studのルール:**
+    * 7枚の手札を使い、最も強いハイハンドを目指すポーカーです。
+    * 最初は2枚のホールカードと1枚のオープンカードが配られます。
+    * その後、3回のベットラウンドを通じて追加のオープンカードが配られ、最終的に7枚の手札の中から最も強い5枚のハイハンドを作ります。
+    """,
+    'Stud - Stud H/L8': """
+    **Stud - Stud H/L8のルール:**
+    * セブンカードスタッドのハイ/ロースプリット（H/L8）形式です。
+    * 7枚の最終手札の中からベストな5枚を使用して、最高のハイハンドと、8以下のカードで構成された最高のローハンド（A-5ルール）を競い、ポットをスプリットします。
+    * ローハンドとして認められるには、5枚の異なるカードがすべて8以下（エースを含む）で構成されている必要があります。
+    """,
+    'Stud - Super Stud': """
+    **Stud - Super Studのルール:**
+    * ゲームはセブンカードスタッド形式で進行します。
+    * 最初にプレイヤーには4枚のホールカードが配られます。
+    * その中から2枚を破棄（ディスカード）し、残された2枚の手札でゲームをプレイします。
+    """,
+    'Stud - Super Stud H/L8': """
+    **Stud - Super Stud H/L8のルール:**
+    * ゲームはセブンカードスタッドのハイ/ロースプリット（H/L8）形式で進行します。
+    * 最初にプレイヤーには4枚のホールカードが配られ、その中から2枚を破棄（ディスカード）します。
+    * 7枚の最終手札の中からベストな5枚を使用して、最高のハイハンドと、8以下のカードで構成された最高のローハンド（A-5ルール）を競い、ポットをスプリットします。
+    * ローハンドとして認められるには、8以下のカード（Aを含む）のみで役を構成する必要があります。
+    """,
+    'Stud - Razz': """
+    **Stud - Razzのルール:**
+    * セブンカードスタッド形式で、最も低い役（ローハンド）を作ったプレイヤーが勝者となります。
+    * エースは最も弱いカード（ローカード）として扱われ、ストレートやフラッシュはローハンドの妨げになりません。
+    * 役の強さは、高いカードから順に比較します（ハイカードの逆）。
+    * 最強の役（ナッツ）は、5-4-3-2-Aの異なるスートの組み合わせです。
+    """,
+    'Stud - Super Razz': """
+    **Stud - Super Razzのルール:**
+    * Razzの亜種で、最初に4枚のホールカードが配られます。
+    * プレイヤーはその中から2枚を破棄（ディスカード）し、残った2枚と後から配られるオープンカードを使って、最も低い役（ローハンド）を作ります。
+    * エースは最も弱いカードとして扱われ、ストレートやフラッシュはローハンドの妨げになりません。
+    """
+}
+
+# ピッケムで選べるゲームと、MIXに追加できるゲーム (ルールが登録されているもの)
+PICKEM_GAMES = ('Holdem - Normal', 'Holdem - Super', 'Drawmaha - Hi', 'Drawmaha - 27 lowball', 'Drawmaha - A5 lowball', 'Drawmaha - Badugi', 'Drawmaha - Hi-dugi', 'Drawmaha - 0', 'Drawmaha - 49', 'Draw - Hi', 'Draw - 27 lowball', 'Draw - A5 lowball', 'Draw - Badugi', 'Draw - Hi-dugi', 'Draw - Badacey', 'Draw - Badeucey', 'Draw - Archie', 'Omaha - Double Board Hi/Hi (4 or 5枚)', 'Omaha - Double Board Best/Best (4 or 5枚)', 'Stud - Stud', 'Stud - Stud H/L8', 'Stud - Super Stud', 'Stud - Super Stud H/L8', 'Stud - Razz', 'Stud - Super Razz')
+MIX_GAMES = tuple(sorted(GAME_RULES))
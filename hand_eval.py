@@ -0,0 +1,205 @@
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from math import comb
+import numpy as np
+
+# --- ハイハンドの役判定 ---
+# カードは 0〜51 の整数 (ランク * 4 + スート、ランクは 0=2 … 12=A) で表す。
+# 役の強さは整数で返し、値が大きいほど強い (役の種類 << 20 | キッカー5枚を4ビットずつ)。
+# フラッシュ以外はランクの多重集合から、フラッシュはスートごとのランクのビット列から
+# 事前計算した表を引くだけなので、numpy の配列で何百万ハンドでも一度に判定できる。
+
+RANKS = '23456789TJQKA'
+SUITS = 'cdhs'
+HIGH_CARD, ONE_PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT, FLUSH, FULL_HOUSE, FOUR_OF_A_KIND, STRAIGHT_FLUSH = range(9)
+CATEGORY_NAMES = ('ハイカード', 'ワンペア', 'ツーペア', 'スリーカード', 'ストレート', 'フラッシュ', 'フルハウス', 'フォーカード', 'ストレートフラッシュ')
+
+def parse_cards(text):
+    # "AsKd 7h" のような表記をカード番号のリストにする
+    text = ''.join(text.split())
+    if len(text) % 2: raise ValueError(f"カードの表記が正しくありません: {text}")
+    cards = []
+    for i in range(0, len(text), 2):
+        rank, suit = text[i].upper(), text[i + 1].lower()
+        if rank not in RANKS or suit not in SUITS: raise ValueError(f"カードの表記が正しくありません: {text[i:i + 2]}")
+        cards.append(RANKS.index(rank) * 4 + SUITS.index(suit))
+    if len(set(cards)) != len(cards): raise ValueError("同じカードが重複しています。")
+    return cards
+
+def format_cards(cards):
+    return ''.join(RANKS[c >> 2] + SUITS[c & 3] for c in cards)
+
+def _encode(category, ranks):
+    value = category
+    for i in range(5): value = (value << 4) | (ranks[i] if i < len(ranks) else 0)
+    return value
+
+def category_of(value):
+    return int(value) >> 20
+
+def _straight_high(mask):
+    # ビット列に含まれる最も高いストレートの最上位ランク (A-5 は 3)。なければ -1
+    for high in range(12, 3, -1):
+        if (mask >> (high - 4)) & 0b11111 == 0b11111: return high
+    if mask & 0b1000000001111 == 0b1000000001111: return 3
+    return -1
+
+def _rank_only_value(counts):
+    # フラッシュを考えない場合の最強の5枚 (counts: ランクごとの枚数)
+    present = [r for r in range(12, -1, -1) if counts[r] > 0]
+    quads = [r for r in present if counts[r] >= 4]
+    trips = [r for r in present if counts[r] >= 3]
+    pairs = [r for r in present if counts[r] >= 2]
+    if quads: return _encode(FOUR_OF_A_KIND, [quads[0]] + [r for r in present if r != quads[0]][:1])
+    if trips:
+        full = [r for r in pairs if r != trips[0]]
+        if full: return _encode(FULL_HOUSE, [trips[0], full[0]])
+    mask = sum(1 << r for r in present)
+    high = _straight_high(mask)
+    if high >= 0: return _encode(STRAIGHT, [high])
+    if trips: return _encode(THREE_OF_A_KIND, [trips[0]] + [r for r in present if r != trips[0]][:2])
+    if len(pairs) >= 2: return _encode(TWO_PAIR, pairs[:2] + [r for r in present if r not in pairs[:2]][:1])
+    if pairs: return _encode(ONE_PAIR, [pairs[0]] + [r for r in present if r != pairs[0]][:3])
+    return _encode(HIGH_CARD, present[:5])
+
+@lru_cache(maxsize=None)
+def flush_table():
+    # 13ビットのランク列 → そのスートで作れるフラッシュ/ストレートフラッシュの強さ (5枚未満は0)
+    table = np.zeros(1 << 13, dtype=np.int32)
+    for mask in range(1 << 13):
+        if bin(mask).count('1') < 5: continue
+        high = _straight_high(mask)
+        if high >= 0: table[mask] = _encode(STRAIGHT_FLUSH, [high])
+        else: table[mask] = _encode(FLUSH, [r for r in range(12, -1, -1) if mask >> r & 1][:5])
+    return table
+
+@lru_cache(maxsize=None)
+def comb_table():
+    # COMB[x, k] = C(x, k) (多重集合の番号付けに使う)
+    return np.array([[comb(x, k) for k in range(8)] for x in range(20)], dtype=np.int32)
+
+@lru_cache(maxsize=None)
+def _position_offsets(n):
+    # 昇順 i 番目のランク r の寄与 C(r + i, i + 1)。足し合わせると重複組合せの通し番号になる
+    return [comb_table()[np.arange(13) + i, i + 1] for i in range(n)]
+
+@lru_cache(maxsize=None)
+def _chunk_offsets(n):
+    # 3枚ずつまとめた寄与の表 (キーは 13進で並べたランク)。表引きの回数を 1/3 にする
+    offsets = _position_offsets(n)
+    chunks = []
+    for start in range(0, n, 3):
+        table = np.zeros(1, dtype=np.int32)
+        for offset in offsets[start:start + 3]: table = (table[:, None] + offset[None, :]).ravel()
+        chunks.append(table)
+    return chunks
+
+def multiset_index(sorted_rows):
+    # 昇順に並んだランクの行 (各行が N 個) から、重複組合せの通し番号を求める
+    index = 0
+    for chunk, start in zip(_chunk_offsets(len(sorted_rows)), range(0, len(sorted_rows), 3)):
+        key = sorted_rows[start].astype(np.int16)
+        for row in sorted_rows[start + 1:start + 3]: key = key * 13 + row
+        index = index + chunk[key]
+    return index
+
+@lru_cache(maxsize=None)
+def rank_table(n, value_function=_rank_only_value):
+    # n 枚のランクの多重集合 → value_function の値 (同じランクが5枚以上の組は使われない)
+    table = np.zeros(comb(13 + n - 1, n), dtype=np.int32)
+    offsets = _position_offsets(n)
+    for ranks in combinations_with_replacement(range(13), n):
+        counts = [0] * 13
+        for r in ranks: counts[r] += 1
+        if max(counts) > 4: continue
+        table[sum(int(offsets[i][r]) for i, r in enumerate(ranks))] = value_function(counts)
+    return table
+
+# 列の並べ替え (比較交換の組) ― 行ごとの np.sort より速い
+_SORTING_NETWORKS = {
+    1: [], 2: [(0, 1)], 3: [(0, 1), (1, 2), (0, 1)],
+    4: [(0, 1), (2, 3), (0, 2), (1, 3), (1, 2)],
+    5: [(0, 1), (3, 4), (2, 4), (2, 3), (1, 4), (0, 3), (0, 2), (1, 3), (1, 2)],
+    6: [(1, 2), (4, 5), (0, 2), (3, 5), (0, 1), (3, 4), (2, 5), (0, 3), (1, 4), (2, 4), (1, 3), (2, 3)],
+    7: [(1, 2), (3, 4), (5, 6), (0, 2), (3, 5), (4, 6), (0, 1), (4, 5), (2, 6), (0, 4), (1, 5), (0, 3), (2, 5), (1, 3), (2, 4), (2, 3)],
+}
+
+def sort_rows(rows):
+    rows = list(rows)
+    for a, b in _SORTING_NETWORKS[len(rows)]:
+        rows[a], rows[b] = np.minimum(rows[a], rows[b]), np.maximum(rows[a], rows[b])
+    return rows
+
+_RANK_BIT = np.array([1 << (card >> 2) for card in range(52)], dtype=np.int32)
+
+@lru_cache(maxsize=None)
+def _flush_suit_table():
+    # スートごとの枚数 (4ビットずつ) → 5枚以上あるスート (なければ -1)
+    packed = np.arange(1 << 16)
+    table = np.full(1 << 16, -1, dtype=np.int8)
+    for suit in range(4): table[(packed >> (4 * suit)) & 15 >= 5] = suit
+    return table
+
+def evaluate_high(cards):
+    # cards: (N, n) の整数配列 (5 <= n <= 7)。n 枚から作れる最強の5枚の強さ (N,)
+    return evaluate_with_tables(cards, _rank_only_value, flush_table())
+
+def evaluate_with_tables(cards, rank_value, flushes):
+    # ランクの多重集合の値 rank_value と、フラッシュの表 flushes (13ビットのランク列 → 値) で判定する
+    cards = np.asarray(cards)
+    if cards.ndim == 1: cards = cards[None, :]
+    rows = np.ascontiguousarray(cards.T, dtype=np.int8)  # 1枚目、2枚目 … ごとに連続した配列
+    values = rank_table(len(rows), rank_value)[multiset_index(sort_rows(rows >> 2))]
+    # スートごとの枚数を4ビットずつ詰めて数える
+    suit_count = np.zeros(rows.shape[1], dtype=np.uint16)
+    for row in rows: suit_count += np.left_shift(np.uint16(1), ((row & 3) << 2).astype(np.uint16))
+    flush_suit = _flush_suit_table()[suit_count]
+    flush_rows = np.flatnonzero(flush_suit >= 0)
+    if len(flush_rows):
+        # フラッシュのある行だけ、そのスートのランクのビット列を作る
+        suit, mask = flush_suit[flush_rows], 0
+        for row in rows[:, flush_rows]: mask = mask + np.where(row & 3 == suit, _RANK_BIT[row], 0)
+        values[flush_rows] = np.maximum(values[flush_rows], flushes[mask])
+    return values
+
+@lru_cache(maxsize=None)
+def _choice_indices(hole_count, hole_use, board_count, board_use):
+    # 手札から hole_use 枚・ボードから board_use 枚を選ぶ全ての組み合わせ (連結後の列番号)
+    return np.array([list(h) + [hole_count + b for b in bd] for h in combinations(range(hole_count), hole_use) for bd in combinations(range(board_count), board_use)], dtype=np.int64)
+
+def evaluate_exact_use(hole, board, hole_use, board_use, evaluator=evaluate_high):
+    # 手札からちょうど hole_use 枚、ボードからちょうど board_use 枚を使う役 (オマハ、ホールデム Super)
+    hole, board = np.atleast_2d(np.asarray(hole, dtype=np.int16)), np.atleast_2d(np.asarray(board, dtype=np.int16))
+    indices = _choice_indices(hole.shape[1], hole_use, board.shape[1], board_use)
+    cards = np.concatenate([hole, board], axis=1)[:, indices]  # (N, 組み合わせ数, 5)
+    return evaluator(cards.reshape(-1, indices.shape[1])).reshape(len(hole), len(indices)).max(axis=1)
+
+# --- ゲームごとのハイハンド判定 (返り値は (N, 判定数)。ダブルボードとドローマハは2列) ---
+def holdem_normal(hole, board): return evaluate_high(np.concatenate([hole, board], axis=1))[:, None]
+def holdem_super(hole, board): return evaluate_exact_use(hole, board, 2, 3)[:, None]
+def omaha(hole, board): return evaluate_exact_use(hole, board, 2, 3)[:, None]
+def stud(hole, board=None): return evaluate_high(hole)[:, None]
+def draw_high(hole, board=None): return evaluate_high(hole)[:, None]
+def drawmaha_high(hole, board):
+    # 手札5枚だけの役 (ドロー) と、手札2枚 + ボード3枚の役 (オマハ) の2つ
+    return np.stack([evaluate_high(hole), evaluate_exact_use(hole, board, 2, 3)], axis=1)
+def omaha_double_board_high(hole, boards):
+    # boards: (N, 10) = 1枚目のボード5枚 + 2枚目のボード5枚
+    boards = np.asarray(boards)
+    return np.stack([evaluate_exact_use(hole, boards[:, :5], 2, 3), evaluate_exact_use(hole, boards[:, 5:], 2, 3)], axis=1)
+
+HIGH_GAMES = {
+    'Holdem - Normal': holdem_normal,
+    'Holdem - Super': holdem_super,
+    'Drawmaha - Hi': drawmaha_high,
+    'Draw - Hi': draw_high,
+    'Stud - Stud': stud,
+    'Stud - Super Stud': stud,
+    'Omaha - Double Board Hi/Hi (4 or 5枚)': omaha_double_board_high,
+}
+
+def score_hands(game, hole, board=None):
+    # ゲーム名と手札・ボードの配列から、ハイハンドの強さをまとめて返す
+    hole = np.atleast_2d(np.asarray(hole, dtype=np.int16))
+    if board is not None: board = np.atleast_2d(np.asarray(board, dtype=np.int16))
+    return HIGH_GAMES[game](hole, board)
@@ -0,0 +1,103 @@
+import math
+import numpy as np
+import pandas as pd
+
+# --- 賞金配分と ICM ---
+# 賞金配分は最低入賞額を全員に保証したうえで、残りを「順位 i の取り分 ∝ i^(-alpha)」で分け、
+# 1位の割合が入賞人数に応じた目安になるよう alpha を決めて切りのよい額に丸める。
+# ICM (Malmuth-Harville) は、入賞済みのプレイヤーの組 (ビット列) ごとの確率を人数の少ない組から
+# 順に求める部分集合 DP で厳密に計算し、人数が多いときは「スタックに比例した速さの
+# 指数分布の競争」で着順を抽選して近似する。
+
+DEFAULT_PAID_FRACTION = 0.15
+MIN_CASH_BUY_INS = 1.5  # 最低入賞額 (参加費の何倍か)
+EXACT_LIMIT = 16  # これ以下の人数なら厳密計算
+DEFAULT_SIMULATIONS = 20_000
+
+def paid_places(entries, paid_fraction=DEFAULT_PAID_FRACTION):
+    paid = max(1, round(entries * paid_fraction))
+    if entries >= 6: paid = max(paid, 2)
+    if entries >= 10: paid = max(paid, 3)
+    return min(paid, entries)
+
+def first_place_share(paid):
+    # 1位の割合の目安 (2人入賞で65%、9人で約39%、100人で約17%)
+    return 1.0 if paid == 1 else 0.65 * (paid / 2) ** -0.35
+
+def _payout_unit(smallest):
+    # 最小の賞金の1/10程度の切りのよい単位
+    return max(1, 10 ** math.floor(math.log10(max(smallest / 10, 1))))
+
+def generate_payouts(entries, prize_pool, paid_fraction=DEFAULT_PAID_FRACTION, min_cash_buy_ins=MIN_CASH_BUY_INS):
+    # 1位から順の賞金額のリスト (合計は prize_pool。丸めの端数は1位に加える)。
+    # 入賞者全員に参加費の min_cash_buy_ins 倍を保証し、残りを i^(-alpha) の比で分ける
+    paid = paid_places(entries, paid_fraction)
+    places = np.arange(1, paid + 1)
+    min_cash = min(prize_pool / entries * min_cash_buy_ins, prize_pool / paid) if paid > 1 else 0
+    rest = prize_pool - min_cash * paid
+    target, low, high = first_place_share(paid), 0.0, 10.0
+    for _ in range(60):
+        alpha = (low + high) / 2
+        weights = places ** -alpha
+        if (min_cash + rest * weights[0] / weights.sum()) / prize_pool < target: low = alpha
+        else: high = alpha
+    weights = places ** -((low + high) / 2)
+    raw = min_cash + rest * weights / weights.sum()
+    unit = _payout_unit(raw[-1])
+    amounts = (np.floor(raw / unit) * unit).astype(np.int64)
+    amounts[0] += prize_pool - amounts.sum()
+    return amounts.tolist()
+
+def _icm_exact(stacks, payouts):
+    n = len(stacks)
+    places = min(len(payouts), n)
+    masks = np.arange(1 << n)
+    bits = (masks[:, None] >> np.arange(n)) & 1
+    placed_chips = bits @ stacks
+    popcount = bits.sum(axis=1)
+    total = stacks.sum()
+    prob = np.zeros(1 << n)
+    prob[0] = 1.0
+    equity = np.zeros(n)
+    for k in range(1, places + 1):
+        # k 人目 (k 位) が決まった組の確率を、k-1 人の組から求める
+        layer = masks[popcount == k]
+        for i in range(n):
+            with_i = layer[(layer >> i) & 1 == 1]
+            before = with_i ^ (1 << i)
+            contribution = prob[before] * stacks[i] / (total - placed_chips[before])
+            prob[with_i] += contribution
+            equity[i] += payouts[k - 1] * contribution.sum()
+    return equity
+
+def _icm_sampled(stacks, payouts, simulations, seed):
+    # スタックに比例した速さの指数分布で「先に上位が決まる」順番を抽選する (Harville と同じ着順の分布)
+    rng = np.random.default_rng(seed)
+    places = min(len(payouts), len(stacks))
+    equity = np.zeros(len(stacks))
+    payouts = np.asarray(payouts[:places], dtype=float)
+    batch = max(1, 2_000_000 // len(stacks))
+    for start in range(0, simulations, batch):
+        size = min(batch, simulations - start)
+        times = rng.exponential(size=(size, len(stacks))) / stacks
+        top = np.argpartition(times, places - 1, axis=1)[:, :places] if places < len(stacks) else np.arange(len(stacks))[None, :].repeat(size, axis=0)
+        order = np.take_along_axis(top, np.argsort(np.take_along_axis(times, top, axis=1), axis=1), axis=1)
+        equity += np.bincount(order.ravel(), weights=np.broadcast_to(payouts, order.shape).ravel(), minlength=len(stacks))
+    return equity / simulations
+
+def icm_equity(stacks, payouts, exact_limit=EXACT_LIMIT, simulations=DEFAULT_SIMULATIONS, seed=None):
+    # 残っているプレイヤーのスタックと、残りの賞金 (1位から順) から各プレイヤーの賞金期待値を返す
+    stacks = np.asarray(stacks, dtype=float)
+    if (stacks <= 0).any(): raise ValueError("スタックは0より大きい値にしてください。")
+    payouts = list(payouts)[:len(stacks)]
+    if not payouts: return np.zeros(len(stacks))
+    if len(stacks) <= exact_limit: return _icm_exact(stacks, payouts)
+    return _icm_sampled(stacks, payouts, simulations, seed)
+
+def deal_table(stacks, payouts, **kwargs):
+    # ディール用の比較表: ICM と チップチョップ (最下位の賞金を全員に保証し、残りをスタック比で分ける)
+    stacks = np.asarray(stacks, dtype=float)
+    payouts = list(payouts)[:len(stacks)] + [0] * max(0, len(stacks) - len(payouts))
+    guaranteed = payouts[-1]
+    chip_chop = guaranteed + (sum(payouts) - guaranteed * len(stacks)) * stacks / stacks.sum()
+    return pd.DataFrame({'スタック': stacks.astype(np.int64), 'スタック比': stacks / stacks.sum(), 'ICM': icm_equity(stacks, payouts, **kwargs), 'チップチョップ': chip_chop})
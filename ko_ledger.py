@@ -0,0 +1,91 @@
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+
+# --- ノックアウト (KO) / プログレッシブノックアウト (PKO) のバウンティ台帳 ---
+# 1回のノックアウトで更新するのは関係するプレイヤーの値だけで、合計額・人数は差分で持ち、
+# 「頭の上のバウンティが大きい順」「獲得額の多い順」は並び替え済みのリストに二分探索で
+# 出し入れするので、ランキングの参照で全員を走査し直すことはない。
+
+DEFAULT_PKO_CASH_FRACTION = 0.5  # PKO で現金として受け取る割合 (残りは自分の頭に乗る)
+
+@dataclass(frozen=True)
+class Knockout:
+    eliminated: str
+    winners: tuple
+    bounty: int
+    cash: tuple  # 勝者ごとの現金
+    head: tuple  # 勝者ごとの頭への加算額
+
+class BountyLedger:
+    def __init__(self, initial_bounty, progressive=True, cash_fraction=DEFAULT_PKO_CASH_FRACTION):
+        self.initial_bounty = int(initial_bounty)
+        self.progressive = progressive
+        self.cash_fraction = cash_fraction if progressive else 1.0
+        self.heads = {}  # 残っているプレイヤーの頭の上のバウンティ
+        self.cash_won = {}
+        self.knockout_counts = {}
+        self.history = []
+        self.total_paid = 0
+        self.total_on_heads = 0
+        self._by_head = []  # (-頭のバウンティ, 名前)
+        self._by_cash = []  # (-獲得額, 名前)
+
+    def _set(self, index, values, player, value):
+        if player in values: index.pop(bisect_left(index, (-values[player], player)))
+        values[player] = value
+        insort(index, (-value, player))
+
+    def add_player(self, player):
+        if player in self.cash_won: raise ValueError(f"{player} はすでに登録されています。")
+        self._set(self._by_head, self.heads, player, self.initial_bounty)
+        self._set(self._by_cash, self.cash_won, player, 0)
+        self.knockout_counts[player] = 0
+        self.total_on_heads += self.initial_bounty
+
+    def _remove_head(self, player):
+        bounty = self.heads.pop(player)
+        self._by_head.pop(bisect_left(self._by_head, (-bounty, player)))
+        self.total_on_heads -= bounty
+        return bounty
+
+    def knockout(self, eliminated, winners):
+        # winners が複数ならスプリットノックアウト (バウンティを等分し、端数は先頭の勝者へ)
+        winners = tuple(dict.fromkeys(winners))
+        if eliminated not in self.heads: raise ValueError(f"{eliminated} は残っていません。")
+        if not winners or eliminated in winners or any(w not in self.heads for w in winners): raise ValueError("ノックアウトした (残っている) プレイヤーを正しく選んでください。")
+        bounty = self._remove_head(eliminated)
+        shares = [bounty // len(winners) + (1 if i < bounty % len(winners) else 0) for i in range(len(winners))]
+        cash = tuple(int(share * self.cash_fraction) for share in shares)
+        head = tuple(share - c for share, c in zip(shares, cash))
+        for winner, c, h in zip(winners, cash, head):
+            self._set(self._by_cash, self.cash_won, winner, self.cash_won[winner] + c)
+            if h:
+                self._set(self._by_head, self.heads, winner, self.heads[winner] + h)
+                self.total_on_heads += h
+            self.knockout_counts[winner] += 1
+        self.total_paid += sum(cash)
+        record = Knockout(eliminated, winners, bounty, cash, head)
+        self.history.append(record)
+        return record
+
+    def eliminate(self, player):
+        # 勝者を記録しない敗退 (座席表からの敗退など)。頭の上のバウンティは誰にも支払わずに消える。返り値はそのバウンティ
+        if player not in self.heads: raise ValueError(f"{player} は残っていません。")
+        return self._remove_head(player)
+
+    def finish(self, champion):
+        # 優勝者は自分の頭の上のバウンティを受け取る
+        if set(self.heads) != {champion}: raise ValueError("優勝者以外のプレイヤーが残っています。")
+        bounty = self._remove_head(champion)
+        self._set(self._by_cash, self.cash_won, champion, self.cash_won[champion] + bounty)
+        self.total_paid += bounty
+        return bounty
+
+    @property
+    def remaining(self): return len(self.heads)
+
+    def biggest_heads(self, limit=10):
+        return [(player, -value) for value, player in self._by_head[:limit]]
+
+    def top_earners(self, limit=10):
+        return [(player, -value) for value, player in self._by_cash[:limit] if value < 0]
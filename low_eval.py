@@ -0,0 +1,205 @@
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+import numpy as np
+from hand_eval import (HIGH_CARD, ONE_PAIR, TWO_PAIR, THREE_OF_A_KIND, STRAIGHT, FLUSH, FULL_HOUSE, FOUR_OF_A_KIND, HIGH_GAMES,
+                       _encode, _rank_only_value, _straight_high, category_of, evaluate_high, evaluate_exact_use, evaluate_with_tables,
+                       flush_table, multiset_index, rank_table, sort_rows)
+
+# --- ロー・バドゥギ系・変則ゲームの役判定 ---
+# ハイハンドと同じく、値が大きいほど強い (その役で勝てる) 整数で返す。0 は「役が成立しない」。
+# A-5 ローはランクの多重集合の表、2-7 ローは A-5 をストレートにしないハイハンドの値の反転、バドゥギ/ハイドゥギは
+# 4枚の組み合わせ C(52, 4) 通りの表、0/49 は1枚ごとの点数表を引くだけで判定する。
+
+LOW_BASE = 1 << 24  # ハイハンドの値の最大より大きい数 (2-7 ローの反転に使う)
+EIGHT_OR_BETTER = 7  # 8 以下 (A を 0 とした A-5 ランクで 7 以下)
+ARCHIE_HIGH_QUALIFIER = _encode(ONE_PAIR, [7])  # 9 のワンペア以上
+
+def _low_rank(rank):
+    # A-5 ローでのランク (A=0, 2=1, …, K=12)
+    return (rank + 1) % 13
+
+def _group_order(ranks):
+    # 枚数の多い順、同じ枚数なら数字の大きい順のランクと、その枚数の並び
+    counts = {}
+    for r in ranks: counts[r] = counts.get(r, 0) + 1
+    groups = sorted(counts.items(), key=lambda g: (-g[1], -g[0]))
+    return [r for r, _ in groups], [c for _, c in groups]
+
+_PAIR_CATEGORIES = {(1, 1, 1, 1, 1): HIGH_CARD, (2, 1, 1, 1): ONE_PAIR, (2, 2, 1): TWO_PAIR, (3, 1, 1): THREE_OF_A_KIND, (3, 2): FULL_HOUSE, (4, 1): FOUR_OF_A_KIND}
+
+def _a5_five(low_ranks):
+    # ストレート・フラッシュを無視した5枚のロー。ペアが少ないほど、次に高いカードが低いほど強い
+    order, pattern = _group_order(low_ranks)
+    return _encode(8 - _PAIR_CATEGORIES[tuple(pattern)], [12 - r for r in order])
+
+def _a5_value(counts, qualifier=None):
+    low_counts = counts[12:] + counts[:12]
+    distinct = [r for r in range(13) if low_counts[r]]
+    if len(distinct) >= 5:
+        chosen = distinct[:5]
+        if qualifier is not None and chosen[-1] > qualifier: return 0
+        return _a5_five(chosen)
+    if qualifier is not None: return 0
+    cards = [r for r in range(13) for _ in range(low_counts[r])]
+    return max(_a5_five(five) for five in set(combinations(cards, 5)))
+
+def _a5_eight_value(counts):
+    return _a5_value(counts, EIGHT_OR_BETTER)
+
+def evaluate_a5_low(cards, qualifier=None):
+    # cards: (N, n) (5 <= n <= 7)。qualifier=EIGHT_OR_BETTER で 8 以下の成立条件を付ける
+    cards = np.asarray(cards)
+    if cards.ndim == 1: cards = cards[None, :]
+    rows = np.ascontiguousarray(cards.T, dtype=np.int8)
+    table = rank_table(len(rows), _a5_value if qualifier is None else _a5_eight_value)
+    return table[multiset_index(sort_rows(rows >> 2))]
+
+def _deuce_seven_rank_value(counts):
+    # 2-7 ではAは常にハイなので、A-5-4-3-2 はストレートではなく A ハイ
+    value = _rank_only_value(counts)
+    if category_of(value) == STRAIGHT and _straight_high(sum(1 << r for r in range(13) if counts[r])) == 3:
+        return _encode(HIGH_CARD, [r for r in range(12, -1, -1) if counts[r]][:5])
+    return value
+
+@lru_cache(maxsize=None)
+def _deuce_seven_flush_table():
+    # ハイハンドのフラッシュの表から、A-5 のストレートフラッシュをただのフラッシュに直したもの
+    table = flush_table().copy()
+    for mask in range(1 << 13):
+        if bin(mask).count('1') >= 5 and _straight_high(mask) == 3: table[mask] = _encode(FLUSH, [r for r in range(12, -1, -1) if mask >> r & 1][:5])
+    return table
+
+def evaluate_27_low(cards):
+    # 5枚ちょうど。ストレート・フラッシュも役として数え、A はハイ (A-5 はストレートにならない)。ハイハンドとして弱いほど強い
+    return LOW_BASE - evaluate_with_tables(cards, _deuce_seven_rank_value, _deuce_seven_flush_table())
+
+# --- バドゥギ系 (4枚の組み合わせの表) ---
+@lru_cache(maxsize=None)
+def _card_chunk_offsets(n):
+    # 昇順 i 番目のカード c の寄与 C(c, i + 1) を2枚ずつまとめた表 (キーは 52進)
+    offsets = [np.array([comb(c, i + 1) for c in range(52)], dtype=np.int32) for i in range(n)]
+    chunks = []
+    for start in range(0, n, 2):
+        table = np.zeros(1, dtype=np.int32)
+        for offset in offsets[start:start + 2]: table = (table[:, None] + offset[None, :]).ravel()
+        chunks.append(table)
+    return chunks
+
+def _card_index(sorted_rows):
+    index = 0
+    for chunk, start in zip(_card_chunk_offsets(len(sorted_rows)), range(0, len(sorted_rows), 2)):
+        key = sorted_rows[start].astype(np.int16)
+        for row in sorted_rows[start + 1:start + 2]: key = key * 52 + row
+        index = index + chunk[key]
+    return index
+
+def _badugi_subset_value(counts, ace_low):
+    # スートもランクも重複しない k 枚: 枚数が多いほど、次に一番高いカードが低いほど強い
+    if max(counts) > 1: return 0
+    ranks = sorted((_low_rank(r) if ace_low else r for r in range(13) if counts[r]), reverse=True)
+    return _encode(len(ranks), [12 - r for r in ranks])
+
+def _badugi_ace_low(counts): return _badugi_subset_value(counts, True)
+def _badugi_deuce_low(counts): return _badugi_subset_value(counts, False)
+
+def _hidugi_subset_value(counts):
+    # スートが重複しない k 枚 (ランクの重複は可): 枚数が多いほど強く、次にペア系の役、A はハイ
+    ranks = [r for r in range(13) for _ in range(counts[r])]
+    order, pattern = _group_order(ranks)
+    category = {(4,): FOUR_OF_A_KIND, (3, 1): THREE_OF_A_KIND, (3,): THREE_OF_A_KIND, (2, 2): TWO_PAIR}.get(tuple(pattern), ONE_PAIR if 2 in pattern else HIGH_CARD)
+    return ((len(ranks) << 4 | category) << 16) | sum(r << (4 * (3 - i)) for i, r in enumerate(order))
+
+@lru_cache(maxsize=None)
+def _four_card_table(subset_value):
+    # 4枚の全組み合わせ → スートが重複しない部分集合の subset_value の最大値
+    hands = np.array(list(combinations(range(52), 4)), dtype=np.int8)
+    best = np.zeros(len(hands), dtype=np.int32)
+    for size in range(1, 5):
+        values = rank_table(size, subset_value)
+        for subset in combinations(range(4), size):
+            cards = hands[:, subset]
+            suit_bits = np.left_shift(1, (cards & 3).astype(np.int32))
+            distinct = np.bitwise_or.reduce(suit_bits, axis=1) == suit_bits.sum(axis=1)
+            subset_values = values[multiset_index(sort_rows(np.ascontiguousarray(cards.T) >> 2))]
+            best = np.maximum(best, np.where(distinct, subset_values, 0))
+    table = np.zeros(comb(52, 4), dtype=np.int32)
+    table[_card_index(list(hands.T))] = best
+    return table
+
+def _evaluate_four_card(cards, subset_value):
+    # cards: (N, n) (n >= 4)。n > 4 なら最も強い4枚を使う
+    cards = np.asarray(cards)
+    if cards.ndim == 1: cards = cards[None, :]
+    table = _four_card_table(subset_value)
+    best = None
+    for four in combinations(range(cards.shape[1]), 4):
+        values = table[_card_index(sort_rows(np.ascontiguousarray(cards[:, four].T, dtype=np.int8)))]
+        best = values if best is None else np.maximum(best, values)
+    return best
+
+def evaluate_badugi(cards, ace_low=True):
+    # A がロー (通常のバドゥギ、Badacey) か、2 が最弱 (Badeucey) か
+    return _evaluate_four_card(cards, _badugi_ace_low if ace_low else _badugi_deuce_low)
+
+def evaluate_hidugi(cards):
+    return _evaluate_four_card(cards, _hidugi_subset_value)
+
+# --- 数字の合計で競うゲーム (ドローマハ 0 / 49) ---
+# ピクチャーカードは 0、A は 1 点。T は 49 では 10 点、0 ではピクチャー (K, Q, J, T) として 0 点。
+PIP_VALUES = np.array([(r + 2 if r <= 8 else 1 if r == 12 else 0) for r in range(13) for _ in range(4)], dtype=np.int16)
+ZERO_PIP_VALUES = np.array([(r + 2 if r <= 7 else 1 if r == 12 else 0) for r in range(13) for _ in range(4)], dtype=np.int16)
+
+def evaluate_pips_high(cards):
+    # 49: 合計が大きいほど強い (ナッツは TTTT9 = 49)
+    return PIP_VALUES[np.asarray(cards)].sum(axis=-1).astype(np.int32)
+
+def evaluate_pips_low(cards):
+    # 0: 合計が小さいほど強い (ナッツはピクチャー5枚 = 0)
+    return 50 - ZERO_PIP_VALUES[np.asarray(cards)].sum(axis=-1).astype(np.int32)
+
+# --- アーチー ---
+def evaluate_archie_high(cards):
+    values = evaluate_high(cards)
+    return np.where(values >= ARCHIE_HIGH_QUALIFIER, values, 0)
+
+def evaluate_archie_low(cards):
+    return evaluate_a5_low(cards, EIGHT_OR_BETTER)
+
+# --- ゲームごとの判定 (返り値は (N, 判定数)) ---
+def _drawmaha(draw_evaluator, hole, board, hole_use=2, board_use=3):
+    # ドロー側は手札5枚、オマハ側は手札 hole_use 枚 + ボード board_use 枚
+    return np.stack([draw_evaluator(hole), evaluate_exact_use(hole, board, hole_use, board_use, draw_evaluator)], axis=1)
+
+def _omaha_hi_lo8(hole, board):
+    low = evaluate_exact_use(hole, board, 2, 3, lambda cards: evaluate_a5_low(cards, EIGHT_OR_BETTER))
+    return np.stack([evaluate_exact_use(hole, board, 2, 3), low], axis=1)
+
+LOW_GAMES = {
+    'Drawmaha - 27 lowball': lambda hole, board: _drawmaha(evaluate_27_low, hole, board),
+    'Drawmaha - A5 lowball': lambda hole, board: _drawmaha(evaluate_a5_low, hole, board),
+    'Drawmaha - Badugi': lambda hole, board: _drawmaha(evaluate_badugi, hole, board, 2, 2),
+    'Drawmaha - Hi-dugi': lambda hole, board: _drawmaha(evaluate_hidugi, hole, board, 2, 2),
+    'Drawmaha - 0': lambda hole, board: _drawmaha(evaluate_pips_low, hole, board),
+    'Drawmaha - 49': lambda hole, board: _drawmaha(evaluate_pips_high, hole, board),
+    'Draw - 27 lowball': lambda hole, board=None: evaluate_27_low(hole)[:, None],
+    'Draw - A5 lowball': lambda hole, board=None: evaluate_a5_low(hole)[:, None],
+    'Draw - Badugi': lambda hole, board=None: evaluate_badugi(hole)[:, None],
+    'Draw - Hi-dugi': lambda hole, board=None: evaluate_hidugi(hole)[:, None],
+    'Draw - Badacey': lambda hole, board=None: np.stack([evaluate_high(hole), evaluate_badugi(hole)], axis=1),
+    'Draw - Badeucey': lambda hole, board=None: np.stack([evaluate_high(hole), evaluate_badugi(hole, ace_low=False)], axis=1),
+    'Draw - Archie': lambda hole, board=None: np.stack([evaluate_archie_high(hole), evaluate_archie_low(hole)], axis=1),
+    'Omaha - Double Board Best/Best (4 or 5枚)': lambda hole, boards: np.concatenate([_omaha_hi_lo8(hole, np.asarray(boards)[:, :5]), _omaha_hi_lo8(hole, np.asarray(boards)[:, 5:])], axis=1),
+    'Stud - Stud H/L8': lambda hole, board=None: np.stack([evaluate_high(hole), evaluate_a5_low(hole, EIGHT_OR_BETTER)], axis=1),
+    'Stud - Super Stud H/L8': lambda hole, board=None: np.stack([evaluate_high(hole), evaluate_a5_low(hole, EIGHT_OR_BETTER)], axis=1),
+    'Stud - Razz': lambda hole, board=None: evaluate_a5_low(hole)[:, None],
+    'Stud - Super Razz': lambda hole, board=None: evaluate_a5_low(hole)[:, None],
+}
+
+ALL_GAMES = {**HIGH_GAMES, **LOW_GAMES}
+
+def score_game(game, hole, board=None):
+    # ハイ・ロー問わず、game_rules の全ゲームの判定値をまとめて返す
+    hole = np.atleast_2d(np.asarray(hole, dtype=np.int16))
+    if board is not None: board = np.atleast_2d(np.asarray(board, dtype=np.int16))
+    return ALL_GAMES[game](hole, board)
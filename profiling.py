@@ -0,0 +1,154 @@
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import pandas as pd
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# --- 区間ごとの計測 (任意で有効化) ---
+# 環境変数で有効にしたときだけ計測する。無効のときは section() が共有の空のコンテキストを返し、
+# timed() は関数をそのまま返すので、計測のための処理はほぼ行わない。
+#   POKER_PROFILE=1                 計測を有効にする (診断ページに表示)
+#   POKER_PROFILE_JSONL=<パス>      区間ごとの記録を JSON Lines で追記する
+#   POKER_PROFILE_PROM=<パス>       Prometheus のテキスト形式で集計を書き出す (node_exporter の textfile collector 用)
+# 有効にすると st.dataframe などの表示と pd.DataFrame の生成も自動で計測する。
+
+JSONL_PATH = os.environ.get('POKER_PROFILE_JSONL')
+PROM_PATH = os.environ.get('POKER_PROFILE_PROM')
+ENABLED = bool(os.environ.get('POKER_PROFILE') or JSONL_PATH or PROM_PATH)
+PROM_WRITE_INTERVAL = 1.0  # Prometheus のファイルを書き直す最短の間隔 (秒)
+MAX_PENDING_EVENTS = 1000
+
+_NULL = contextlib.nullcontext()
+_lock = threading.Lock()
+_stats = {}  # 区間名 → [回数, 合計秒, 最大秒]
+_reruns = {}  # (アプリ, セッションID) → 再実行回数
+_pending = []
+_last_prom_write = 0.0
+_hooks_installed = False
+
+def _session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else '-'
+
+def _record(name, seconds):
+    with _lock:
+        stats = _stats.setdefault(name, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+        if JSONL_PATH: _pending.append({'時刻': time.time(), 'セッション': _session_id(), '区間': name, 'ms': seconds * 1000})
+        flush = len(_pending) >= MAX_PENDING_EVENTS
+    if flush: _flush_events()
+
+class _Section:
+    __slots__ = ('name', 'start')
+    def __init__(self, name): self.name = name
+    def __enter__(self): self.start = time.perf_counter()
+    def __exit__(self, *exc): _record(self.name, time.perf_counter() - self.start)
+
+def section(name):
+    # with section('calc:...'): ... の区間の時間を集計する (例外で抜けた場合も記録する)
+    return _Section(name) if ENABLED else _NULL
+
+def timed(name):
+    # 関数全体を1つの区間として計測するデコレーター
+    def decorate(function):
+        if not ENABLED: return function
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with _Section(name): return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def install_hooks():
+    # 表の表示と DataFrame の生成を計測する (有効なときに1度だけ差し替える)
+    global _hooks_installed
+    if not ENABLED or _hooks_installed: return
+    for method in ('dataframe', 'data_editor', 'line_chart'):
+        wrapped = timed(f'render:{method}')(getattr(DeltaGenerator, method))
+        setattr(DeltaGenerator, method, wrapped)
+        setattr(st, method, getattr(st._main, method))  # st.dataframe などは読み込み時のメソッドを持っているので付け直す
+    pd.DataFrame.__init__ = timed('build:DataFrame')(pd.DataFrame.__init__)
+    _hooks_installed = True
+
+@contextlib.contextmanager
+def _rerun(app):
+    key = (app, _session_id())
+    with _lock: _reruns[key] = _reruns.get(key, 0) + 1
+    try:
+        with _Section(f'rerun:{app}'): yield
+    finally: export()
+
+def rerun(app):
+    # スクリプト1回分の実行を囲む。再実行の回数をセッションごとに数え、終わったら書き出す
+    if not ENABLED: return _NULL
+    install_hooks()
+    return _rerun(app)
+
+def _flush_events():
+    if not JSONL_PATH: return
+    with _lock:
+        events = _pending[:]
+        _pending.clear()
+    if not events: return
+    with open(JSONL_PATH, 'a', encoding='utf-8') as f: f.writelines(json.dumps(event, ensure_ascii=False) + '\n' for event in events)
+
+def export():
+    # 記録を JSON Lines に追記し、Prometheus のファイルを書き直す (間隔は PROM_WRITE_INTERVAL 以上)
+    global _last_prom_write
+    _flush_events()
+    if not PROM_PATH or time.monotonic() - _last_prom_write < PROM_WRITE_INTERVAL: return
+    _last_prom_write = time.monotonic()
+    temporary = f'{PROM_PATH}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as f: f.write(prometheus_text())
+    os.replace(temporary, PROM_PATH)
+
+def _label(value): return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def prometheus_text():
+    with _lock:
+        stats = {name: list(values) for name, values in _stats.items()}
+        reruns = dict(_reruns)
+    lines = ['# HELP poker_section_seconds Time spent in instrumented sections.', '# TYPE poker_section_seconds summary']
+    for name, (count, total, _) in sorted(stats.items()):
+        lines += [f'poker_section_seconds_count{{section="{_label(name)}"}} {count}', f'poker_section_seconds_sum{{section="{_label(name)}"}} {total:.6f}']
+    lines += ['# HELP poker_section_seconds_max Slowest single run of each section.', '# TYPE poker_section_seconds_max gauge']
+    lines += [f'poker_section_seconds_max{{section="{_label(name)}"}} {longest:.6f}' for name, (_, _, longest) in sorted(stats.items())]
+    lines += ['# HELP poker_reruns_total Script reruns per app.', '# TYPE poker_reruns_total counter']
+    apps = {}
+    for (app, _), count in reruns.items(): apps[app] = apps.get(app, 0) + count
+    lines += [f'poker_reruns_total{{app="{_label(app)}"}} {count}' for app, count in sorted(apps.items())]
+    lines += ['# HELP poker_sessions Sessions that have rerun at least once.', '# TYPE poker_sessions gauge']
+    lines += [f'poker_sessions{{app="{_label(app)}"}} {sum(1 for key in reruns if key[0] == app)}' for app in sorted(apps)]
+    return '\n'.join(lines) + '\n'
+
+def section_rows():
+    # 表示用: 区間ごとの回数・合計・平均・最大 (合計の大きい順)
+    with _lock: stats = {name: list(values) for name, values in _stats.items()}
+    return sorted(({'区間': name, '回数': count, '合計 (ms)': total * 1000, '平均 (ms)': total / count * 1000, '最大 (ms)': longest * 1000} for name, (count, total, longest) in stats.items()), key=lambda row: -row['合計 (ms)'])
+
+def rerun_counts(app):
+    with _lock: return {session: count for (name, session), count in _reruns.items() if name == app}
+
+def reset():
+    with _lock:
+        _stats.clear()
+        _reruns.clear()
+        _pending.clear()
+
+def render_diagnostics(app):
+    # 診断用の表示 (計測が有効なときだけ呼ぶ)
+    counts = rerun_counts(app)
+    col1, col2, col3 = st.columns(3)
+    col1.metric('このセッションの再実行回数', counts.get(_session_id(), 0))
+    col2.metric('全セッションの再実行回数', sum(counts.values()))
+    col3.metric('セッション数', len(counts))
+    st.dataframe(pd.DataFrame(section_rows(), columns=['区間', '回数', '合計 (ms)', '平均 (ms)', '最大 (ms)']).round(2), hide_index=True, use_container_width=True)
+    st.caption(f"JSON Lines: {JSONL_PATH or '(未設定)'} / Prometheus: {PROM_PATH or '(未設定)'}")
+    st.download_button('Prometheus 形式でダウンロード', prometheus_text(), file_name='poker_metrics.prom', mime='text/plain')
+    if st.button('集計をリセット'): reset(); st.rerun()
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+# --- ROIトラッカーのグラフ用のデータ ---
+# 日付ごとの累積純利益と直近 N 日の ROI を、表示する期間だけ切り出してから LTTB で
+# CHART_POINTS 点以下に間引く。ブラウザに送る点の数は記録の件数によらず一定になる。
+# 期間を狭めると、その期間の中で改めて間引くので細かい形が見えてくる。
+
+CHART_POINTS = 800  # グラフの横幅 (ピクセル) 程度
+ROLLING_DAYS_OPTIONS = (7, 30, 90, 365)
+
+def lttb(x, y, threshold):
+    # Largest-Triangle-Three-Buckets: 形を保つように threshold 点を選び、その位置を返す
+    n = len(x)
+    if threshold >= n or threshold < 3: return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)  # 最初と最後の点を除いた threshold-2 個のバケツ
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 次のバケツの平均 (最後のバケツでは最後の点)
+        if i + 2 < len(edges): next_x, next_y = x[end:edges[i + 2]].mean(), y[end:edges[i + 2]].mean()
+        else: next_x, next_y = x[-1], y[-1]
+        # 前に選んだ点・次のバケツの平均と作る三角形が最も大きい点を選ぶ
+        area = np.abs((x[a] - next_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (next_y - y[a]))
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+def _by_date(df, column='日付'):
+    # 日付の列を datetime にして古い順に並べる (日付として読めない行は除く)
+    df = df.assign(**{column: pd.to_datetime(df[column], errors='coerce')}).dropna(subset=[column])
+    return df.sort_values(column, kind='stable').set_index(column)
+
+def date_range(cumulative):
+    # グラフにできる最初と最後の日付 (datetime.date)。なければ None
+    dates = pd.to_datetime(cumulative['日付'], errors='coerce').dropna()
+    return (dates.min().date(), dates.max().date()) if len(dates) else None
+
+def rolling_roi(day_rollup, rolling_days):
+    # 日別の集計から、各日を終わりとする直近 rolling_days 日の ROI (%)
+    daily = _by_date(day_rollup)[['バイイン', '純利益']]
+    window = daily.rolling(f'{rolling_days}D').sum()
+    return (window['純利益'] / window['バイイン'].where(window['バイイン'] != 0) * 100).rename(f'ROI（直近{rolling_days}日）').dropna()
+
+def downsample(series, start=None, end=None, points=CHART_POINTS):
+    # start〜end (両端を含む) を切り出して points 点以下に間引く
+    series = series.loc[pd.Timestamp(start) if start else None:pd.Timestamp(end) if end else None]
+    return series.iloc[lttb(series.index.asi8, series.to_numpy(), points)]
+
+def chart_data(cumulative, day_rollup, start, end, rolling_days, points=CHART_POINTS):
+    # 表示する期間の (累積純利益, 直近 rolling_days 日の ROI)。累積は期間の前の記録も含めた値
+    profit = _by_date(cumulative)['累積純利益']
+    return downsample(profit, start, end, points).to_frame(), downsample(rolling_roi(day_rollup, rolling_days), start, end, points).to_frame()
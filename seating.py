@@ -0,0 +1,118 @@
+import random
+import secrets
+from dataclasses import dataclass
+
+# --- 座席の抽選とテーブルバランス ---
+# テーブルごとの人数を「人数 → その人数のテーブルの集合」のバケットで管理するので、
+# 最も多い/少ないテーブルはバケットの数 (1卓の席数 + 1) を見るだけで分かる。
+# 敗退のたびに必要な移動は高々1人 (最多のテーブル → 最少のテーブル) で、部屋全体を
+# 組み直すことはない。1卓減らせる人数になったら、番号の大きいテーブルから崩す。
+
+@dataclass(frozen=True)
+class SeatMove:
+    player: str
+    from_table: int
+    from_seat: int
+    to_table: int
+    to_seat: int
+    reason: str
+
+class SeatingChart:
+    def __init__(self, table_count, seats_per_table=9, seed=None):
+        self.seats_per_table = seats_per_table
+        self.seed = secrets.randbits(64) if seed is None else int(seed)
+        self._rng = random.Random(self.seed)
+        self.tables = {}
+        self._buckets = [set() for _ in range(seats_per_table + 1)]
+        self.player_seats = {}
+        self.entries = 0
+        self.busted = []
+        for _ in range(max(1, table_count)): self._open_table()
+
+    def _open_table(self):
+        table = next(reversed(self.tables), 0) + 1
+        self.tables[table] = [None] * self.seats_per_table
+        self._buckets[0].add(table)
+        return table
+
+    def _count(self, table):
+        return self.seats_per_table - self.tables[table].count(None)
+
+    def _place(self, player, table, seat):
+        count = self._count(table)
+        self._buckets[count].discard(table)
+        self._buckets[count + 1].add(table)
+        self.tables[table][seat] = player
+        self.player_seats[player] = (table, seat)
+
+    def _remove(self, player):
+        table, seat = self.player_seats.pop(player)
+        count = self._count(table)
+        self._buckets[count].discard(table)
+        self._buckets[count - 1].add(table)
+        self.tables[table][seat] = None
+        return table, seat
+
+    def _extreme_tables(self, fewest):
+        counts = range(len(self._buckets)) if fewest else range(len(self._buckets) - 1, -1, -1)
+        for count in counts:
+            if self._buckets[count]: return count, self._buckets[count]
+        return 0, set()
+
+    def _random_open_seat(self, table):
+        return self._rng.choice([seat for seat, player in enumerate(self.tables[table]) if player is None])
+
+    @property
+    def remaining(self): return len(self.player_seats)
+
+    def register(self, player):
+        # 最も空いているテーブルの空席から抽選する (満席なら1卓増やす)
+        if player in self.player_seats: raise ValueError(f"{player} はすでに着席しています。")
+        count, tables = self._extreme_tables(fewest=True)
+        table = self._open_table() if count >= self.seats_per_table else self._rng.choice(sorted(tables))
+        seat = self._random_open_seat(table)
+        self._place(player, table, seat)
+        self.entries += 1
+        return table, seat
+
+    def bust(self, player):
+        # 敗退を記録し、必要な移動 (テーブルバランス・テーブルブレイク) の指示を返す
+        if player not in self.player_seats: raise ValueError(f"{player} は着席していません。")
+        self._remove(player)
+        self.busted.append(player)
+        moves = []
+        if len(self.tables) > 1 and self.remaining <= (len(self.tables) - 1) * self.seats_per_table: moves += self._break_table()
+        else: moves += self._balance()
+        return moves
+
+    def _balance(self):
+        low, short_tables = self._extreme_tables(fewest=True)
+        high, full_tables = self._extreme_tables(fewest=False)
+        if high - low < 2: return []
+        from_table, to_table = next(iter(full_tables)), next(iter(short_tables))
+        player = self._rng.choice([p for p in self.tables[from_table] if p is not None])
+        return [self._move(player, to_table, 'テーブルバランス')]
+
+    def _break_table(self):
+        # 番号の最も大きいテーブルを崩し、その卓のプレイヤーを人数の少ないテーブルから順に座らせる
+        table = next(reversed(self.tables))  # テーブルは番号順に追加されるので最後が最大
+        players = [(player, seat) for seat, player in enumerate(self.tables[table]) if player is not None]
+        self._rng.shuffle(players)
+        for player, _ in players: self._remove(player)
+        del self.tables[table]
+        self._buckets[0].discard(table)
+        moves = []
+        for player, seat in players:
+            _, short_tables = self._extreme_tables(fewest=True)
+            moves.append(self._move(player, next(iter(short_tables)), f'テーブル{table}のブレイク', from_seat=(table, seat)))
+        return moves + self._balance()
+
+    def _move(self, player, to_table, reason, from_seat=None):
+        from_table, seat = from_seat or self._remove(player)
+        to_seat = self._random_open_seat(to_table)
+        self._place(player, to_table, to_seat)
+        return SeatMove(player, from_table, seat, to_table, to_seat, reason)
+
+    def table_rows(self):
+        # 表示用: テーブルごとの人数と席順
+        return [{'テーブル': table, '人数': self._count(table), **{f'シート{i + 1}': player or '' for i, player in enumerate(seats)}} for table, seats in sorted(self.tables.items())]
@@ -0,0 +1,85 @@
+import argparse
+import os
+import re
+import pandas as pd
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.ipc as ipc
+except ImportError:  # pyarrow は任意 (なければこのモジュールの機能だけが使えない)
+    pa = None
+AVAILABLE = pa is not None
+
+# --- ROIトラッカーの記録の列指向アーカイブ (Arrow IPC、月ごとのファイル) ---
+# 日付は date32、金額は int64 (小数を含む列は float64)、ROI は float64 の型付きの列で、
+# <ディレクトリ>/YYYY-MM.arrow に月ごとに分けて無圧縮で保存する。ROIトラッカーは空の保存先をこのアーカイブから
+# 1度だけ初期化する (rows)。読み込みは月ごとのファイルをメモリマップで開き、テキストとして解析しない。
+# 既存の CSV (または SQLite の保存先) からの変換:
+#   python session_archive.py poker_sessions.csv poker_sessions_archive
+
+COLUMNS = {'日付': 'date', '会場': 'venue', 'バイイン': 'buy_in', '賞金': 'payout', '純利益': 'net_profit', 'ROI': 'roi'}
+AMOUNT_COLUMNS = ('buy_in', 'payout', 'net_profit')
+PARTITION_PATTERN = re.compile(r'^(\d{4}-\d{2})\.arrow$')
+
+def _require_pyarrow():
+    if not AVAILABLE: raise RuntimeError('列指向アーカイブには pyarrow が必要です (pip install pyarrow)。')
+
+def _typed(table):
+    # 列名を英字にして型をそろえる (金額は整数で表せれば int64)
+    table = table.rename_columns([COLUMNS.get(name, name) for name in table.column_names])
+    if 'venue' not in table.column_names: table = table.append_column('venue', pa.nulls(len(table), pa.string()))
+    columns = {'date': table['date'].cast(pa.date32()), 'venue': table['venue'].cast(pa.string()), 'roi': table['roi'].cast(pa.float64())}
+    for name in AMOUNT_COLUMNS:
+        column = table[name]
+        try: columns[name] = column.cast(pa.int64())
+        except pa.ArrowInvalid: columns[name] = column.cast(pa.float64())
+    return pa.table({name: columns[name] for name in COLUMNS.values()})
+
+def _read_source(source):
+    if source.endswith('.csv'):
+        options = pa_csv.ConvertOptions(column_types={'日付': pa.date32(), '会場': pa.string()})
+        return _typed(pa_csv.read_csv(source, convert_options=options))
+    from session_store import SessionStore
+    df = SessionStore(source).frame().reset_index(drop=True)
+    df['日付'] = pd.to_datetime(df['日付']).dt.date
+    return _typed(pa.Table.from_pandas(df, preserve_index=False))
+
+def convert(source, directory):
+    # CSV (.csv) または SQLite の保存先を月ごとの Arrow ファイルに書き出す。返り値は {月: 件数}
+    _require_pyarrow()
+    table = _read_source(source)
+    os.makedirs(directory, exist_ok=True)
+    months = pc.strftime(table['date'], format='%Y-%m')
+    counts = {}
+    for month in pc.unique(months).to_pylist():
+        part = table.filter(pc.equal(months, month)).sort_by([('date', 'ascending')])
+        path = os.path.join(directory, f'{month}.arrow')
+        with pa.OSFile(f'{path}.tmp', 'wb') as sink, ipc.new_file(sink, part.schema) as writer: writer.write_table(part)
+        os.replace(f'{path}.tmp', path)
+        counts[month] = len(part)
+    return dict(sorted(counts.items()))
+
+def months(directory):
+    # アーカイブにある月 (古い順)
+    if not os.path.isdir(directory): return []
+    return sorted(match.group(1) for name in os.listdir(directory) if (match := PARTITION_PATTERN.match(name)))
+
+def rows(directory):
+    # SessionStore に取り込む行 (日付, 会場, バイイン, 賞金, 純利益, ROI)。月ごとに読む
+    _require_pyarrow()
+    for month in months(directory):
+        table = ipc.open_file(pa.memory_map(os.path.join(directory, f'{month}.arrow'))).read_all()
+        columns = [pc.strftime(table['date'], format='%Y-%m-%d').to_pylist()] + [table[name].to_pylist() for name in list(COLUMNS.values())[1:]]
+        yield from zip(*columns)
+
+def main():
+    parser = argparse.ArgumentParser(description='ROIトラッカーの記録を月ごとの Arrow ファイルに変換します。')
+    parser.add_argument('source', help='変換元の CSV (.csv) または SQLite の保存先 (.db)')
+    parser.add_argument('directory', help='書き出し先のディレクトリ')
+    args = parser.parse_args()
+    counts = convert(args.source, args.directory)
+    print(f"{sum(counts.values())}件を {len(counts)}か月分のファイルに書き出しました ({args.directory})。")
+
+if __name__ == '__main__':
+    main()
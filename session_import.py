@@ -0,0 +1,109 @@
+import argparse
+import csv
+import os
+import pandas as pd
+from session_store import COLUMNS, SessionStore
+
+# --- ROIトラッカーへの一括取り込み (CSV / TSV) ---
+# 他のサイトやスプレッドシートから書き出したファイルを CHUNK_ROWS 行ずつ読み、列を 日付/バイイン/賞金 (/会場) に
+# 対応づけて、純利益と ROI を列ごとにまとめて計算する。読んだ行は一時表に書き、最後に既存の記録と同じ内容の行を
+# 除いて1つのトランザクションで追加する (SessionStore.merge_rows)。メモリに持つのは1チャンク分だけ。
+#   python session_import.py export.tsv --column 日付=Date --column バイイン=Buy-in --column 賞金=Prize
+
+CHUNK_ROWS = 100_000
+HEADER_BYTES = 64 * 1024
+TARGET_COLUMNS = ('日付', 'バイイン', '賞金', '会場')
+REQUIRED_COLUMNS = ('日付', 'バイイン')
+# 列名の候補 (大文字・小文字と前後の空白は区別しない)
+COLUMN_ALIASES = {
+    '日付': ('日付', '日時', '開催日', 'date', 'datetime', 'start time', 'started'),
+    'バイイン': ('バイイン', '参加費', 'buy-in', 'buyin', 'buy in', 'buy_in', 'cost'),
+    '賞金': ('賞金', '獲得賞金', 'payout', 'prize', 'winnings', 'cashed', 'won'),
+    '会場': ('会場', '店舗', 'サイト', 'venue', 'site', 'room', 'location'),
+}
+
+def _head(source):
+    # ファイルの先頭 (パスでもアップロードされたファイルでもよい。ファイルは読んだあと先頭に戻す)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f: return f.read(HEADER_BYTES)
+    head = source.read(HEADER_BYTES)
+    source.seek(0)
+    return head
+
+def read_header(source):
+    # (列名の一覧, 区切り文字, 文字コード) を推定する。UTF-8 として読めなければ Shift_JIS (cp932)
+    head = _head(source)
+    try: encoding, text = 'utf-8-sig', head.decode('utf-8-sig')
+    except UnicodeDecodeError as e:
+        if e.start < len(head) - 3: encoding, text = 'cp932', head.decode('cp932', errors='replace')
+        else: encoding, text = 'utf-8-sig', head[:e.start].decode('utf-8-sig')  # 先頭の途中で切れた文字
+    header = text.splitlines()[0] if text else ''
+    sep = '\t' if header.count('\t') > header.count(',') else ','
+    return next(csv.reader([header], delimiter=sep, skipinitialspace=True), []), sep, encoding
+
+def guess_mapping(columns):
+    # {日付/バイイン/賞金/会場: ファイルの列名 (見つからなければ None)}
+    normalized = {column.strip().lower(): column for column in columns}
+    return {target: next((normalized[alias.lower()] for alias in aliases if alias.lower() in normalized), None) for target, aliases in COLUMN_ALIASES.items()}
+
+def _amount(series):
+    # 金額の列を数値にする (「¥1,000」「$1,000.00」のような表記も読む)
+    if pd.api.types.is_numeric_dtype(series): return series.astype(float)
+    return pd.to_numeric(series.astype(str).str.replace(r'[^\d.\-]', '', regex=True), errors='coerce')
+
+def normalize(chunk, mapping, dayfirst=False):
+    # ファイルの1チャンクを保存する形 (日付, 会場, バイイン, 賞金, 純利益, ROI) にする。返り値は (DataFrame, 読めなかった行数)
+    dates = pd.to_datetime(chunk[mapping['日付']], errors='coerce', dayfirst=dayfirst)
+    buy_in = _amount(chunk[mapping['バイイン']])
+    payout = _amount(chunk[mapping['賞金']]).fillna(0) if mapping.get('賞金') else pd.Series(0.0, index=chunk.index)
+    venue = chunk[mapping['会場']].astype('string').str.strip().replace('', pd.NA) if mapping.get('会場') else pd.Series(pd.NA, index=chunk.index, dtype='string')
+    valid = dates.notna() & (buy_in > 0)
+    buy_in, payout = buy_in[valid], payout[valid]
+    net_profit = payout - buy_in
+    df = pd.DataFrame({'date': dates[valid].dt.strftime('%Y-%m-%d'), 'venue': venue[valid], 'buy_in': buy_in, 'payout': payout, 'net_profit': net_profit, 'roi': net_profit / buy_in * 100})
+    return df[list(COLUMNS.values())], int((~valid).sum())
+
+def _rows(df):
+    # SQLite に渡せる Python の値の行 (金額は整数で表せれば整数、欠けた会場は NULL)
+    columns = []
+    for name in df.columns:
+        column = df[name]
+        if name in ('buy_in', 'payout', 'net_profit') and (column % 1 == 0).all(): column = column.astype('int64')
+        columns.append(column.astype(object).where(column.notna(), None).tolist())
+    return list(zip(*columns))
+
+def import_file(store, source, mapping=None, sep=None, encoding=None, dayfirst=False, chunk_rows=CHUNK_ROWS):
+    # source (パスまたはファイル) を store に取り込み、件数をまとめた dict を返す
+    columns, detected_sep, detected_encoding = read_header(source)
+    mapping = {**guess_mapping(columns), **(mapping or {})}
+    missing = [target for target in REQUIRED_COLUMNS if not mapping.get(target)]
+    if missing: raise ValueError(f"{'・'.join(missing)} の列を選んでください。")
+    unknown = [column for column in mapping.values() if column and column not in columns]
+    if unknown: raise ValueError(f"ファイルに列がありません: {', '.join(unknown)}")
+    skipped = []
+    def batches():
+        usecols = list(dict.fromkeys(column for column in mapping.values() if column))
+        reader = pd.read_csv(source, sep=sep or detected_sep, encoding=encoding or detected_encoding, usecols=usecols, chunksize=chunk_rows, skipinitialspace=True)
+        for chunk in reader:
+            df, invalid = normalize(chunk, mapping, dayfirst)
+            skipped.append(invalid)
+            yield _rows(df)
+    read, added = store.merge_rows(batches())
+    return {'読み込んだ行': read + sum(skipped), '追加した行': added, '重複していた行': read - added, '読めなかった行': sum(skipped)}
+
+def main():
+    parser = argparse.ArgumentParser(description='CSV / TSV のセッション記録を ROIトラッカーに一括で取り込みます。')
+    parser.add_argument('file', help='取り込むファイル')
+    parser.add_argument('--db', default='poker_sessions.db', help='取り込み先 (tor_roi.py の保存先)')
+    parser.add_argument('--column', action='append', default=[], metavar='項目=列名', help=f"列の対応 (項目は {'/'.join(TARGET_COLUMNS)})。省略した項目は列名から推定する")
+    parser.add_argument('--sep', help='区切り文字 (省略時は推定)')
+    parser.add_argument('--encoding', help='文字コード (省略時は UTF-8 か Shift_JIS を推定)')
+    parser.add_argument('--dayfirst', action='store_true', help='日付を 日/月/年 の順で読む')
+    args = parser.parse_args()
+    mapping = dict(item.split('=', 1) for item in args.column)
+    if set(mapping) - set(TARGET_COLUMNS): parser.error(f"項目は {'/'.join(TARGET_COLUMNS)} のいずれかです。")
+    result = import_file(SessionStore(args.db), args.file, mapping, args.sep, args.encoding, args.dayfirst)
+    print(' / '.join(f'{name}: {count}' for name, count in result.items()))
+
+if __name__ == '__main__':
+    main()
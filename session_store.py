@@ -0,0 +1,290 @@
+import csv
+import itertools
+import math
+import re
+import sqlite3
+import threading
+import pandas as pd
+
+# --- ROIトラッカーの記録の保存先 (SQLite) ---
+# 1件の追加は B木への1回の挿入 (O(log n)) で、ファイル全体を書き直さない。WAL モードなので
+# 書き込みの途中で落ちても、最後にコミットした状態から開き直せる。日付の降順の索引を持つので、
+# 新しい順の一覧は並べ替えなしで索引の順に読むだけになる。
+# 以前の CSV (poker_sessions.csv) や列指向アーカイブ (session_archive.py) は、保存先が空のときに1度だけ取り込む。
+# 合計と日別・週別・月別・会場別の集計は rollups 表に持ち、行の追加・変更・削除のたびに
+# トリガーで該当する集計行だけを足し引きする (1件あたり O(1))。画面は集計済みの値を読むだけ。
+
+COLUMNS = {'日付': 'date', '会場': 'venue', 'バイイン': 'buy_in', '賞金': 'payout', '純利益': 'net_profit', 'ROI': 'roi'}
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    buy_in NUMERIC,
+    payout NUMERIC,
+    net_profit NUMERIC,
+    roi REAL,
+    venue TEXT
+);
+CREATE INDEX IF NOT EXISTS sessions_by_date ON sessions (date DESC, id DESC);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS rollups (
+    period TEXT NOT NULL,
+    key TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    buy_in NUMERIC NOT NULL,
+    payout NUMERIC NOT NULL,
+    PRIMARY KEY (period, key)
+) WITHOUT ROWID;
+"""
+# 集計の単位 → 行から集計キーを作る式 (週は月曜日の日付。日付として読めない値はそのまま使う)
+ROLLUP_KEYS = {
+    'all': "''",
+    'day': '{row}.date',
+    'week': "COALESCE(date({row}.date, 'weekday 0', '-6 days'), {row}.date)",
+    'month': 'substr({row}.date, 1, 7)',
+    'venue': "COALESCE({row}.venue, '')",
+}
+PERIOD_NAMES = {'day': '日付', 'week': '週 (月曜日)', 'month': '月', 'venue': '会場'}
+
+def _rollup_statements(row, sign):
+    # 1行分を各集計に足す (sign=1) / 引く (sign=-1) SQL
+    statements = []
+    for period, key in ROLLUP_KEYS.items():
+        key = key.format(row=row)
+        statements.append(f"INSERT INTO rollups (period, key, sessions, buy_in, payout) VALUES ('{period}', {key}, {sign}, {sign} * COALESCE({row}.buy_in, 0), {sign} * COALESCE({row}.payout, 0)) "
+                          "ON CONFLICT (period, key) DO UPDATE SET sessions = sessions + excluded.sessions, buy_in = buy_in + excluded.buy_in, payout = payout + excluded.payout;")
+        if sign < 0: statements.append(f"DELETE FROM rollups WHERE period = '{period}' AND key = {key} AND sessions = 0;")
+    return '\n'.join(statements)
+
+TRIGGERS = [
+    f"CREATE TRIGGER IF NOT EXISTS sessions_rollup_insert AFTER INSERT ON sessions BEGIN\n{_rollup_statements('NEW', 1)}\nEND",
+    f"CREATE TRIGGER IF NOT EXISTS sessions_rollup_delete AFTER DELETE ON sessions BEGIN\n{_rollup_statements('OLD', -1)}\nEND",
+    f"CREATE TRIGGER IF NOT EXISTS sessions_rollup_update AFTER UPDATE OF date, buy_in, payout, venue ON sessions BEGIN\n{_rollup_statements('OLD', -1)}\n{_rollup_statements('NEW', 1)}\nEND",
+]
+# 一括取り込みで同じ内容の記録かを調べる索引 (日付・バイイン・賞金・会場が同じ行は同じ内容とみなす)
+DEDUP_KEY = ('{row}date', '{row}buy_in', '{row}payout', "COALESCE({row}venue, '')")
+DEDUP_INDEX = f"CREATE INDEX IF NOT EXISTS sessions_dedup ON sessions ({', '.join(key.format(row='') for key in DEDUP_KEY)})"
+IMPORT_CHUNK_ROWS = 10_000
+SEEDED_KEY = 'seeded'  # 以前の記録 (CSV・アーカイブ) で初期化済みの印
+EDITABLE_COLUMNS = ('日付', '会場', 'バイイン', '賞金')  # 純利益と ROI はバイインと賞金から計算する
+
+def _number(text):
+    # CSV の数値を書かれたとおりに戻す (整数は整数、小数は小数、空欄は NULL)
+    text = text.strip()
+    if not text: return None
+    try: return int(text)
+    except ValueError: return float(text)
+
+def _cell(value):
+    # DataFrame の値を SQLite に渡せる値にする (NaN は NULL、numpy の数値は Python の数値)
+    if value is None or (isinstance(value, float) and math.isnan(value)): return None
+    if hasattr(value, 'item'): return value.item()
+    if hasattr(value, 'isoformat'): return value.isoformat()
+    return value
+
+def derive(buy_in, payout):
+    # バイインと賞金から (純利益, ROI %) を計算する (バイインが0のとき ROI は NULL)
+    net_profit = (payout or 0) - (buy_in or 0)
+    return net_profit, (net_profit / buy_in * 100 if buy_in else None)
+
+def _edited_value(value):
+    # st.data_editor の差分の値 (JSON) を保存する値にする (日付は YYYY-MM-DD、整数で表せる小数は整数、空欄は NULL)
+    if isinstance(value, str): value = value.strip()[:10] if re.match(r'^\d{4}-\d{2}-\d{2}', value.strip()) else value.strip() or None
+    if isinstance(value, float) and value.is_integer(): value = int(value)
+    return _cell(value)
+
+def editor_changes(ids, state):
+    # st.data_editor の差分 (edited_rows / added_rows / deleted_rows。行は表示位置) を
+    # 行 ID ごとの (追加, 変更, 削除) にする。削除した行への変更は捨てる
+    deleted = [int(ids[position]) for position in state.get('deleted_rows', [])]
+    edited = {int(ids[int(position)]): {name: _edited_value(value) for name, value in changes.items()} for position, changes in state.get('edited_rows', {}).items()}
+    added = [{name: _edited_value(value) for name, value in row.items()} for row in state.get('added_rows', [])]
+    return added, {row_id: changes for row_id, changes in edited.items() if row_id not in deleted}, deleted
+
+class SessionStore:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._writes = 0  # この接続で書き込んだ回数
+        self._cache = {}
+        self._migrate()
+
+    def _migrate(self):
+        # 会場の列・重複判定の索引・集計表がない古いファイルを更新する (集計は既存の行から1度だけ作る)
+        def apply(conn):
+            if 'venue' not in {row[1] for row in conn.execute('PRAGMA table_info(sessions)')}: conn.execute('ALTER TABLE sessions ADD COLUMN venue TEXT')
+            conn.execute(DEDUP_INDEX)
+            if not conn.execute("SELECT 1 FROM meta WHERE key = 'rollups'").fetchone():
+                self._bulk(conn, lambda: None)
+                conn.execute("INSERT INTO meta (key, value) VALUES ('rollups', '1')")
+        self._write(apply)
+
+    @staticmethod
+    def _bulk(conn, write, appended_after=None):
+        # 大量の書き込みは行ごとのトリガーを外して行い、最後に集計をまとめて直す (同じトランザクション内)。
+        # appended_after (行の ID) を渡すと、それより後に追加した行だけを集計に足す (追加だけの書き込み用)。
+        # 返り値は追加した行の数 (appended_after を渡したとき)
+        for name in ('insert', 'delete', 'update'): conn.execute(f'DROP TRIGGER IF EXISTS sessions_rollup_{name}')
+        write()
+        if appended_after is None: conn.execute('DELETE FROM rollups')
+        for period, key in ROLLUP_KEYS.items():
+            key = key.format(row='sessions')
+            conn.execute(f"INSERT INTO rollups SELECT '{period}', {key}, COUNT(*), TOTAL(COALESCE(buy_in, 0)), TOTAL(COALESCE(payout, 0)) FROM sessions WHERE id > ? GROUP BY {key} "
+                         "ON CONFLICT (period, key) DO UPDATE SET sessions = sessions + excluded.sessions, buy_in = buy_in + excluded.buy_in, payout = payout + excluded.payout", (appended_after or 0,))
+        for trigger in TRIGGERS: conn.execute(trigger)
+        if appended_after is not None: return conn.execute('SELECT COUNT(*) FROM sessions WHERE id > ?', (appended_after,)).fetchone()[0]
+
+    @staticmethod
+    def _last_id(conn): return conn.execute('SELECT COALESCE(MAX(id), 0) FROM sessions').fetchone()[0]
+
+    def _write(self, apply):
+        # 1つのトランザクションで書き込む (途中で失敗したら何も変えない)
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try: result = apply(self._conn)
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+            self._writes += 1
+            return result
+
+    @property
+    def version(self):
+        # 保存先の版 (読み込み結果のキャッシュの判定用)。この接続の書き込み回数と、他の接続 (取り込みの CLI・
+        # アーカイブの変換・別のプロセス) が書き込むと変わる PRAGMA data_version の組
+        with self._lock: return self._writes, self._conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def __len__(self):
+        with self._lock: return self._conn.execute('SELECT COUNT(*) FROM sessions').fetchone()[0]
+
+    def seed_rows(self, rows):
+        # 以前の記録 (日付, 会場, バイイン, 賞金, 純利益, ROI) で空の保存先を初期化する。取り込み元 (CSV・アーカイブ) によらず
+        # 共通の印 (meta の seeded) を残し、印があるか記録が1件でもあれば何もしない (同じ記録を2度取り込まない)。返り値は取り込んだ件数
+        with self._lock:
+            if self._conn.execute('SELECT 1 FROM meta WHERE key = ?', (SEEDED_KEY,)).fetchone(): return 0
+        def insert(conn):
+            iterator = iter(rows)
+            while chunk := list(itertools.islice(iterator, IMPORT_CHUNK_ROWS)):
+                conn.executemany(f"INSERT INTO sessions ({', '.join(COLUMNS.values())}) VALUES ({', '.join('?' * len(COLUMNS))})", chunk)
+        def apply(conn):
+            # 別のプロセスが先に初期化した場合に備えて、書き込みのトランザクションの中で確かめ直す
+            if conn.execute('SELECT 1 FROM meta WHERE key = ?', (SEEDED_KEY,)).fetchone(): return 0
+            count = 0 if conn.execute('SELECT 1 FROM sessions LIMIT 1').fetchone() else self._bulk(conn, lambda: insert(conn), appended_after=0)
+            conn.execute('INSERT INTO meta (key, value) VALUES (?, ?)', (SEEDED_KEY, str(count)))
+            return count
+        return self._write(apply)
+
+    def seed_csv(self, csv_path):
+        # 以前の CSV を書かれている値のまま取り込んで、空の保存先を初期化する (seed_rows と同じく1度だけ)
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            return self.seed_rows((row['日付'], (row.get('会場') or '').strip() or None, *(_number(row.get(column) or '') for column in ('バイイン', '賞金', '純利益', 'ROI'))) for row in reader)
+
+    def merge_rows(self, batches):
+        # (日付, 会場, バイイン, 賞金, 純利益, ROI) の行のバッチを一時表に書いてから、既存の記録と重複しない行だけを
+        # 1つのトランザクションで追加する。同じ内容の行は、取り込む側の件数が既存の件数を超えた分だけ追加するので、
+        # 同じファイルを何度取り込んでも増えず、同じ日に同じ内容のセッションが複数あっても失われない。
+        # 返り値は (読んだ件数, 追加した件数)
+        columns = ', '.join(COLUMNS.values())
+        with self._lock:
+            self._conn.execute(f'CREATE TEMP TABLE import_staging (seq INTEGER PRIMARY KEY, {columns})')
+            try:
+                # 一時表への書き込みは保存先のファイルに触れないので、まとめて1回だけコミットする
+                self._conn.execute('BEGIN')
+                try:
+                    for batch in batches: self._conn.executemany(f"INSERT INTO import_staging ({columns}) VALUES ({', '.join('?' * len(COLUMNS))})", batch)
+                except BaseException:
+                    self._conn.execute('ROLLBACK')
+                    raise
+                self._conn.execute('COMMIT')
+                staged = self._conn.execute('SELECT COUNT(*) FROM import_staging').fetchone()[0]
+                same = ' AND '.join(f"{key.format(row='sessions.')} = {key.format(row='staged.')}" for key in DEDUP_KEY)
+                partition = ', '.join(key.format(row='') for key in DEDUP_KEY)
+                # 取り込む順ではなく重複判定の鍵 (日付が先頭) の順に追加するので、日付の索引への追加がまとまって速い
+                merge = (f"INSERT INTO sessions ({columns}) SELECT {columns} FROM ("
+                         f"SELECT *, ROW_NUMBER() OVER (PARTITION BY {partition} ORDER BY seq) AS occurrence FROM import_staging) AS staged "
+                         f"WHERE occurrence > (SELECT COUNT(*) FROM sessions INDEXED BY sessions_dedup WHERE {same})")
+                return staged, self._write(lambda conn: self._bulk(conn, lambda: conn.execute(merge), appended_after=self._last_id(conn)))
+            finally: self._conn.execute('DROP TABLE temp.import_staging')
+
+    def add(self, date, buy_in, payout, net_profit, roi, venue=None):
+        # 1件追加して、その行の ID を返す
+        return self._write(lambda conn: conn.execute('INSERT INTO sessions (date, buy_in, payout, net_profit, roi, venue) VALUES (?, ?, ?, ?, ?, ?)', (_cell(date), buy_in, payout, net_profit, roi, venue or None)).lastrowid)
+
+    def apply_changes(self, added=(), edited=None, deleted=()):
+        # 一覧の差分だけを1つのトランザクションで書き込む (集計はトリガーで行ごとに更新される)。
+        # added は {列名: 値} の列、edited は {ID: {列名: 値}}、deleted は ID の列。
+        # 追加した行と、バイインか賞金を変えた行の 純利益・ROI は計算し直す。返り値は追加した行の ID
+        edited = edited or {}
+        for changes in [*added, *edited.values()]:
+            if 'バイイン' in changes and not (changes['バイイン'] or 0) > 0: raise ValueError("バイインは0より大きい値を入力してください。")
+            if '日付' in changes and not changes['日付']: raise ValueError("日付を入力してください。")
+        for row in added:
+            if not row.get('日付'): raise ValueError("日付を入力してください。")
+            if 'バイイン' not in row: raise ValueError("バイインは0より大きい値を入力してください。")
+        def apply(conn):
+            conn.executemany('DELETE FROM sessions WHERE id = ?', [(row_id,) for row_id in deleted])
+            for row_id, changes in edited.items():
+                values = {COLUMNS[name]: _cell(value) for name, value in changes.items() if name in EDITABLE_COLUMNS}
+                if 'buy_in' in values or 'payout' in values:
+                    current = conn.execute('SELECT buy_in, payout FROM sessions WHERE id = ?', (row_id,)).fetchone()
+                    if current is None: continue
+                    values['net_profit'], values['roi'] = derive(values.get('buy_in', current[0]), values.get('payout', current[1]))
+                if values: conn.execute(f"UPDATE sessions SET {', '.join(f'{column} = ?' for column in values)} WHERE id = ?", (*values.values(), row_id))
+            ids = []
+            for row in added:
+                buy_in, payout = _cell(row['バイイン']), _cell(row.get('賞金')) or 0
+                ids.append(conn.execute('INSERT INTO sessions (date, venue, buy_in, payout, net_profit, roi) VALUES (?, ?, ?, ?, ?, ?)', (_cell(row['日付']), _cell(row.get('会場')) or None, buy_in, payout, *derive(buy_in, payout))).lastrowid)
+            return ids
+        return self._write(apply)
+
+    def _cached(self, name, build):
+        # 保存先への書き込みがあるまで同じ結果を返す (呼び出し側で変更しないこと)
+        with self._lock:
+            version = self.version
+            if name not in self._cache or self._cache[name][0] != version: self._cache[name] = (version, build())
+            return self._cache[name][1]
+
+    def _read(self, suffix='', params=()):
+        # 新しい順の一覧 (索引は行の ID)。日付の索引を順に読むだけで並べ替えない
+        with self._lock: df = pd.read_sql_query(f"SELECT id, {', '.join(COLUMNS.values())} FROM sessions INDEXED BY sessions_by_date ORDER BY date DESC, id DESC{suffix}", self._conn, params=params, index_col='id')
+        return df.rename(columns={column: name for name, column in COLUMNS.items()})
+
+    def frame(self):
+        # 新しい順の一覧全体
+        return self._cached('frame', self._read)
+
+    def page(self, offset, limit):
+        # 新しい順の一覧の offset 件目から limit 件だけを読む
+        return self._read(' LIMIT ? OFFSET ?', (limit, offset))
+
+    def totals(self):
+        # 全体の合計 (集計表の1行を読むだけ)
+        def build():
+            row = self._conn.execute("SELECT sessions, buy_in, payout FROM rollups WHERE period = 'all'").fetchone() or (0, 0, 0)
+            return {'セッション数': row[0], 'バイイン': row[1], '賞金': row[2], '純利益': row[2] - row[1], 'ROI': (row[2] - row[1]) / row[1] * 100 if row[1] else 0.0}
+        return self._cached('totals', build)
+
+    def rollup(self, period):
+        # 日別・週別・月別・会場別の集計 (期間は新しい順、会場は純利益の大きい順)
+        def build():
+            df = pd.read_sql_query('SELECT key, sessions, buy_in, payout FROM rollups WHERE period = ? ORDER BY key DESC', self._conn, params=(period,))
+            df.columns = [PERIOD_NAMES[period], 'セッション数', 'バイイン', '賞金']
+            df['純利益'] = df['賞金'] - df['バイイン']
+            df['ROI'] = (df['純利益'] / df['バイイン'].where(df['バイイン'] != 0)).fillna(0) * 100
+            if period != 'venue': return df
+            df['会場'] = df['会場'].replace('', '(未設定)')
+            return df.sort_values('純利益', ascending=False, ignore_index=True)
+        return self._cached(f'rollup:{period}', build)
+
+    def cumulative_profit(self):
+        # 日ごとの累積純利益 (日別の集計の累積和なので、セッション数ではなく日数に比例する)
+        def build():
+            df = self.rollup('day').iloc[::-1]
+            return pd.DataFrame({'日付': df['日付'].to_numpy(), '累積純利益': df['純利益'].cumsum().to_numpy()})
+        return self._cached('cumulative', build)
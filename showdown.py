@@ -0,0 +1,65 @@
+import numpy as np
+from low_eval import score_game
+from equity import BOARD_SIZE, GAME_LAYOUTS, part_groups, part_names
+
+# --- ショーダウンのポット分配 ---
+# ポットを最小チップ単位で数え、次の順で割り切れない分 (端数チップ) を決める。
+# 1. ボードごとのまとまりに等分 (端数はボード1へ)
+# 2. まとまりの中で成立した取り分 (ハイ/ロー等) に等分 (端数はハイ側へ)。
+#    どの取り分も成立しなければ、ショーダウンした全員でチョップ
+# 3. 取り分の中で同じ強さの勝者に等分 (端数はボタンの左から近い順)
+# プレイヤーの並びはボタンの左から時計回りとする。配列のまま大量に判定できるので、
+# シミュレーションの支払い関数としても使える。
+
+def _split(amount, receivers):
+    # amount (N,) を receivers (N, M) の True の位置に等分する。端数は先頭から1単位ずつ
+    count = receivers.sum(axis=1)
+    base = np.where(count > 0, amount // np.maximum(count, 1), 0)
+    extra = np.where(count > 0, amount % np.maximum(count, 1), 0)
+    order = np.cumsum(receivers, axis=1) - 1
+    return np.where(receivers, base[:, None] + (order < extra[:, None]), 0)
+
+def split_values(game, values, pot, chip_unit=1):
+    # values: (N, プレイヤー, 取り分) の判定値 (0 は不成立)。
+    # 返り値は (各プレイヤーの獲得額 (N, プレイヤー), 取り分ごとの獲得額 (N, プレイヤー, 取り分), チョップになったか (N, まとまり))
+    values = np.asarray(values)
+    showdowns, players, parts = values.shape
+    units = np.broadcast_to(np.asarray(pot, dtype=np.int64) // chip_unit, (showdowns,))
+    groups = part_groups(game)
+    best = values.max(axis=1, keepdims=True)
+    qualified = best[:, 0, :] > 0
+    winners = (values == best) & (best > 0)
+    group_amounts = _split(units, np.ones((showdowns, len(groups)), dtype=bool))
+    part_chips = np.zeros((showdowns, players, parts), dtype=np.int64)
+    chopped = np.zeros((showdowns, len(groups)), dtype=bool)
+    chop_chips = np.zeros((showdowns, players), dtype=np.int64)
+    for g, group in enumerate(groups):
+        group = list(group)
+        part_amounts = _split(group_amounts[:, g], qualified[:, group])
+        for j, part in enumerate(group): part_chips[:, :, part] = _split(part_amounts[:, j], winners[:, :, part])
+        chopped[:, g] = ~qualified[:, group].any(axis=1)
+        chop_chips += _split(np.where(chopped[:, g], group_amounts[:, g], 0), np.ones((showdowns, players), dtype=bool))
+    chips = (part_chips.sum(axis=2) + chop_chips) * chip_unit
+    return chips, part_chips * chip_unit, chopped
+
+def resolve_showdowns(game, pot, hands, boards=None, chip_unit=1):
+    # バッチ版。hands: (N, プレイヤー, 手札)、boards: (N, ボードの枚数) または None、pot: 数値か (N,)。
+    # 返り値は各プレイヤーの獲得額 (N, プレイヤー)
+    hands = np.asarray(hands, dtype=np.int16)
+    if boards is not None: boards = np.asarray(boards, dtype=np.int16)
+    values = np.stack([score_game(game, hands[:, k], boards) for k in range(hands.shape[1])], axis=1)
+    return split_values(game, values, pot, chip_unit)[0]
+
+def resolve_showdown(game, pot, hands, boards=(), chip_unit=1):
+    # 1回分のショーダウン。hands: プレイヤーごとのカード、boards: ボードごとのカード (全て公開済み)
+    hole_options, board_count = GAME_LAYOUTS[game]
+    if pot % chip_unit: raise ValueError("ポットは最小チップ単位の倍数で入力してください。")
+    if len(hands) < 2: raise ValueError("プレイヤーは2人以上必要です。")
+    if len({len(hand) for hand in hands}) != 1 or len(hands[0]) not in hole_options: raise ValueError(f"{game} の手札は全員 {' か '.join(map(str, hole_options))} 枚です。")
+    if len(boards) != board_count or any(len(board) != BOARD_SIZE for board in boards): raise ValueError(f"ボードは{board_count}つ、各{BOARD_SIZE}枚を入力してください。" if board_count else "このゲームにボードはありません。")
+    cards = [c for hand in hands for c in hand] + [c for board in boards for c in board]
+    if len(set(cards)) != len(cards): raise ValueError("同じカードが重複しています。")
+    board_array = np.array([[c for board in boards for c in board]], dtype=np.int16) if board_count else None
+    values = np.stack([score_game(game, np.array([hand], dtype=np.int16), board_array) for hand in hands], axis=1)
+    chips, part_chips, chopped = split_values(game, values, pot, chip_unit)
+    return {'chips': chips[0].tolist(), 'parts': dict(zip(part_names(game), part_chips[0].T.tolist())), 'chopped': bool(chopped[0].any()), 'qualified': dict(zip(part_names(game), (values[0].max(axis=0) > 0).tolist()))}
@@ -0,0 +1,12 @@
+from bounty_analytics import payout_quantiles
+from bounty_sampler import BountySampler
+
+def test_quantiles_are_stable_for_the_same_state():
+    entries = [{'amount': 100, 'count': 20}, {'amount': 5000, 'count': 3}, {'amount': 1000, 'count': 10}]
+    sampler = BountySampler(entries, seed=7)
+    # 回数が少ないと乱数しだいで値が変わるので、同じ乱数を使っていることが分かる
+    assert all(payout_quantiles(sampler, 9, simulations=20) == payout_quantiles(sampler, 9, simulations=20) for _ in range(20))
+    # 同じシードで同じ本数を引いたサンプラーとも一致する
+    other = BountySampler(entries, seed=7)
+    sampler.draw(); other.draw()
+    assert payout_quantiles(sampler, 9, simulations=20) == payout_quantiles(other, 9, simulations=20)
@@ -0,0 +1,50 @@
+import time
+from itertools import product
+import pytest
+from chip_solver import select_chip_denominations, solve_ring_game
+
+def _payable(amount, counts):
+    # counts (額面: 枚数) の一部でちょうど amount を支払えるか
+    reachable = {0}
+    for chip, count in counts.items(): reachable = {value + chip * k for value in reachable for k in range(count + 1) if value + chip * k <= amount}
+    return amount in reachable
+
+def _brute_force(sb, bb, stack_value, inventory=None):
+    # 全ての配布を調べた最小の合計枚数 (割り当て不能なら None)
+    denominations = select_chip_denominations(sb)
+    limits = [stack_value // chip if inventory is None else inventory.get(chip, 0) for chip in denominations]
+    best = None
+    for counts in product(*(range(limit + 1) for limit in limits[1:])):
+        rest = stack_value - sum(chip * count for chip, count in zip(denominations[1:], counts))
+        if rest < 0 or rest % denominations[0] or rest // denominations[0] > limits[0]: continue
+        allocation = dict(zip(denominations, (rest // denominations[0], *counts)))
+        if _payable(sb, allocation) and _payable(bb, allocation) and (best is None or sum(allocation.values()) < best): best = sum(allocation.values())
+    return best
+
+@pytest.mark.parametrize('sb, bb, stack_bb, inventory', [(1, 2, 50, None), (1, 3, 50, None), (2, 5, 50, None), (5, 10, 50, None), (5, 10, 50, {5: 4, 10: 3, 25: 6, 100: 2}), (1, 2, 50, {1: 2, 5: 3, 10: 2, 25: 10})])
+def test_matches_brute_force(sb, bb, stack_bb, inventory):
+    allocation, exact = solve_ring_game(sb, bb, stack_bb, inventory)
+    expected = _brute_force(sb, bb, stack_bb * bb, inventory)
+    assert exact
+    if expected is None: assert allocation == {}
+    else:
+        assert sum(allocation.values()) == expected
+        assert sum(chip * count for chip, count in allocation.items()) == stack_bb * bb
+        assert _payable(sb, allocation) and _payable(bb, allocation)
+        if inventory: assert all(count <= inventory[chip] for chip, count in allocation.items())
+
+def test_known_allocations():
+    # 合計枚数 (22枚・13枚) は全探索で確かめた最小
+    assert solve_ring_game(1, 2, 200) == ({1: 5, 10: 2, 25: 15}, True)
+    assert solve_ring_game(25, 50, 100) == ({25: 4, 100: 4, 500: 1, 1000: 4}, True)
+
+def test_large_blinds_are_bounded():
+    # ブラインドが小さい額面に比べて大きくても、支払い方の列挙を打ち切って有効な構成を返す
+    start = time.perf_counter()
+    allocation, exact = solve_ring_game(5000, 10000, 100)
+    assert time.perf_counter() - start < 10
+    assert not exact
+    assert sum(chip * count for chip, count in allocation.items()) == 10000 * 100
+
+def test_oversized_stack_is_rejected():
+    with pytest.raises(ValueError): solve_ring_game(1, 100000, 1000)
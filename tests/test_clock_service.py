@@ -0,0 +1,28 @@
+import pytest
+from clock_service import ClockService
+
+def test_seating_bust_removes_player_from_bounty_ledger():
+    service = ClockService()
+    service.start_seating('t', 1, seed=1)
+    for player in ('A', 'B', 'C'): service.seating_action('t', 'register', player)
+    service.start_bounties('t', 100)
+    service.seating_action('t', 'bust', 'A')
+    summary = service.bounty_summary('t')
+    assert summary['remaining'] == ['B', 'C']
+    assert summary['total_on_heads'] == 200
+    record, _ = service.record_knockout('t', 'B', ['C'])
+    assert record.bounty == 100
+
+def test_reregistering_busted_player_changes_nothing():
+    service = ClockService()
+    service.start_seating('t', 1, seed=1)
+    for player in ('A', 'B', 'C'): service.seating_action('t', 'register', player)
+    service.start_bounties('t', 100)
+    service.seating_action('t', 'bust', 'A')
+    with pytest.raises(ValueError): service.seating_action('t', 'register', 'A')
+    assert 'A' not in service.seated_players('t')
+    assert service.snapshot('t').entries == 3
+    assert service.bounty_summary('t')['remaining'] == ['B', 'C']
+
+def test_finish_bounties_without_ledger():
+    with pytest.raises(ValueError): ClockService().finish_bounties('t', 'A')
@@ -0,0 +1,33 @@
+import numpy as np
+from hand_eval import evaluate_high, parse_cards
+from low_eval import evaluate_27_low, evaluate_pips_high, evaluate_pips_low, score_game
+
+def _27(*hands): return evaluate_27_low(np.array([parse_cards(hand) for hand in hands]))
+
+def test_deuce_seven_orderings():
+    # 強い順 (値が大きいほど強い): 75432 > 86432 > A5432 (A ハイ、ストレートではない) > 22 のペア > ストレート > フラッシュ
+    values = _27('7c5d4h3s2c', '8c6d4h3s2c', 'Ac5d4h3s2c', '2c2d7h5s3c', '3c4d5h6s7c', '2h4h6h8hTh')
+    assert list(values) == sorted(values, reverse=True)
+    assert len(set(values)) == len(values)
+
+def test_wheel_is_ace_high_in_deuce_seven():
+    wheel, ace_high = _27('Ac5d4h3s2c', 'Ac6d4h3s2c')
+    assert wheel > ace_high  # A5432 は A6432 より強い A ハイ
+    # 同じスートの A5432 はストレートフラッシュではなくフラッシュ (ストレートより弱く、フルハウスより強い)
+    suited_wheel, suited_ace_high, straight, full_house = _27('Ah5h4h3h2h', 'Ah6h4h3h2h', '3c4d5h6s7c', 'KcKdKh2s2c')
+    assert full_house < suited_ace_high < suited_wheel < straight < ace_high
+
+def test_high_hand_keeps_wheel_straight():
+    wheel, ace_high = evaluate_high(np.array([parse_cards('Ac5d4h3s2c'), parse_cards('Ac6d4h3s2c')]))
+    assert wheel > ace_high
+
+def test_drawmaha_deuce_seven_uses_ace_high():
+    hole = parse_cards('Ac5d4h3s2c')
+    values = score_game('Drawmaha - 27 lowball', [hole], [parse_cards('7d8dTh')])
+    assert values[0, 0] == _27('Ac5d4h3s2c')[0]
+
+def test_pips_zero_counts_ten_as_picture():
+    # 0: T はピクチャー。KQJTK がナッツ (50) で、A を含むと1点
+    nuts, ace, nine = evaluate_pips_low(np.array([parse_cards(hand) for hand in ('KcQdJhTsKd', 'KcQdJhTsAd', 'KcQdJhTs9d')]))
+    assert nuts == 50 and ace == 49 and nine == 41
+    assert evaluate_pips_high(np.array([parse_cards('TcTdThTs9d')]))[0] == 49
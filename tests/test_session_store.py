@@ -0,0 +1,59 @@
+import pytest
+from session_store import SessionStore
+
+def _write_csv(path):
+    path.write_text('日付,バイイン,賞金,純利益,ROI\n2025-08-07,10,11,1,10.0\n', encoding='utf-8')
+
+def test_seed_csv_only_once(tmp_path):
+    csv_path = tmp_path / 'poker_sessions.csv'
+    _write_csv(csv_path)
+    store = SessionStore(str(tmp_path / 'poker_sessions.db'))
+    assert store.seed_csv(str(csv_path)) == 1
+    assert store.seed_csv(str(csv_path)) == 0
+    assert len(store) == 1
+
+def test_seed_skips_store_with_rows(tmp_path):
+    store = SessionStore(str(tmp_path / 'poker_sessions.db'))
+    store.add('2025-08-08', 100, 300, 200, 200.0)
+    assert store.seed_rows([('2025-08-07', None, 10, 11, 1, 10.0)]) == 0
+    assert len(store) == 1
+
+def test_archive_does_not_reseed_existing_store(tmp_path):
+    # CSV で初期化した保存先に1件追加し、保存先や CSV からアーカイブを作っても、開き直したときに記録が増えない
+    session_archive = pytest.importorskip('session_archive')
+    if not session_archive.AVAILABLE: pytest.skip('pyarrow がありません')
+    csv_path, db_path = tmp_path / 'poker_sessions.csv', str(tmp_path / 'poker_sessions.db')
+    _write_csv(csv_path)
+    store = SessionStore(db_path)
+    store.seed_csv(str(csv_path))
+    store.add('2025-08-08', 100, 300, 200, 200.0)
+    before = store.totals()
+    for source, directory in ((db_path, tmp_path / 'from_db'), (str(csv_path), tmp_path / 'from_csv')):
+        session_archive.convert(source, str(directory))
+        reopened = SessionStore(db_path)
+        assert reopened.seed_rows(session_archive.rows(str(directory))) == 0
+        assert reopened.seed_csv(str(csv_path)) == 0
+        assert reopened.totals() == before == {'セッション数': 2, 'バイイン': 110, '賞金': 311, '純利益': 201, 'ROI': pytest.approx(201 / 110 * 100)}
+
+def test_archive_seeds_new_store(tmp_path):
+    session_archive = pytest.importorskip('session_archive')
+    if not session_archive.AVAILABLE: pytest.skip('pyarrow がありません')
+    csv_path = tmp_path / 'poker_sessions.csv'
+    _write_csv(csv_path)
+    session_archive.convert(str(csv_path), str(tmp_path / 'archive'))
+    store = SessionStore(str(tmp_path / 'poker_sessions.db'))
+    assert store.seed_rows(session_archive.rows(str(tmp_path / 'archive'))) == 1
+    assert store.seed_csv(str(csv_path)) == 0
+    assert store.totals()['賞金'] == 11
+
+def test_cache_sees_writes_from_other_connections(tmp_path):
+    # 取り込みの CLI や別のプロセスが書き込んだら、キャッシュした集計を読み直す
+    db_path = str(tmp_path / 'poker_sessions.db')
+    store, other = SessionStore(db_path), SessionStore(db_path)
+    store.add('2025-08-07', 10, 11, 1, 10.0)
+    assert store.totals()['セッション数'] == 1
+    version = store.version
+    other.add('2025-08-08', 100, 300, 200, 200.0)
+    assert store.version != version
+    assert store.totals()['セッション数'] == 2
+    assert len(store.frame()) == 2
@@ -0,0 +1,12 @@
+import pandas as pd
+from tournament_sim import simulate_tournament
+
+def test_finished_runs_are_not_averaged():
+    # スタックが浅く、ほとんどの回が途中のレベルで終わるストラクチャー
+    structure = pd.DataFrame({'レベル': [1, 2, 3], 'SB': [50, 100, 200], 'BB': [100, 200, 400], 'BBアンティ': [0, 200, 400], 'レベル時間 (分)': [20, 20, 20]})
+    result = simulate_tournament(structure, 3, 500, runs=2000, seed=0)
+    players = result['per_level']['平均残り人数'].dropna()
+    assert (players >= 2).all()
+    assert result['per_level']['進行中の割合'].iloc[-1] < 1
+    assert not result['unfinished'].any()
+    assert (result['finish_minutes'] <= 60 * 3).all()
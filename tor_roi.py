@@ -1,96 +1,166 @@
 import streamlit as st
-import pandas as pd
 import os
 import datetime
+import pandas as pd
+import profiling
+
+import roi_chart
+import session_archive
+import session_import
+from session_store import EDITABLE_COLUMNS, SessionStore, editor_changes
 
-# CSVファイルのパスを定義
+# 記録は SQLite に保存する (保存先が空なら、列指向アーカイブがあればそれを、なければ以前の CSV を取り込む)
 DATA_FILE = 'poker_sessions.csv'
+DB_FILE = 'poker_sessions.db'
+ARCHIVE_DIR = 'poker_sessions_archive'
+PAGE_SIZES = (50, 100, 500)
 st.set_page_config(
     page_title="ROItool",
     page_icon=":1234:" # ここでアイコンを指定
 )
 # --- データの読み込みと初期化 ---
-def load_data():
-    if os.path.exists(DATA_FILE):
-        return pd.read_csv(DATA_FILE)
-    return pd.DataFrame(columns=['日付', 'バイイン', '賞金', '純利益', 'ROI'])
-
-def save_data(df):
-    df.to_csv(DATA_FILE, index=False)
-
-if 'sessions' not in st.session_state:
-    st.session_state.sessions = load_data()
-    # データを日付の降順（新しいものが上）にソートして保存
-    if not st.session_state.sessions.empty:
-        st.session_state.sessions = st.session_state.sessions.sort_values(by='日付', ascending=False, ignore_index=True)
-
-# --- アプリケーションのUI ---
-st.title('ポーカーROIトラッカー')
-st.write('ポーカーセッションのROIを記録しましょう！')
-
-# フォームの作成
-with st.form("session_form"):
-    st.subheader("新しいセッションの追加")
-    # デフォルトで今日の日付を設定
-    date = st.date_input("日付", value=datetime.date.today())
-    buy_in = st.number_input("バイイン（円）", min_value=0)
-    payout = st.number_input("賞金（円）", min_value=0)
-    submitted = st.form_submit_button("セッションを追加")
-
-    if submitted:
-        if buy_in <= 0:
-            st.error("バイインは0より大きい値を入力してください。")
-        else:
-            net_profit = payout - buy_in
-            roi = (net_profit / buy_in) * 100
-            new_session = pd.DataFrame([{
-                '日付': date,
-                'バイイン': buy_in,
-                '賞金': payout,
-                '純利益': net_profit,
-                'ROI': roi
-            }])
-            # 新しいセッションデータを追加し、日付でソート
-            st.session_state.sessions = pd.concat([st.session_state.sessions, new_session], ignore_index=True)
-            st.session_state.sessions = st.session_state.sessions.sort_values(by='日付', ascending=False, ignore_index=True)
-            # データをCSVに保存
-            save_data(st.session_state.sessions)
-
-# --- 計算結果の表示 ---
-if not st.session_state.sessions.empty:
-    st.subheader("全体の結果")
-    total_buy_in = st.session_state.sessions['バイイン'].sum()
-    total_payout = st.session_state.sessions['賞金'].sum()
-    total_net_profit = total_payout - total_buy_in
-    if total_buy_in > 0:
-        overall_roi = (total_net_profit / total_buy_in) * 100
-    else:
-        overall_roi = 0
+# 保存先はサーバープロセスに1つ (全てのブラウザで共有し、接続を開き直さない)
+@st.cache_resource
+def get_store(path):
+    store = SessionStore(path)
+    # 保存先が空のときだけ、アーカイブ (なければ以前の CSV) で初期化する。どちらか一方を1度だけ取り込む
+    if session_archive.AVAILABLE and session_archive.months(ARCHIVE_DIR): store.seed_rows(session_archive.rows(ARCHIVE_DIR))
+    elif os.path.exists(DATA_FILE): store.seed_csv(DATA_FILE)
+    return store
 
-    col1, col2, col3, col4 = st.columns(4)
-    col1.metric("総バイイン", f"{total_buy_in:,.0f}円")
-    col2.metric("総賞金", f"{total_payout:,.0f}円")
-    col3.metric("総純利益", f"{total_net_profit:,.0f}円")
-    col4.metric("全体ROI", f"{overall_roi:.2f}%")
+# グラフの点は保存先の版 (このアプリや取り込みの CLI などが書き込むたびに変わる) と表示する期間ごとにキャッシュする
+@st.cache_data(max_entries=64, show_spinner=False)
+def cached_chart(path, version, start, end, rolling_days):
+    store = get_store(path)
+    return roi_chart.chart_data(store.cumulative_profit(), store.rollup('day'), start, end, rolling_days)
 
-    # --- グラフの表示 ---
-    st.subheader("ROIの推移")
-    st.line_chart(st.session_state.sessions['ROI'])
-    
-    # --- 履歴の表示と削除機能 ---
-    st.subheader("セッション履歴（削除可能）")
-    st.write("削除したい行の左側にあるチェックボックスにチェックを入れ、[Delete]ボタンを押してください。")
-    
-    edited_df = st.data_editor(
-        st.session_state.sessions, 
-        num_rows="dynamic",
-        use_container_width=True
-    )
+@profiling.timed('io:load_page')
+def load_page(offset, limit):
+    return get_store(os.path.abspath(DB_FILE)).page(offset, limit)
+
+@profiling.timed('io:save_changes')
+def save_changes(added, edited, deleted):
+    return get_store(os.path.abspath(DB_FILE)).apply_changes(added, edited, deleted)
+
+@profiling.timed('io:import_file')
+def import_sessions(uploaded, mapping, dayfirst):
+    return session_import.import_file(get_store(os.path.abspath(DB_FILE)), uploaded, mapping, dayfirst=dayfirst)
+
+@profiling.timed('io:add_session')
+def add_session(date, buy_in, payout, net_profit, roi, venue=None):
+    return get_store(os.path.abspath(DB_FILE)).add(date.isoformat(), buy_in, payout, net_profit, roi, venue)
+
+with profiling.rerun('tor_roi'):
+    # --- アプリケーションのUI ---
+    st.title('ポーカーROIトラッカー')
+    st.write('ポーカーセッションのROIを記録しましょう！')
+
+    # フォームの作成
+    with st.form("session_form"):
+        st.subheader("新しいセッションの追加")
+        # デフォルトで今日の日付を設定
+        date = st.date_input("日付", value=datetime.date.today())
+        buy_in = st.number_input("バイイン（円）", min_value=0)
+        payout = st.number_input("賞金（円）", min_value=0)
+        venue = st.text_input("会場（任意）")
+        submitted = st.form_submit_button("セッションを追加")
+
+        if submitted:
+            if buy_in <= 0:
+                st.error("バイインは0より大きい値を入力してください。")
+            else:
+                net_profit = payout - buy_in
+                roi = (net_profit / buy_in) * 100
+                # 1件だけ追加する (一覧は索引の順に読み直すので並べ替えは不要)
+                add_session(date, buy_in, payout, net_profit, roi, venue.strip())
+
+    # --- ファイルからの一括取り込み (既存の記録と同じ内容の行は追加しない) ---
+    with st.expander("ファイルから一括取り込み（CSV / TSV）"):
+        uploaded = st.file_uploader("他のサイトやスプレッドシートから書き出したファイル", type=['csv', 'tsv', 'txt'])
+        if uploaded is not None:
+            file_columns, _, _ = session_import.read_header(uploaded)
+            guessed = session_import.guess_mapping(file_columns)
+            options = ['（なし）', *file_columns]
+            mapping = {}
+            for target, col in zip(session_import.TARGET_COLUMNS, st.columns(len(session_import.TARGET_COLUMNS))):
+                choice = col.selectbox(f"{target}の列", options, index=options.index(guessed[target]) if guessed[target] else 0, key=f'import_column_{target}')
+                mapping[target] = None if choice == options[0] else choice
+            dayfirst = st.checkbox("日付は 日/月/年 の順")
+            if st.button("取り込む"):
+                try: result = import_sessions(uploaded, mapping, dayfirst)
+                except ValueError as e: st.error(str(e))
+                else:
+                    st.session_state.import_message = '・'.join(f"{name} {count:,}件" for name, count in result.items())
+                    st.rerun()
+    if 'import_message' in st.session_state: st.success(f"取り込みが完了しました（{st.session_state.pop('import_message')}）。")
+
+    store = get_store(os.path.abspath(DB_FILE))
+
+    # --- 計算結果の表示 ---
+    # 合計と件数は追加・変更・削除のたびに保存先で更新される集計を読むだけ (件数によらず一定の時間)
+    with profiling.section('calc:roi_totals'): totals = store.totals()
+    if totals['セッション数']:
+        st.subheader("全体の結果")
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("総バイイン", f"{totals['バイイン']:,.0f}円")
+        col2.metric("総賞金", f"{totals['賞金']:,.0f}円")
+        col3.metric("総純利益", f"{totals['純利益']:,.0f}円")
+        col4.metric("全体ROI", f"{totals['ROI']:.2f}%")
+
+        # --- 期間別・会場別の集計 ---
+        st.subheader("期間別の集計")
+        for tab, period in zip(st.tabs(["日別", "週別", "月別", "会場別"]), ('day', 'week', 'month', 'venue')):
+            with tab, profiling.section(f'calc:rollup_{period}'):
+                st.dataframe(store.rollup(period), hide_index=True, use_container_width=True,
+                             column_config={'ROI': st.column_config.NumberColumn(format='%.2f%%')})
+
+        # --- グラフの表示 ---
+        st.subheader("累積純利益とROIの推移")
+        dates = roi_chart.date_range(store.cumulative_profit())
+        if dates is not None:
+            start, end = dates
+            # 期間を狭めると、その期間の中で改めて間引くので細かい動きが見える
+            if start < end: start, end = st.slider("表示する期間", min_value=start, max_value=end, value=(start, end), format="YYYY-MM-DD")
+            rolling_days = st.select_slider("ROIの集計期間（日）", options=roi_chart.ROLLING_DAYS_OPTIONS, value=30)
+            with profiling.section('calc:roi_chart'): cumulative, rolling = cached_chart(store.path, store.version, start, end, rolling_days)
+            st.line_chart(cumulative, y='累積純利益')
+            st.line_chart(rolling)
     
-    if st.button("削除を確定"):
-        st.session_state.sessions = edited_df
-        save_data(st.session_state.sessions)
-        st.success("履歴が更新されました。")
+        # --- 履歴の表示と編集 (表示中のページだけを読み込み、変更した行だけを書き込む) ---
+        st.subheader("セッション履歴")
+        st.write("表示中のページの行を直接編集・追加・削除して、[変更を確定]ボタンで保存します。純利益とROIはバイインと賞金から計算し直します。")
+        col1, col2 = st.columns(2)
+        page_size = col1.selectbox("1ページの件数", PAGE_SIZES, index=1)
+        page_count = -(-totals['セッション数'] // page_size)
+        page = col2.number_input(f"ページ（全{page_count}ページ）", min_value=1, max_value=page_count, value=1)
+        # 保存のたびに変えるキー (確定したあとは編集中の差分を捨てて読み直す)
+        editor_key = f"history_editor_{st.session_state.get('history_saves', 0)}_{page_size}_{page}"
+        # 編集中は表示したときのページ (行の ID) をそのまま使う。確定するまでに別のプロセスが行を追加しても、
+        # 表示位置で届く変更を別の行に当てはめない。編集中でなければ毎回読み直す
+        pending = st.session_state.get(editor_key, {})
+        snapshot = st.session_state.get('history_page')
+        if snapshot is not None and snapshot[0] == editor_key and any(pending.get(name) for name in ('edited_rows', 'added_rows', 'deleted_rows')): history = snapshot[1]
+        else:
+            history = load_page((page - 1) * page_size, page_size)
+            history['日付'] = pd.to_datetime(history['日付'], errors='coerce').dt.date
+            st.session_state.history_page = (editor_key, history)
+        st.data_editor(history, key=editor_key, num_rows="dynamic", use_container_width=True, disabled=[column for column in history.columns if column not in EDITABLE_COLUMNS],
+                       column_config={'日付': st.column_config.DateColumn(format='YYYY-MM-DD'), 'ROI': st.column_config.NumberColumn(format='%.2f%%')})
+
+        if st.button("変更を確定"):
+            added, edited, deleted = editor_changes(history.index, st.session_state[editor_key])
+            try: save_changes(added, edited, deleted)
+            except ValueError as e: st.error(str(e))
+            else:
+                st.session_state.history_saves = st.session_state.get('history_saves', 0) + 1
+                st.session_state.history_message = f"履歴を更新しました（追加 {len(added)}件・変更 {len(edited)}件・削除 {len(deleted)}件）。"
+                st.rerun()
+        if 'history_message' in st.session_state: st.success(st.session_state.pop('history_message'))
+
+    else:
+        st.info("まだセッションがありません。上のフォームから最初のセッションを追加してください。")
 
-else:
-    st.info("まだセッションがありません。上のフォームから最初のセッションを追加してください。")
\ No newline at end of file
+# 計測を有効にしたときだけ表示する診断欄
+if profiling.ENABLED:
+    with st.sidebar.expander('診断'): profiling.render_diagnostics('tor_roi')
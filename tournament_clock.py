@@ -0,0 +1,82 @@
+import math
+import time
+from dataclasses import dataclass
+
+# --- トーナメントタイマーの時計計算 ---
+# 残り時間は「基準時刻」と「基準時刻における残り秒数」から毎回計算する。
+# 1秒ごとに減算しないので、描画の遅れや再実行の回数に関係なく壁時計とずれない。
+
+@dataclass(frozen=True)
+class ClockPosition:
+    level_idx: int
+    remaining_seconds: float
+    running: bool
+    finished: bool
+
+class TournamentClock:
+    def __init__(self, level_seconds, level_idx=0):
+        self.level_seconds = [max(0, int(s)) for s in level_seconds]
+        self.level_idx = min(max(0, level_idx), max(0, len(self.level_seconds) - 1))
+        self.remaining_at_anchor = float(self.level_seconds[self.level_idx]) if self.level_seconds else 0.0
+        self.anchor = None  # 動作中は基準時刻 (time.time())、停止中は None
+
+    @property
+    def last_level_idx(self): return len(self.level_seconds) - 1
+
+    def position(self, now=None):
+        if not self.level_seconds: return ClockPosition(0, 0.0, False, True)
+        level_idx, remaining = self.level_idx, self.remaining_at_anchor
+        if self.anchor is not None:
+            remaining -= (time.time() if now is None else now) - self.anchor
+            # 時間切れのレベルは超過分を次のレベルへ持ち越す (レベル移行も同じ計算から求まる)
+            while remaining <= 0 and level_idx < self.last_level_idx:
+                level_idx += 1
+                remaining += self.level_seconds[level_idx]
+            if remaining <= 0: return ClockPosition(self.last_level_idx, 0.0, False, True)
+        finished = level_idx == self.last_level_idx and remaining <= 0
+        return ClockPosition(level_idx, max(0.0, remaining), self.anchor is not None, finished)
+
+    def settle(self, now=None):
+        # 現在位置を新しい基準として保存する。各操作はこの後に状態を書き換える
+        now = time.time() if now is None else now
+        pos = self.position(now)
+        self.level_idx, self.remaining_at_anchor = pos.level_idx, pos.remaining_seconds
+        self.anchor = now if pos.running else None
+        return pos
+
+    def start(self, now=None):
+        pos = self.settle(now)
+        if not pos.finished and self.anchor is None: self.anchor = time.time() if now is None else now
+    def pause(self, now=None):
+        self.settle(now)
+        self.anchor = None
+    def toggle(self, now=None):
+        if self.position(now).running: self.pause(now)
+        else: self.start(now)
+
+    def add_seconds(self, delta, now=None):
+        pos = self.settle(now)
+        if not self.level_seconds: return
+        self.remaining_at_anchor = max(0.0, pos.remaining_seconds + delta)
+        if self.remaining_at_anchor <= 0 and self.level_idx < self.last_level_idx:
+            # 残り時間を使い切ったら次のレベルを満了時間から始める
+            self.level_idx += 1
+            self.remaining_at_anchor = float(self.level_seconds[self.level_idx])
+
+    def set_level(self, level_idx, now=None):
+        if not self.level_seconds: return
+        self.settle(now)
+        self.level_idx = min(max(0, level_idx), self.last_level_idx)
+        self.remaining_at_anchor = float(self.level_seconds[self.level_idx])
+        self.anchor = None
+    def next_level(self, now=None):
+        pos = self.position(now)
+        if pos.level_idx < self.last_level_idx: self.set_level(pos.level_idx + 1, now)
+    def prev_level(self, now=None):
+        pos = self.position(now)
+        if pos.level_idx > 0: self.set_level(pos.level_idx - 1, now)
+
+def format_remaining(seconds):
+    # 表示は切り上げ (開始直後に 15:00 と表示されるように)
+    mins, secs = divmod(math.ceil(seconds), 60)
+    return f"{mins:02d}:{secs:02d}"
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+# --- トーナメント所要時間のモンテカルロシミュレーション ---
+# 数千回分のトーナメントを numpy で同時に進める。1分ごとに、各卓で起きるハンド数と
+# 平均スタックの深さ (BB数) に応じた脱落確率から脱落人数をポアソン分布で引く。
+# スタックが浅いほどオールインが増えて脱落が早まる、という単純なモデル。
+
+HANDS_PER_HOUR = 30  # 1卓あたりのハンド数 (ライブの目安)
+SEATS_PER_TABLE = 9
+ELIMINATION_K = 1.6  # 1ハンド・1卓あたりの脱落確率 = ELIMINATION_K / 平均スタック(BB)
+MAX_ELIMINATION_PROB = 0.5
+MAX_OVERTIME_FACTOR = 3  # ストラクチャー全体の時間の何倍まで進めるか
+
+def simulate_tournament(structure_df, entries, initial_stack, runs=10000, seed=None, hands_per_hour=HANDS_PER_HOUR, seats_per_table=SEATS_PER_TABLE):
+    rng = np.random.default_rng(seed)
+    level_minutes = structure_df['レベル時間 (分)'].to_numpy(dtype=np.int64)
+    big_blinds = structure_df['BB'].to_numpy(dtype=float)
+    # 1分ごとのレベル番号 (最終レベル以降はそのまま続く)
+    minute_level = np.repeat(np.arange(len(level_minutes)), level_minutes)
+    max_minutes = max(1, int(level_minutes.sum()) * MAX_OVERTIME_FACTOR)
+    minute_level = np.concatenate([minute_level, np.full(max_minutes - len(minute_level), len(level_minutes) - 1)])
+    total_chips = entries * initial_stack
+    remaining = np.full(runs, entries, dtype=np.int64)
+    finish_minute = np.full(runs, max_minutes, dtype=np.int64)
+    final_table_level = np.full(runs, -1, dtype=np.int64)
+    level_players_sum = np.zeros(len(level_minutes))
+    level_players_count = np.zeros(len(level_minutes))
+    level_start = np.concatenate([[0], np.cumsum(level_minutes)[:-1]])
+    hands_per_minute = hands_per_hour / 60
+    for minute in range(max_minutes):
+        alive = remaining > 1
+        if not alive.any(): break
+        level = minute_level[minute]
+        if minute < len(minute_level) and level < len(level_start) and minute == level_start[level]:
+            # 平均は終わっていない回だけでとる (終わった回の1人を含めると人数が減り、スタックが深く見える)
+            level_players_sum[level] += remaining[alive].sum(); level_players_count[level] += alive.sum()
+        tables = np.ceil(remaining / seats_per_table)
+        depth = total_chips / np.maximum(remaining, 1) / big_blinds[level]
+        prob = np.minimum(MAX_ELIMINATION_PROB, ELIMINATION_K / depth)
+        busts = rng.poisson(tables * hands_per_minute * prob)
+        remaining = np.where(alive, np.maximum(1, remaining - busts), remaining)
+        finished_now = alive & (remaining <= 1)
+        finish_minute[finished_now] = minute + 1
+        reached_final = (final_table_level < 0) & (remaining <= seats_per_table)
+        final_table_level[reached_final] = level
+    average_players = np.divide(level_players_sum, level_players_count, out=np.full(len(level_minutes), np.nan), where=level_players_count > 0)
+    per_level = pd.DataFrame({
+        'レベル': structure_df['レベル'].to_numpy(),
+        '平均残り人数': average_players,
+        '平均スタック (BB)': total_chips / average_players / big_blinds,
+        '進行中の割合': level_players_count / runs,
+    })
+    return {'finish_minutes': finish_minute, 'final_table_level': final_table_level, 'unfinished': remaining > 1, 'per_level': per_level}
+
+def summarize_simulation(result, available_minutes=None):
+    finish = result['finish_minutes']
+    summary = {
+        '中央値 (分)': float(np.median(finish)),
+        '10% (分)': float(np.percentile(finish, 10)),
+        '90% (分)': float(np.percentile(finish, 90)),
+        '未終了の割合': float(result['unfinished'].mean()),
+    }
+    reached = result['final_table_level'][result['final_table_level'] >= 0]
+    if len(reached): summary['ファイナルテーブル到達レベル (中央値)'] = int(np.median(reached)) + 1
+    if available_minutes: summary['時間内に終わる確率'] = float((finish <= available_minutes).mean())
+    return summary